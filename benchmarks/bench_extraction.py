@@ -0,0 +1,95 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Per-unit infobox extraction time, compared with
+                        the original lookup of the labels
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+
+Usage (from the project root):
+    python benchmarks/bench_extraction.py
+"""
+
+import os
+import sys
+import timeit
+from pathlib import Path
+
+if __name__ == "__main__":
+    # Run as a script (python benchmarks/bench_extraction.py): `src` is imported from the project root
+    sys.path.append(os.path.abspath("."))
+
+from src.constants import WARNINGS_KEY
+from src.scrap_infobox import ITEM_TYPES, extract_item_vals, extract_unit_data
+from src.unit_data_scraper import parse_infoboxes
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+TARGET_GAME = "Age of Empires III"
+REPEAT = 200
+
+
+def load_infoboxes() -> list:
+    return [
+        infobox
+        for path in sorted(FIXTURES_PATH.glob("*.html"))
+        if path.name != "unit_list.html"
+        for infobox in parse_infoboxes(path.read_text(), TARGET_GAME)
+    ]
+
+
+def reference_item_type(label):
+    # Linear scan of the schema for each label, as the original `get_item_type` did
+    for item_type, labels in ITEM_TYPES.items():
+        if label in labels:
+            return item_type
+    return None
+
+
+def reference_extract_unit_data(infobox):
+    """Extraction as the scraper first did it: `find_all`/`find` per row and a schema scan per label."""
+    unit_data = {"name": infobox.find("h2").text.strip()}
+    for block in infobox.find_all("section"):
+        data = {}
+        for row in block.find_all("div", class_="pi-item", recursive=False):
+            h3 = row.find("h3")
+            if h3 is None:
+                continue
+            item_type = reference_item_type(h3.text)
+            if item_type == "ignore" or item_type is None:
+                continue
+            data[h3.text] = extract_item_vals(row.find("div", class_="pi-data-value"), item_type)
+        unit_data[block.find("h2").text.strip()] = data
+    return unit_data
+
+
+def time_per_unit(extract, infoboxes) -> float:
+    # Best of several rounds, so a busy machine does not skew the comparison
+    rounds = timeit.repeat(lambda: [extract(infobox) for infobox in infoboxes], number=REPEAT // 5, repeat=5)
+    return min(rounds) / (REPEAT // 5 * len(infoboxes)) * 1e6
+
+
+def main():
+    infoboxes = load_infoboxes()
+
+    # Both extractions must give the same records for the comparison to hold
+    for infobox in infoboxes:
+        record = {key: value for key, value in extract_unit_data(infobox).items() if key != WARNINGS_KEY}
+        assert record == reference_extract_unit_data(infobox), f"Different records for '{record['name']}'"
+
+    reference = time_per_unit(reference_extract_unit_data, infoboxes)
+    current = time_per_unit(extract_unit_data, infoboxes)
+    print(f"{len(infoboxes)} infoboxes, {REPEAT} repetitions")
+    print(f"Original lookup: {reference:.1f} us/unit")
+    print(f"Current:         {current:.1f} us/unit ({reference / current:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
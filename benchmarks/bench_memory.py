@@ -0,0 +1,53 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Peak memory per page of the DOM and streaming
+                        infobox extraction
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+
+Usage (from the project root):
+    python benchmarks/bench_memory.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+if __name__ == "__main__":
+    # Run as a script (python benchmarks/bench_memory.py): `src` is imported from the project root
+    sys.path.append(os.path.abspath("."))
+
+from src.stream_infobox import measure_peak_memory
+from src.unit_data_scraper import extract_page_units
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+TARGET_GAME = "Age of Empires III"
+
+
+def main():
+    print(f"{'page':<20}{'size KiB':>10}{'DOM KiB':>10}{'stream KiB':>12}{'same output':>14}")
+    for path in sorted(FIXTURES_PATH.glob("*.html")):
+        if path.name == "unit_list.html":
+            continue
+        page_html = path.read_text()
+        dom_units, dom_peak = measure_peak_memory(extract_page_units, path.name, page_html, TARGET_GAME)
+        stream_units, stream_peak = measure_peak_memory(
+            extract_page_units, path.name, page_html, TARGET_GAME, streaming=True
+        )
+        print(
+            f"{path.name:<20}{len(page_html) / 1024:>10.1f}{dom_peak / 1024:>10.1f}"
+            f"{stream_peak / 1024:>12.1f}{str(dom_units == stream_units):>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
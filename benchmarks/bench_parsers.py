@@ -0,0 +1,75 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Per-page parse time of every parser backend
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+
+Usage (from the project root):
+    python benchmarks/bench_parsers.py
+"""
+
+import os
+import sys
+import timeit
+from pathlib import Path
+
+if __name__ == "__main__":
+    # Run as a script (python benchmarks/bench_parsers.py): `src` is imported from the project root
+    sys.path.append(os.path.abspath("."))
+
+from src.parsers import PARSER_BACKENDS, set_parser_backend
+from src.scrap_infobox import extract_unit_data
+from src.unit_data_scraper import parse_infoboxes
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+TARGET_GAME = "Age of Empires III"
+REPEAT = 20
+
+
+def load_unit_pages() -> dict:
+    return {
+        path.name: path.read_text()
+        for path in sorted(FIXTURES_PATH.glob("*.html"))
+        if path.name != "unit_list.html"
+    }
+
+
+def extract_pages(pages):
+    return [
+        [extract_unit_data(infobox) for infobox in parse_infoboxes(page_html, TARGET_GAME)]
+        for page_html in pages.values()
+    ]
+
+
+def main():
+    pages = load_unit_pages()
+
+    set_parser_backend("html.parser")
+    reference = extract_pages(pages)
+
+    print(f"{len(pages)} unit pages, {REPEAT} repetitions")
+    print(f"{'backend':<14}{'restricted':<12}{'ms/page':>10}{'same output':>14}")
+    for backend in PARSER_BACKENDS:
+        for restricted in (False, True):
+            try:
+                set_parser_backend(backend, restricted)
+            except ValueError as e:
+                print(f"{backend:<14}{str(restricted):<12}  skipped: {e}")
+                continue
+            same_output = extract_pages(pages) == reference
+            elapsed = timeit.timeit(lambda: extract_pages(pages), number=REPEAT)
+            ms_per_page = elapsed / (REPEAT * len(pages)) * 1000
+            print(f"{backend:<14}{str(restricted):<12}{ms_per_page:>10.2f}{str(same_output):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Requests per second of the read API with keep-alive
+                        clients, for full, conditional and gzip responses
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+
+The units of the fixtures are repeated into a roster of `ROSTER_SIZE` units,
+served by a server process while the clients run in this one.
+
+Usage (from the project root):
+    python benchmarks/bench_read_api.py
+"""
+
+import http.client
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+if __name__ == "__main__":
+    # Run as a script (python benchmarks/bench_read_api.py): `src` is imported from the project root
+    sys.path.append(os.path.abspath("."))
+
+from src.read_api import UnitsApiServer
+from src.unit_data_scraper import extract_page_units
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+TARGET_GAME = "Age of Empires III"
+
+ROSTER_SIZE = 600
+CLIENTS = 4
+DURATION = 3.0
+
+
+def build_roster(filename):
+    units = []
+    for path in sorted(FIXTURES_PATH.glob("*.html")):
+        if path.name != "unit_list.html":
+            units.extend(extract_page_units(path.name, path.read_text(), TARGET_GAME))
+    roster = [{**unit, "name": f"{unit['name']} {index}"} for index in range(ROSTER_SIZE // len(units)) for unit in units]
+    with open(filename, "w") as file:
+        json.dump(roster, file)
+    return roster
+
+
+def run_server(units_file, port_queue):
+    server = UnitsApiServer(("127.0.0.1", 0), units_file, reload_interval=None)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def measure(port, path, headers) -> tuple:
+    """Requests per second of `CLIENTS` keep-alive connections during `DURATION` seconds."""
+    counts = [0] * CLIENTS
+    statuses = set()
+    deadline = time.perf_counter() + DURATION
+
+    def client(index):
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        while time.perf_counter() < deadline:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            statuses.add(response.status)
+            counts[index] += 1
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(CLIENTS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / DURATION, statuses
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        units_file = os.path.join(tmp_dir, "units.json")
+        roster = build_roster(units_file)
+
+        context = multiprocessing.get_context("spawn")
+        port_queue = context.Queue()
+        server = context.Process(target=run_server, args=(units_file, port_queue), daemon=True)
+        server.start()
+        port = port_queue.get()
+
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port)
+            connection.request("GET", "/units")
+            response = connection.getresponse()
+            response.read()
+            etag = response.getheader("ETag")
+            connection.close()
+
+            unit_path = "/units/" + roster[0]["name"].replace(" ", "_")
+            cases = [
+                ("unit", unit_path, {}),
+                ("listing", "/units", {}),
+                ("listing gzip", "/units", {"Accept-Encoding": "gzip"}),
+                ("listing 304", "/units", {"If-None-Match": etag}),
+                ("filtered", "/units?age=II&limit=20", {}),
+            ]
+            print(f"{len(roster)} units, {CLIENTS} keep-alive clients, {DURATION:.0f}s per case")
+            print(f"{'case':<16}{'req/s':>10}  status")
+            for name, path, headers in cases:
+                rate, statuses = measure(port, path, headers)
+                print(f"{name:<16}{rate:>10.0f}  {sorted(statuses)}")
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Offline benchmark suite of the scraper hot paths
+                        with a regression check against a baseline
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+
+The saved pages of `benchmarks/fixtures` are loaded into an offline response
+cache, so every benchmark goes through the real fetch layer without network.
+
+Usage (from the project root):
+    python benchmarks/bench_suite.py                  # compare with the baseline
+    python benchmarks/bench_suite.py --save-baseline  # record a new baseline
+
+Timings depend on the machine, so each run of a benchmark follows a run of a
+fixed calibration loop and the benchmarks are compared with the baseline
+relative to it: a baseline recorded on another machine, or a run on a busy
+machine, still compares the code and not the hardware.
+
+The exit status is 1 when a benchmark is slower than the baseline by more
+than the threshold, or allocates more than the allocation threshold.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+
+if __name__ == "__main__":
+    # Run as a script (python benchmarks/bench_suite.py): `src` is imported from the project root
+    sys.path.append(os.path.abspath("."))
+
+from src.http_cache import ResponseCache
+from src.mediawiki_api import title_from_url
+from src.parsers import make_soup, set_parser_backend
+from src.scrap_infobox import extract_item_vals, extract_unit_data, get_item_type
+from src.unit_data_scraper import UNITS_LIST_PAGE, get_infoboxes, get_units_urls, scrape_units_data
+from src.utils import get_section_hrefs, set_rate_limiter, set_response_cache
+
+BENCHMARKS_PATH = Path(__file__).parent
+FIXTURES_PATH = BENCHMARKS_PATH / "fixtures"
+BASELINE_FILE = BENCHMARKS_PATH / "baseline.json"
+
+URL = "https://ageofempires.fandom.com/"
+TARGET_GAME = "Age of Empires III"
+
+# Allowed slowdown against the baseline before failing (0.25 = 25 %)
+DEFAULT_THRESHOLD = 0.25
+# Allowed growth of the memory allocated by a call (0.10 = 10 %)
+DEFAULT_ALLOC_THRESHOLD = 0.10
+REPEAT = 15
+
+# Calls of the calibration loop per timing run
+CALIBRATION_NUMBER = 20
+
+
+def build_offline_cache(cache_dir) -> ResponseCache:
+    """Stores the fixtures in a response cache under the URLs the scraper requests."""
+    cache = ResponseCache(cache_dir)
+    cache.store(URL + "wiki/" + UNITS_LIST_PAGE, (FIXTURES_PATH / "unit_list.html").read_text())
+
+    cache.offline = True
+    set_response_cache(cache)
+    for unit_url in get_units_urls(URL):
+        fixture = FIXTURES_PATH / f"{title_from_url(unit_url).lower()}.html"
+        cache.store(unit_url, fixture.read_text())
+    return cache
+
+
+def calibration_loop():
+    """Fixed pure-Python workload (strings, dicts and sorting, as in the extraction) timing the machine."""
+    data = {}
+    for i in range(2000):
+        key = f"label {i % 50}"
+        data[key] = data.get(key, "") + str(i).strip().replace("1", "x")
+    return sorted(data.items())
+
+
+def bench_time(func, number) -> tuple:
+    """
+    Times `REPEAT` runs of the function, each one right after a run of the
+    calibration loop.
+
+    Returns:
+    ---
+    tuple:
+        Best time in milliseconds per call, and median time relative to the
+        calibration loop of the same run. The ratio cancels the speed of the
+        machine, and the median the runs slowed down by other processes
+    """
+    times = []
+    ratios = []
+    for _ in range(REPEAT):
+        calibration_time = timeit.timeit(calibration_loop, number=CALIBRATION_NUMBER) / CALIBRATION_NUMBER
+        times.append(timeit.timeit(func, number=number) / number)
+        ratios.append(times[-1] / calibration_time)
+    return min(times) * 1000, statistics.median(ratios)
+
+
+def bench_alloc(func) -> float:
+    """Peak memory allocated by one call, in KiB."""
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def get_cases() -> dict:
+    """Returns name -> (function doing the work of one page/item, calls per timing run)."""
+    units_urls = list(dict.fromkeys(get_units_urls(URL)))
+
+    content = make_soup((FIXTURES_PATH / "unit_list.html").read_text()).find("div", class_="mw-parser-output")
+    sections = [h2.find("span", class_="mw-headline", recursive=False).text for h2 in content.find_all("h2", recursive=False)]
+
+    infoboxes = [infobox for unit_url in units_urls for infobox in get_infoboxes(unit_url, TARGET_GAME)]
+    items = []
+    for infobox in infoboxes:
+        for row in infobox.find_all("div", class_="pi-data"):
+            item_type = get_item_type(row.find("h3").text)
+            if item_type not in (None, "ignore"):
+                items.append((row.find("div", class_="pi-data-value"), item_type))
+
+    def each(func, values):
+        iterator = {"index": 0}
+
+        def run():
+            value = values[iterator["index"] % len(values)]
+            iterator["index"] += 1
+            return func(value)
+        return run
+
+    return {
+        "get_units_urls": (lambda: get_units_urls(URL), 20),
+        "get_section_hrefs": (each(lambda section: get_section_hrefs(section, content), sections), 200),
+        "get_infoboxes": (each(lambda unit_url: get_infoboxes(unit_url, TARGET_GAME), units_urls), 20),
+        "extract_unit_data": (each(extract_unit_data, infoboxes), 200),
+        "extract_item_vals": (each(lambda item: extract_item_vals(*item), items), 2000),
+    }
+
+
+def bench_end_to_end(cache_dir) -> float:
+    """Units per second of a full offline scrape."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = os.path.join(tmp_dir, "units.json")
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            start_time = time.perf_counter()
+            scrape_units_data(URL, output_file, cache_dir=cache_dir, offline=True)
+            elapsed = time.perf_counter() - start_time
+        with open(output_file) as file:
+            units = len(json.load(file))
+    return units / elapsed
+
+
+def run_benchmarks() -> dict:
+    set_parser_backend("html.parser")
+    set_rate_limiter(None)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        build_offline_cache(cache_dir)
+
+        results = {}
+        for name, (func, number) in get_cases().items():
+            ms, relative = bench_time(func, number)
+            results[name] = {"ms": ms, "relative": relative, "alloc_kib": bench_alloc(func)}
+
+        rates = []
+        ratios = []
+        for _ in range(REPEAT):
+            calibration_time = timeit.timeit(calibration_loop, number=CALIBRATION_NUMBER) / CALIBRATION_NUMBER
+            rates.append(bench_end_to_end(cache_dir))
+            ratios.append(1 / (rates[-1] * calibration_time))
+        results["end_to_end"] = {"units_per_s": max(rates), "relative": statistics.median(ratios)}
+
+    set_response_cache(None)
+    return results
+
+
+def slowdown(metrics, reference) -> float:
+    """Time of a benchmark relative to the calibration loop against the baseline (1.10 = 10 % slower)."""
+    return metrics["relative"] / reference["relative"]
+
+
+def find_regressions(results, baseline, threshold, alloc_threshold=DEFAULT_ALLOC_THRESHOLD) -> list:
+    """
+    Returns a message for each benchmark slower than the baseline beyond the
+    threshold, or allocating more than the baseline beyond the allocation
+    threshold. The timings are compared relative to the calibration loop.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        ratio = slowdown(metrics, reference)
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {(ratio - 1) * 100:.0f} % slower than the baseline")
+        if "alloc_kib" in metrics and metrics["alloc_kib"] > reference["alloc_kib"] * (1 + alloc_threshold):
+            regressions.append(f"{name}: {metrics['alloc_kib']:.1f} KiB allocated vs {reference['alloc_kib']:.1f} KiB")
+    return regressions
+
+
+def print_results(results, baseline):
+    print(f"{'benchmark':<20}{'ms/call':>10}{'alloc KiB':>12}{'vs baseline':>14}")
+    for name, metrics in results.items():
+        reference = baseline.get(name)
+        change = f"{(slowdown(metrics, reference) - 1) * 100:+.1f} %" if reference is not None else "-"
+        if "ms" in metrics:
+            print(f"{name:<20}{metrics['ms']:>10.3f}{metrics['alloc_kib']:>12.1f}{change:>14}")
+        else:
+            print(f"{name:<20}{metrics['units_per_s']:>10.1f} units/s{change:>16}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite of the scraper")
+    parser.add_argument("--save-baseline", action="store_true", help="Record the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown (0.25 = 25 %%)")
+    parser.add_argument(
+        "--alloc-threshold", type=float, default=DEFAULT_ALLOC_THRESHOLD, help="Allowed allocation growth (0.10 = 10 %%)"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks()
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    if any("relative" not in reference for reference in baseline.values()):
+        print("The baseline was recorded without calibration, record it again with --save-baseline")
+        baseline = {}
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        BASELINE_FILE.write_text(json.dumps(results, indent=4) + "\n")
+        print(f"Baseline saved in {BASELINE_FILE}")
+        return
+
+    regressions = find_regressions(results, baseline, args.threshold, args.alloc_threshold)
+    if regressions:
+        print("Performance regressions:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
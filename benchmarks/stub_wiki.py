@@ -0,0 +1,293 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Local stand-in of the wiki serving the saved
+                        fixtures, with injected throttling and latency
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+
+Usage (from the project root):
+    python benchmarks/stub_wiki.py --port 8765 --throttle-rate 0.2 --latency 0.05
+
+Then scrape it with `scrape_units_data("http://127.0.0.1:8765/", ...)`.
+
+Edits made with `edit_page` change the served page, bump its revision and
+appear in the `list=recentchanges` feed of /api.php.
+
+The pages of `REDIRECTS` are redirects: /wiki/<page> renders the target, as
+the wiki does, and the API resolves them only with `redirects=1`.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+UNIT_LIST_PAGE = "Unit_(Age_of_Empires_III)"
+# Redirect page -> target page
+REDIRECTS = {"Musketeers": "Musketeer"}
+# Revision of the redirect pages themselves
+REDIRECT_REVISION = 1
+IMAGES_URL = "https://static.wikia.nocookie.net/ageofempires/images/"
+REVISION_PATTERN = re.compile(r'"wgCurRevisionId"\s*:\s*(\d+)')
+PARSER_OUTPUT_START = '<div class="mw-parser-output">'
+PARSER_OUTPUT_END = "</div></div></div></main>"
+
+
+class StubWikiHandler(BaseHTTPRequestHandler):
+    """
+    Serves /wiki/<page> from the fixtures, /images/<name> with fake icon bytes
+    and the `query` (revisions and recent changes) and `parse` actions of
+    /api.php.
+    """
+
+    # Set by `start_stub_server`
+    throttle_rate = 0.0
+    # Statuses answered to the first requests, in order (shared list, consumed under the stats lock)
+    fail_first = None
+    retry_after = 1
+    latency = 0.0
+    stats = None
+    # Page -> HTML of the pages edited with `edit_page`, and the feed of the edits
+    edited_pages = None
+    recent_changes = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with self.stats["lock"]:
+            self.stats["requests"] += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self.stats["lock"]:
+            status = self.fail_first.pop(0) if self.fail_first else None
+        if status is None and random.random() < self.throttle_rate:
+            status = 429
+        if status is not None:
+            with self.stats["lock"]:
+                self.stats["throttled"] += 1
+            self._send(status, b"Try again later", "text/plain", {"Retry-After": str(self.retry_after)})
+            return
+
+        parsed_url = urlparse(self.path)
+        path = unquote(parsed_url.path)
+        if path == "/api.php":
+            self._send_api(parse_qs(parsed_url.query))
+        elif path.startswith("/wiki/"):
+            self._send_page(path[len("/wiki/"):])
+        elif path.startswith("/images/"):
+            self._send(200, hashlib.sha256(path.encode()).digest() * 64, "image/png")
+        else:
+            self._send(404, b"Not Found", "text/plain")
+
+    def _read_page(self, page):
+        """Returns the HTML of a page of the fixtures, or None if it does not exist."""
+        page = page.replace(" ", "_")
+        page = REDIRECTS.get(page, page)
+        if page in self.edited_pages:
+            page_html = self.edited_pages[page]
+            return page_html.replace(IMAGES_URL, f"http://{self.headers.get('Host')}/images/")
+        filename = "unit_list.html" if page == UNIT_LIST_PAGE else f"{page.lower()}.html"
+        fixture = FIXTURES_PATH / filename
+        if not fixture.exists():
+            return None
+        host = self.headers.get("Host")
+        return fixture.read_text().replace(IMAGES_URL, f"http://{host}/images/")
+
+    def _send_api(self, params):
+        action = params.get("action", [""])[0]
+        follow_redirects = params.get("redirects", [""])[0] == "1"
+        if action == "query" and params.get("list", [""])[0] == "recentchanges":
+            data = self._recent_changes(params)
+        elif action == "query":
+            pages = []
+            redirects = []
+            for title in params.get("titles", [""])[0].split("|")[:50]:
+                if title.replace(" ", "_") in REDIRECTS:
+                    if not follow_redirects:
+                        pages.append({"title": title, "redirect": True, "revisions": [{"revid": REDIRECT_REVISION}]})
+                        continue
+                    target = REDIRECTS[title.replace(" ", "_")].replace("_", " ")
+                    redirects.append({"from": title, "to": target})
+                    title = target
+                page_html = self._read_page(title)
+                if page_html is None:
+                    pages.append({"title": title, "missing": True})
+                    continue
+                revision = REVISION_PATTERN.search(page_html)
+                pages.append({"title": title, "revisions": [{"revid": int(revision.group(1))}]})
+            data = {"query": {"redirects": redirects, "pages": pages}}
+        elif action == "parse":
+            title = params.get("page", [""])[0]
+            page_html = self._read_page(title)
+            if title.replace(" ", "_") in REDIRECTS and not follow_redirects:
+                target = REDIRECTS[title.replace(" ", "_")]
+                text = f'<div class="mw-parser-output"><div class="redirectMsg"><a href="/wiki/{target}">{target}</a></div></div>'
+                data = {"parse": {"title": title, "revid": REDIRECT_REVISION, "text": text}}
+            elif page_html is None:
+                data = {"error": {"code": "missingtitle", "info": "The page you specified doesn't exist."}}
+            else:
+                start = page_html.index(PARSER_OUTPUT_START)
+                end = page_html.index(PARSER_OUTPUT_END)
+                revision = REVISION_PATTERN.search(page_html)
+                data = {"parse": {"title": title, "revid": int(revision.group(1)), "text": page_html[start:end] + "</div>"}}
+        else:
+            data = {"error": {"code": "badvalue", "info": f"Unrecognized action: {action}"}}
+        self._send(200, json.dumps(data).encode("utf-8"), "application/json")
+
+    def _recent_changes(self, params):
+        """Edits from `rcstart` (oldest first, as with rcdir=newer), paginated with `rccontinue`."""
+        start = params.get("rcstart", [""])[0]
+        limit = int(params.get("rclimit", ["50"])[0])
+        offset = int(params.get("rccontinue", ["0"])[0])
+        with self.stats["lock"]:
+            changes = [change for change in self.recent_changes if change["timestamp"] >= start]
+        data = {"query": {"recentchanges": changes[offset:offset + limit]}}
+        if offset + limit < len(changes):
+            data["continue"] = {"rccontinue": str(offset + limit), "continue": "-||"}
+        return data
+
+    def _send_page(self, page):
+        page_html = self._read_page(page)
+        if page_html is None:
+            self._send(404, b"Not Found", "text/plain")
+            return
+
+        body = page_html.encode("utf-8")
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", "text/html", {"ETag": etag})
+            return
+        self._send(200, body, "text/html; charset=utf-8", {"ETag": etag})
+
+    def _send(self, status, body, content_type, headers=None):
+        with self.stats["lock"]:
+            self.stats["bytes"] += len(body)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_stub_server(port=0, throttle_rate=0.0, retry_after=1, latency=0.0, fail_first=()):
+    """
+    Start the stub wiki in a background thread
+
+    Parameters:
+    ---
+    port (int):
+        Port to listen on, 0 picks a free one
+    throttle_rate (float):
+        Fraction of the requests answered with 429 and `Retry-After`
+    retry_after (int):
+        Seconds sent in the `Retry-After` header
+    latency (float):
+        Seconds added to every response
+    fail_first (list):
+        Statuses (e.g. [429, 503]) answered with `Retry-After` to the first
+        requests, in order, before serving normally
+
+    Returns:
+    ---
+    tuple:
+        (server, base URL, stats) where stats counts the requests received,
+        the throttled ones and the bytes sent. Stop it with `server.shutdown()`
+    """
+    stats = {"requests": 0, "throttled": 0, "bytes": 0, "lock": threading.Lock()}
+    handler = type(
+        "ConfiguredStubWikiHandler",
+        (StubWikiHandler,),
+        {
+            "throttle_rate": throttle_rate,
+            "retry_after": retry_after,
+            "latency": latency,
+            "fail_first": list(fail_first),
+            "stats": stats,
+            "edited_pages": {},
+            "recent_changes": [],
+        },
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_port}/", stats
+
+
+def edit_page(server, page, old, new, comment="", user="StubEditor"):
+    """
+    Edit a page of a running stub wiki
+
+    The first occurrence of `old` in the page is replaced by `new`, the
+    revision id of the page is increased and the edit is added to the
+    recent changes feed.
+
+    Returns:
+    ---
+    dict:
+        The recent change entry of the edit
+    """
+    handler = server.RequestHandlerClass
+    page = page.replace(" ", "_")
+    with handler.stats["lock"]:
+        page_html = handler.edited_pages.get(page)
+        if page_html is None:
+            filename = "unit_list.html" if page == UNIT_LIST_PAGE else f"{page.lower()}.html"
+            fixture = FIXTURES_PATH / filename
+            # Pages without a fixture (e.g. articles that are not units) start empty
+            page_html = fixture.read_text() if fixture.exists() else '"wgCurRevisionId":1'
+        revision = int(REVISION_PATTERN.search(page_html).group(1)) + 1000
+        page_html = page_html.replace(old, new, 1)
+        page_html = REVISION_PATTERN.sub(f'"wgCurRevisionId":{revision}', page_html, count=1)
+        handler.edited_pages[page] = page_html
+
+        change = {
+            "type": "edit",
+            "ns": 0,
+            "title": page.replace("_", " "),
+            "rcid": len(handler.recent_changes) + 1,
+            "revid": revision,
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "user": user,
+            "comment": comment,
+        }
+        handler.recent_changes.append(change)
+    return change
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in of the wiki")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, base_url, _ = start_stub_server(args.port, args.throttle_rate, args.retry_after, args.latency)
+    print(f"Stub wiki serving {FIXTURES_PATH} on {base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
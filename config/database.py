@@ -1,21 +1,45 @@
 # -*- coding: utf-8 -*-
 
-from config.settings import settings
 from sqlalchemy import create_engine, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker
 
 # Create a base class for declarative models
 Base = declarative_base()
 
-# Get the database URL from the configuration settings
-url = settings.DATABASE_URL
+# Session maker, bound to the engine when it is created. It is exposed as
+# `Session` by `__getattr__`, so the engine is created before it is used
+_Session = sessionmaker(autocommit=False, autoflush=False)
 
-# Create a SQLAlchemy engine
-engine = create_engine(url)
+# SQLAlchemy engine, created on first use so that importing this module does
+# not read the settings or connect to anything
+_engine = None
 
-# Create a session maker
-Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+def get_engine():
+    """
+    Get the SQLAlchemy engine of the configured database, creating it on first use.
+
+    Returns:
+        Engine: Engine of `settings.DATABASE_URL`.
+    """
+    global _engine
+    if _engine is None:
+        from config.settings import settings
+
+        _engine = create_engine(settings.DATABASE_URL)
+        _Session.configure(bind=_engine)
+    return _engine
+
+
+def __getattr__(name):
+    # `from config.database import engine` and `from config.database import Session`
+    # keep working, the engine is created then
+    if name == "engine":
+        return get_engine()
+    if name == "Session":
+        get_engine()
+        return _Session
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_db():
@@ -25,7 +49,7 @@ def init_db():
     Returns:
         None
     """
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
     reset_all_sequences()
 
 
@@ -39,7 +63,8 @@ def get_db():
     Finally:
         Closes the database session.
     """
-    db = Session()
+    get_engine()
+    db = _Session()
     try:
         yield db
     finally:
@@ -56,14 +81,14 @@ def reset_sequence(tabla_name):
     Returns:
         None
     """
-    with engine.connect() as connection:
+    with get_engine().connect() as connection:
         result = connection.execute(text(f"SELECT max(id) FROM {tabla_name}"))
         max_id = result.fetchone()[0] or 1
         connection.execute(text(f"SELECT setval('{tabla_name}_id_seq', {max_id})"))
 
 
 def reset_all_sequences():
-    with engine.connect() as connection:
+    with get_engine().connect() as connection:
         tables = connection.execute(text("SELECT tablename FROM pg_tables WHERE schemaname = 'public'"))
         for table in tables:
             if table[0] != 'alembic_version':
@@ -21,14 +21,14 @@ class Settings(BaseSettings):
     PROJECT_VERSION: str = "1.0"
     PROJECT_EMAIL: str = "jonathan.diazm5@gmail.com"
 
-    SHOW_ADMIN_ROUTES: bool = True
+    SHOW_ADMIN_ROUTES: bool = False
 
-    # PostgreSQL database configuration
-    POSTGRES_DB: str = os.getenv("POSTGRES_DB")
-    POSTGRES_USER: str = os.getenv("POSTGRES_USER")
+    # PostgreSQL database configuration (optional for the services that do not use it)
+    POSTGRES_DB: Union[str, None] = os.getenv("POSTGRES_DB")
+    POSTGRES_USER: Union[str, None] = os.getenv("POSTGRES_USER")
     POSTGRES_PASSWORD: Union[str, None] = os.getenv("POSTGRES_PASSWORD")
-    POSTGRES_SERVER: str = os.getenv("POSTGRES_SERVER")
-    POSTGRES_PORT: str = os.getenv("POSTGRES_PORT")
+    POSTGRES_SERVER: Union[str, None] = os.getenv("POSTGRES_SERVER")
+    POSTGRES_PORT: Union[str, None] = os.getenv("POSTGRES_PORT")
 
     POSTGRES_SOCKET_PATH: str = "/var/run/postgresql"
 
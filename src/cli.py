@@ -0,0 +1,161 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Command line entry point of the scraper, each
+                        subcommand imports only the modules it uses
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+
+Usage (installed with `poetry install`, or `python -m src.cli` from the project root):
+    aoe3de scrape --workers 8 --cache-dir data/cache
+    aoe3de extract-from-cache --cache-dir data/cache
+    aoe3de export --output-dir data/parquet
+    aoe3de load-db --database-url sqlite:///data/units.db
+    aoe3de serve --port 8000
+"""
+
+import argparse
+
+# Only the standard library is imported here: bs4, requests, pandas and
+# SQLAlchemy are imported by the subcommand that needs them, so `--help` and
+# the light subcommands start fast (check it with `python -X importtime`)
+
+DEFAULT_URL = "https://ageofempires.fandom.com/"
+DEFAULT_OUTPUT_FILE = "data/units.json"
+DEFAULT_CACHE_DIR = "data/cache"
+DEFAULT_PARQUET_DIR = "data/parquet"
+
+
+def _scrape_options(args) -> dict:
+    """Options of `scrape_units_data` shared by `scrape` and `extract-from-cache`."""
+    return {
+        "workers": args.workers,
+        "manifest_file": args.manifest,
+        "parse_processes": args.parse_processes,
+        "parser_backend": args.parser,
+        "fetch_backend": args.fetch_backend,
+        "metrics_file": args.metrics_file,
+        "parquet_dir": args.parquet_dir,
+        "measure_memory": args.measure_memory,
+    }
+
+
+def scrape(args):
+    from src.unit_data_scraper import scrape_units_data
+
+    scrape_units_data(
+        args.url,
+        args.output,
+        cache_dir=args.cache_dir,
+        stream_file=args.stream_file,
+        resume=args.resume,
+        icons_dir=args.icons_dir,
+        rate_limit=args.rate_limit,
+        frontier_file=args.frontier,
+        refresh_frontier=args.refresh_frontier,
+        memory_budget=args.memory_budget,
+        **_scrape_options(args),
+    )
+
+
+def extract_from_cache(args):
+    from src.unit_data_scraper import scrape_units_data
+
+    # Offline: every page comes from the response cache, nothing is requested
+    scrape_units_data(args.url, args.output, cache_dir=args.cache_dir, offline=True, **_scrape_options(args))
+
+
+def export(args):
+    from src.columnar_export import export_units_file
+
+    export_units_file(args.input, args.output_dir, args.compression)
+
+
+def load_db(args):
+    from src.db_loader import get_engine, load_units_file
+
+    load_units_file(args.input, get_engine(args.database_url), args.batch_size)
+
+
+def serve(args):
+    from src.read_api import serve_units
+
+    serve_units(args.input, args.host, args.port, args.reload_interval, args.access_log)
+
+
+def _add_scrape_arguments(parser):
+    parser.add_argument("--url", default=DEFAULT_URL, help="Base URL of the wiki")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_FILE, help="JSON file of the units")
+    parser.add_argument("--workers", type=int, default=1, help="Concurrent page downloads")
+    parser.add_argument("--parse-processes", type=int, default=0, help="Processes parsing the pages, 0 to parse in the main process")
+    parser.add_argument("--parser", default="html.parser", help="BeautifulSoup tree builder ('html.parser' or 'lxml')")
+    parser.add_argument("--fetch-backend", choices=["html", "api"], default="html")
+    parser.add_argument("--manifest", help="Manifest of the incremental mode")
+    parser.add_argument("--metrics-file", help="JSON file of the metrics of the run")
+    parser.add_argument("--parquet-dir", help="Also export the units to Parquet in this directory")
+    parser.add_argument("--measure-memory", action="store_true", help="Report the peak memory of the extraction of each page")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoe3de", description="Scraper of the units of the Age of Empires III wiki")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scrape_parser = subparsers.add_parser("scrape", help="Scrape the units of the wiki")
+    _add_scrape_arguments(scrape_parser)
+    scrape_parser.add_argument("--cache-dir", help="Response cache of the pages")
+    scrape_parser.add_argument("--stream-file", help="NDJSON file where the units are appended while scraping")
+    scrape_parser.add_argument("--resume", action="store_true", help="Continue the scrape of the stream file")
+    scrape_parser.add_argument("--icons-dir", help="Download the unit icons to this directory")
+    scrape_parser.add_argument("--rate-limit", type=float, help="Initial requests per second")
+    scrape_parser.add_argument(
+        "--frontier", help="SQLite file of the persistent crawl frontier, its done pages are not scraped again"
+    )
+    scrape_parser.add_argument(
+        "--refresh-frontier", action="store_true", help="Scrape the done pages of the frontier again (e.g. after wiki edits)"
+    )
+    scrape_parser.add_argument("--memory-budget", type=int, help="Maximum bytes of the pages downloaded ahead")
+    scrape_parser.set_defaults(handler=scrape)
+
+    cache_parser = subparsers.add_parser("extract-from-cache", help="Extract the units from the cached pages only")
+    _add_scrape_arguments(cache_parser)
+    cache_parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Response cache of the pages")
+    cache_parser.set_defaults(handler=extract_from_cache)
+
+    export_parser = subparsers.add_parser("export", help="Export the units to Parquet")
+    export_parser.add_argument("--input", default=DEFAULT_OUTPUT_FILE, help="JSON file of the units")
+    export_parser.add_argument("--output-dir", default=DEFAULT_PARQUET_DIR)
+    export_parser.add_argument("--compression", default="zstd")
+    export_parser.set_defaults(handler=export)
+
+    load_parser = subparsers.add_parser("load-db", help="Load the units into the database")
+    load_parser.add_argument("--input", default=DEFAULT_OUTPUT_FILE, help="JSON file of the units")
+    load_parser.add_argument("--database-url", help="Database URL, the one of the settings by default")
+    load_parser.add_argument("--batch-size", type=int, default=1000, help="Rows per executemany batch when COPY is not available")
+    load_parser.set_defaults(handler=load_db)
+
+    serve_parser = subparsers.add_parser("serve", help="Serve the units with the local read API")
+    serve_parser.add_argument("--input", default=DEFAULT_OUTPUT_FILE, help="JSON file of the units, reloaded when it changes")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--reload-interval", type=float, default=5.0, help="Seconds between two checks of the units file")
+    serve_parser.add_argument("--access-log", action="store_true", help="Print a line per request")
+    serve_parser.set_defaults(handler=serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Columnar export of the extracted units: nested
+                        stats flattened into typed Parquet tables
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Main table of the export, the list fields go to child tables named after their column
+UNITS_TABLE = "units"
+DEFAULT_COMPRESSION = "zstd"
+
+# Separator of the nested keys while flattening, replaced in the final column names
+_KEY_SEPARATOR = "\x1f"
+
+
+def column_name(key) -> str:
+    """
+    Column name of a flattened key
+
+    e.g. 'Training<sep>Cost<sep>Food' -> 'training_cost_food',
+    'Information<sep>Civilization(s)' -> 'information_civilizations'
+    """
+    key = key.replace("(s)", "s")
+    return re.sub(r"[^0-9a-z]+", "_", key.lower()).strip("_")
+
+
+def unique_column_names(keys) -> list:
+    """
+    Column names of the flattened keys, without duplicates
+
+    Different keys can give the same name (e.g. 'Hit points' and 'Hit-points',
+    or a key named 'unit_id'). The later ones get a numeric suffix
+    ('hit_points_2'), in the order of the keys, so the names stay the same
+    from one export to the next for the same keys.
+    """
+    names = []
+    used = {"unit_id"}
+    for key in keys:
+        name = column_name(key)
+        candidate = name
+        suffix = 2
+        while candidate in used:
+            candidate = f"{name}_{suffix}"
+            suffix += 1
+        used.add(candidate)
+        names.append(candidate)
+    return names
+
+
+def to_typed(series: pd.Series) -> pd.Series:
+    """
+    Converts a column of strings to numbers when every value is numeric
+
+    The other columns are kept as strings (pandas `string` dtype), so the
+    Parquet schema does not depend on Python objects.
+    """
+    numbers = pd.to_numeric(series, errors="coerce")
+    if series.notna().any() and numbers.notna().sum() == series.notna().sum():
+        if (numbers.dropna() % 1 == 0).all():
+            return numbers.astype("Int64")
+        return numbers.astype("Float64")
+    return series.astype("string")
+
+
+def flatten_units(units) -> dict:
+    """
+    Flatten the extracted units into tables
+
+    The nested dicts (e.g. 'Cost', 'Damage', 'Resistance', 'Train time')
+    become one column per key of the units table, in a single
+    `json_normalize` pass over the whole roster. Every list field (e.g.
+    'Civilization(s)', 'Type') is exploded into a child table with the
+    columns `unit_id`, `position` and `value`.
+
+    Parameters:
+    ---
+    units (list):
+        Unit dicts as returned by `extract_unit_data`
+
+    Returns:
+    ---
+    dict:
+        Table name -> DataFrame, the units table first
+    """
+    frame = pd.json_normalize(units, sep=_KEY_SEPARATOR)
+    frame.columns = unique_column_names(frame.columns)
+    frame.insert(0, "unit_id", pd.RangeIndex(1, len(frame) + 1))
+
+    # Columns holding lists (every non missing value of a list column is a list)
+    list_columns = [
+        column for column in frame.columns[1:]
+        if frame[column].dtype == object and frame[column].map(lambda value: isinstance(value, list)).any()
+    ]
+
+    tables = {UNITS_TABLE: None}
+    for column in list_columns:
+        child = frame[["unit_id", column]].explode(column).dropna(subset=[column])
+        child = child.rename(columns={column: "value"}).reset_index(drop=True)
+        child.insert(1, "position", child.groupby("unit_id").cumcount())
+        child["value"] = to_typed(child["value"])
+        tables[column] = child
+
+    units_table = frame.drop(columns=list_columns)
+    for column in units_table.columns[1:]:
+        units_table[column] = to_typed(units_table[column])
+    tables[UNITS_TABLE] = units_table
+
+    return tables
+
+
+def export_units_parquet(units, output_dir, compression=DEFAULT_COMPRESSION) -> dict:
+    """
+    Write the units as compressed Parquet files
+
+    One file per table of `flatten_units` (`units.parquet` and a file per
+    list field). Requires the pyarrow package.
+
+    Parameters:
+    ---
+    units (list):
+        Unit dicts as returned by `extract_unit_data`
+    output_dir (str):
+        Directory where the Parquet files are saved
+    compression (str):
+        Parquet compression codec (e.g. 'zstd', 'snappy', 'gzip')
+
+    Returns:
+    ---
+    dict:
+        Number of rows written to each table
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ValueError("Parquet export requires the pyarrow package")
+
+    start_time = time.perf_counter()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    counts = {}
+    for table, frame in flatten_units(units).items():
+        frame.to_parquet(output_dir / f"{table}.parquet", compression=compression, index=False)
+        counts[table] = len(frame)
+
+    elapsed = time.perf_counter() - start_time
+    print(f"Parquet tables saved in {output_dir} ({len(counts)} tables, {len(units)} units) in {elapsed:.3f}s")
+    return counts
+
+
+def read_units_table(output_dir, table=UNITS_TABLE, columns=None) -> pd.DataFrame:
+    """
+    Read a table of the Parquet export
+
+    Only the requested columns are read, and the file is memory-mapped
+    instead of copied into memory before decoding.
+
+    Parameters:
+    ---
+    output_dir (str):
+        Directory of the Parquet export
+    table (str):
+        Table to read, `UNITS_TABLE` or the name of a list field
+        (e.g. 'information_civilizations')
+    columns (list):
+        Columns to read, all of them by default
+    """
+    return pd.read_parquet(Path(output_dir) / f"{table}.parquet", columns=columns, memory_map=True)
+
+
+def export_units_file(filename, output_dir, compression=DEFAULT_COMPRESSION) -> dict:
+    """Exports the units of a JSON output file of the scraper to Parquet."""
+    with open(filename) as file:
+        units = json.load(file)
+    return export_units_parquet(units, output_dir, compression)
+
+
+if __name__ == "__main__":
+    # Columnar copy of the last scrape
+    INPUT_FILE = "data/units.json"
+    OUTPUT_DIR = "data/parquet"
+
+    export_units_file(INPUT_FILE, OUTPUT_DIR)
@@ -0,0 +1,24 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Keys of the unit data shared by the scraper and
+                        its consumers, without importing either of them
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+# Key of the unit data where the problems found during the extraction are recorded
+WARNINGS_KEY = "warnings"
+
+# Version of the extraction of the records from a page, to bump whenever the
+# records extracted from the same page change (new fields, other parsing).
+# Records stored by another version (e.g. in the incremental manifest) are not reused.
+EXTRACTOR_VERSION = 1
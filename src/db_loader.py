@@ -0,0 +1,217 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Bulk loader of the extracted units into the
+                        database
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import io
+import json
+import time
+
+from sqlalchemy import create_engine, delete, insert, text
+
+from src.constants import WARNINGS_KEY
+from src.db_models import DICT_LABEL_MODELS, LIST_LABEL_MODELS, Base, Unit, UnitOtherValue, UnitStat
+
+# Rows sent in each executemany batch of INSERTs when COPY is not available
+DEFAULT_BATCH_SIZE = 1000
+
+# Unquoted marker of NULL in the COPY data (quoted values are never NULL)
+COPY_NULL = "\\N"
+
+
+def get_engine(url=None):
+    """
+    Get the engine where the units are loaded
+
+    Parameters:
+    ---
+    url (str):
+        Database URL (e.g. 'sqlite:///data/units.db'). When it is not given
+        the engine configured in `config.database` is used
+    """
+    if url is not None:
+        return create_engine(url)
+
+    from config.database import get_engine as get_configured_engine
+    return get_configured_engine()
+
+
+def init_schema(engine):
+    """Creates the unit tables if they do not exist."""
+    Base.metadata.create_all(bind=engine)
+
+
+def build_rows(units) -> dict:
+    """
+    Flatten the extracted units into the rows of each table
+
+    Ids are assigned here so the child rows can reference their unit without
+    a round trip to the database.
+
+    Returns:
+    ---
+    dict:
+        Table -> list of row dicts, in insertion order
+    """
+    rows = {table: [] for table in Base.metadata.sorted_tables}
+    next_ids = {table: 1 for table in rows}
+
+    def add_row(model, **values):
+        table = model.__table__
+        values["id"] = next_ids[table]
+        next_ids[table] += 1
+        rows[table].append(values)
+        return values["id"]
+
+    for unit in units:
+        unit_id = add_row(Unit, name=unit["name"])
+
+        for block, block_data in unit.items():
+            if block in ("name", WARNINGS_KEY):
+                continue
+
+            for label, values in block_data.items():
+                if label in LIST_LABEL_MODELS and isinstance(values, list):
+                    model, column = LIST_LABEL_MODELS[label]
+                    for position, value in enumerate(values):
+                        add_row(model, unit_id=unit_id, position=position, **{column: value})
+                elif label in DICT_LABEL_MODELS and isinstance(values, dict):
+                    model, column = DICT_LABEL_MODELS[label]
+                    for key, value in values.items():
+                        add_row(model, unit_id=unit_id, amount=value, **{column: key})
+                elif isinstance(values, list):
+                    for position, value in enumerate(values):
+                        add_row(UnitOtherValue, unit_id=unit_id, block=block, label=label, key=str(position), value=value)
+                elif isinstance(values, dict):
+                    for key, value in values.items():
+                        add_row(UnitOtherValue, unit_id=unit_id, block=block, label=label, key=key, value=value)
+                else:
+                    add_row(UnitStat, unit_id=unit_id, block=block, label=label, value=values)
+
+    return rows
+
+
+def _supports_copy(connection) -> bool:
+    return connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2"
+
+
+def _csv_field(value) -> str:
+    """
+    CSV field for COPY: every value is quoted and NULL is the only unquoted one
+
+    In CSV format PostgreSQL loads an unquoted empty field as NULL, so ''
+    must be quoted to be stored as '' like the INSERT path does.
+    """
+    if value is None:
+        return COPY_NULL
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def rows_to_csv(columns, rows) -> io.StringIO:
+    """Writes the rows as the CSV read by `COPY ... WITH (FORMAT csv, NULL '\\N')`."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join(_csv_field(row.get(column)) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_rows(connection, table, rows):
+    """Loads the rows with PostgreSQL COPY, streaming them as CSV."""
+    columns = [column.name for column in table.columns]
+    buffer = rows_to_csv(columns, rows)
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+    # Ids were given explicitly, move the sequence past them
+    connection.execute(
+        text(f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), :max_id)"),
+        {"max_id": max(len(rows), 1)},
+    )
+
+
+def _insert_rows(connection, table, rows, batch_size):
+    """Loads the rows with one executemany of the INSERT per batch of rows."""
+    for start in range(0, len(rows), batch_size):
+        connection.execute(insert(table), rows[start:start + batch_size])
+
+
+def load_units(units, engine, batch_size=DEFAULT_BATCH_SIZE) -> dict:
+    """
+    Replace the units stored in the database with a whole scrape
+
+    Everything runs in one transaction: if the load fails the previous data
+    is kept.
+
+    Parameters:
+    ---
+    units (list):
+        Unit dicts as returned by `extract_unit_data`
+    engine (Engine):
+        Engine of the target database
+    batch_size (int):
+        Rows per executemany batch when COPY is not available
+
+    Returns:
+    ---
+    dict:
+        Number of rows loaded into each table
+    """
+    start_time = time.perf_counter()
+    init_schema(engine)
+    rows = build_rows(units)
+
+    with engine.begin() as connection:
+        use_copy = _supports_copy(connection)
+
+        # Children are deleted before their units
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(delete(table))
+
+        for table in Base.metadata.sorted_tables:
+            if not rows[table]:
+                continue
+            if use_copy:
+                _copy_rows(connection, table, rows[table])
+            else:
+                _insert_rows(connection, table, rows[table], batch_size)
+
+    counts = {table.name: len(table_rows) for table, table_rows in rows.items()}
+    elapsed = time.perf_counter() - start_time
+    print(f"Loaded {sum(counts.values())} rows ({len(units)} units) in {elapsed:.3f}s")
+    return counts
+
+
+def load_units_file(filename, engine=None, batch_size=DEFAULT_BATCH_SIZE) -> dict:
+    """Loads the units of a JSON output file of the scraper."""
+    with open(filename) as file:
+        units = json.load(file)
+    return load_units(units, engine or get_engine(), batch_size)
+
+
+if __name__ == "__main__":
+    # Load the last scrape into a local SQLite database
+    INPUT_FILE = "data/units.json"
+    DATABASE_URL = "sqlite:///data/units.db"
+
+    load_units_file(INPUT_FILE, get_engine(DATABASE_URL))
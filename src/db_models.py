@@ -0,0 +1,118 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Relational schema of the extracted units
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+from sqlalchemy import Column, ForeignKey, Integer, String
+
+# Declarative base of the project. It is not bound to the configured engine,
+# so the schema can also be created on any database (e.g. a local SQLite file)
+from config.database import Base
+
+
+class Unit(Base):
+    __tablename__ = "units"
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, index=True)
+
+
+class UnitStat(Base):
+    """Single text values of the infobox (Hit points, Speed, Range, ...)."""
+    __tablename__ = "unit_stats"
+    id = Column(Integer, primary_key=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=False, index=True)
+    block = Column(String, nullable=False)
+    label = Column(String, nullable=False)
+    value = Column(String)
+
+
+class UnitCivilization(Base):
+    __tablename__ = "unit_civilizations"
+    id = Column(Integer, primary_key=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=False, index=True)
+    position = Column(Integer, nullable=False)
+    civilization = Column(String, nullable=False, index=True)
+
+
+class UnitType(Base):
+    __tablename__ = "unit_types"
+    id = Column(Integer, primary_key=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=False, index=True)
+    position = Column(Integer, nullable=False)
+    type = Column(String, nullable=False, index=True)
+
+
+class UnitAge(Base):
+    __tablename__ = "unit_ages"
+    id = Column(Integer, primary_key=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=False, index=True)
+    position = Column(Integer, nullable=False)
+    age = Column(String, nullable=False, index=True)
+
+
+class UnitTrainedAt(Base):
+    __tablename__ = "unit_trained_at"
+    id = Column(Integer, primary_key=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=False, index=True)
+    position = Column(Integer, nullable=False)
+    building = Column(String, nullable=False, index=True)
+
+
+class UnitCost(Base):
+    __tablename__ = "unit_costs"
+    id = Column(Integer, primary_key=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=False, index=True)
+    resource = Column(String, nullable=False)
+    amount = Column(String)
+
+
+class UnitDamage(Base):
+    __tablename__ = "unit_damages"
+    id = Column(Integer, primary_key=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=False, index=True)
+    damage_type = Column(String, nullable=False)
+    amount = Column(String)
+
+
+class UnitResistance(Base):
+    __tablename__ = "unit_resistances"
+    id = Column(Integer, primary_key=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=False, index=True)
+    resistance_type = Column(String, nullable=False)
+    amount = Column(String)
+
+
+class UnitOtherValue(Base):
+    """List and dict values without a table of their own (Train time, Resource bounty, ...)."""
+    __tablename__ = "unit_other_values"
+    id = Column(Integer, primary_key=True)
+    unit_id = Column(Integer, ForeignKey("units.id", ondelete="CASCADE"), nullable=False, index=True)
+    block = Column(String, nullable=False)
+    label = Column(String, nullable=False)
+    key = Column(String, nullable=False)
+    value = Column(String)
+
+
+# Infobox labels stored in a child table of their own: label -> (model, value column)
+LIST_LABEL_MODELS = {
+    "Civilization(s)": (UnitCivilization, "civilization"),
+    "Type": (UnitType, "type"),
+    "Age": (UnitAge, "age"),
+    "Trained at": (UnitTrainedAt, "building"),
+}
+DICT_LABEL_MODELS = {
+    "Cost": (UnitCost, "resource"),
+    "Damage": (UnitDamage, "damage_type"),
+    "Resistance": (UnitResistance, "resistance_type"),
+}
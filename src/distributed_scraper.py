@@ -0,0 +1,306 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Coordinator / worker mode of the scraper over
+                        the shared work queue
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+
+Usage (from the project root):
+    python src/distributed_scraper.py coordinator --workers 4
+    python src/distributed_scraper.py worker   # extra workers, e.g. on another machine
+"""
+
+import argparse
+import multiprocessing
+import os
+import socket
+import sys
+import time
+import uuid
+
+if __name__ == "__main__":
+    # Run as a script (python src/distributed_scraper.py): `src` is imported from the project root
+    sys.path.append(os.path.abspath("."))
+
+from src import metrics
+from src.http_cache import ResponseCache
+from src.icons import IconHarvester
+from src.parsers import set_parser_backend
+from src.rate_limit import AdaptiveRateLimiter
+from src.unit_data_scraper import export_units_data, extract_page_units, get_units_urls
+from src.utils import (
+    DEFAULT_MAX_RETRIES,
+    fetch_page_content,
+    get_fetch_failures,
+    set_rate_limiter,
+    set_response_cache,
+)
+from src.work_queue import DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS, WorkQueue
+
+TARGET_GAME = "Age of Empires III"
+
+# Seconds between two polls of a worker waiting for leased tasks of other workers
+POLL_INTERVAL = 1.0
+
+
+def run_worker(
+    queue_file,
+    worker_id=None,
+    batch_size=1,
+    lease_seconds=DEFAULT_LEASE_SECONDS,
+    max_attempts=DEFAULT_MAX_ATTEMPTS,
+    rate_limit=None,
+    max_retries=DEFAULT_MAX_RETRIES,
+    cache_dir=None,
+    parser_backend="html.parser",
+    restricted_parse=False,
+    streaming_parse=False,
+    icons_dir=None,
+    metrics_file=None,
+) -> int:
+    """
+    Scrape the tasks of the queue until every task is done or failed
+
+    The pages are extracted as in `scrape_units_data`: an infobox that
+    cannot be extracted is skipped without failing the rest of the page.
+
+    Parameters:
+    ---
+    queue_file (str):
+        SQLite file of the work queue
+    worker_id (str):
+        Name of the worker in the queue, a random one by default
+    batch_size (int):
+        Tasks leased at once
+    lease_seconds (float):
+        Seconds the worker owns its tasks, it must cover the scraping of a batch
+    max_attempts (int):
+        Leases of a task before it is marked as failed
+    rate_limit (float):
+        Initial requests per second of this worker
+    cache_dir (str):
+        Response cache of this worker (one per worker, SQLite caches are not shared)
+    parser_backend, restricted_parse, streaming_parse:
+        Parser settings, as in `scrape_units_data`
+    icons_dir (str):
+        Download the unit icons to this folder
+    metrics_file (str):
+        JSON file of the metrics of this worker
+
+    Returns:
+    ---
+    int:
+        Number of tasks completed by this worker
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+    if cache_dir is not None:
+        set_response_cache(ResponseCache(cache_dir))
+    set_rate_limiter(AdaptiveRateLimiter(rate_limit) if rate_limit else None, max_retries)
+    set_parser_backend(parser_backend, restricted_parse)
+    icon_harvester = IconHarvester(icons_dir) if icons_dir else None
+
+    completed = 0
+    with WorkQueue(queue_file, lease_seconds, max_attempts) as queue:
+        while True:
+            urls = queue.lease(worker_id, batch_size)
+            if not urls:
+                if queue.is_finished():
+                    break
+                # Tasks leased by other workers may expire and be issued again
+                time.sleep(POLL_INTERVAL)
+                continue
+
+            for url in urls:
+                unit_html = fetch_page_content(url)
+                if unit_html is None:
+                    queue.fail(url, worker_id, get_fetch_failures().get(url, "No content was obtained"))
+                    continue
+
+                icons = [] if icon_harvester is not None else None
+                try:
+                    records = extract_page_units(url, unit_html, TARGET_GAME, streaming_parse, icons)
+                except Exception as e:
+                    print(f"\n[{worker_id}] Error scraping '{url}': {e}")
+                    queue.fail(url, worker_id, str(e))
+                    continue
+                if queue.complete(url, worker_id, records):
+                    completed += 1
+                for icon_name, icon_url in icons or []:
+                    icon_harvester.add(icon_name, icon_url)
+
+    if icon_harvester is not None:
+        icon_harvester.close()
+    metrics.export_metrics(metrics_file)
+
+    print(f"[{worker_id}] {completed} tasks completed")
+    return completed
+
+
+def run_coordinator(
+    url,
+    queue_file,
+    output_file,
+    workers=4,
+    batch_size=1,
+    lease_seconds=DEFAULT_LEASE_SECONDS,
+    max_attempts=DEFAULT_MAX_ATTEMPTS,
+    rate_limit=None,
+    cache_dir=None,
+    parser_backend="html.parser",
+    restricted_parse=False,
+    streaming_parse=False,
+    icons_dir=None,
+    metrics_dir=None,
+    fresh=False,
+):
+    """
+    Enqueue the unit URLs, run local workers and merge their results
+
+    Workers started on other machines with `run_worker` over the same queue
+    file share the work. The output is merged in the order the URLs were
+    enqueued, so it does not depend on which worker scraped each page.
+
+    Once the local workers have exited, the coordinator scrapes the tasks
+    still left itself: the pending ones, and the ones leased by a worker
+    that died once their lease expires (or marks them as failed after
+    `max_attempts` leases).
+
+    A queue file left finished by a previous run starts over: its done and
+    failed tasks are removed before the URLs are enqueued, so the pages are
+    scraped again and the units removed from the unit list are not
+    exported. An unfinished queue (e.g. the coordinator was interrupted) is
+    resumed, unless `fresh` is given.
+
+    Parameters:
+    ---
+    url (str):
+        Base URL of the wiki
+    queue_file (str):
+        SQLite file of the work queue
+    output_file (str):
+        JSON file of the merged units
+    workers (int):
+        Local worker processes, 0 to share the work only with remote workers
+    rate_limit (float):
+        Total initial requests per second, split between the local workers
+    cache_dir (str):
+        Base directory of the response caches, one subdirectory per worker
+    parser_backend, restricted_parse, streaming_parse:
+        Parser settings of the workers, as in `scrape_units_data`
+    icons_dir (str):
+        Download the unit icons to this folder
+    metrics_dir (str):
+        Directory of the metrics files, one JSON file per worker
+    fresh (bool):
+        Remove the done and failed tasks even if the queue is unfinished
+    """
+    start_time = time.perf_counter()
+    set_parser_backend(parser_backend, restricted_parse)
+
+    with WorkQueue(queue_file, lease_seconds, max_attempts) as queue:
+        # A finished queue is the one of a previous run, its pages are scraped again. An unfinished one is resumed
+        if fresh or queue.is_finished():
+            cleared = queue.clear_finished()
+            if cleared:
+                print(f"{cleared} tasks of a previous run removed from {queue_file}")
+        units_urls = get_units_urls(url)
+        added = queue.enqueue(units_urls)
+        print(f"{added} of {len(units_urls)} unit URLs enqueued in {queue_file}")
+
+    worker_rate = rate_limit / workers if rate_limit and workers else rate_limit
+
+    def worker_options(name):
+        return {
+            "queue_file": queue_file,
+            "batch_size": batch_size,
+            "lease_seconds": lease_seconds,
+            "max_attempts": max_attempts,
+            "rate_limit": worker_rate,
+            "cache_dir": os.path.join(cache_dir, name) if cache_dir else None,
+            "parser_backend": parser_backend,
+            "restricted_parse": restricted_parse,
+            "streaming_parse": streaming_parse,
+            "icons_dir": icons_dir,
+            "metrics_file": os.path.join(metrics_dir, f"{name}.json") if metrics_dir else None,
+        }
+
+    if metrics_dir:
+        os.makedirs(metrics_dir, exist_ok=True)
+
+    # Fresh processes: no HTTP connection or SQLite handle is inherited from the coordinator
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=run_worker, kwargs={"worker_id": f"local-{index}", **worker_options(f"worker-{index}")})
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        if process.exitcode != 0:
+            print(f"Worker {process.name} exited with code {process.exitcode}")
+
+    with WorkQueue(queue_file, lease_seconds, max_attempts) as queue:
+        finished = queue.is_finished()
+
+    # Tasks left by a worker that died, or still leased by remote workers
+    if not finished:
+        print("Tasks left in the queue, the coordinator scrapes them")
+        run_worker(worker_id="coordinator", **worker_options("coordinator"))
+
+    with WorkQueue(queue_file, lease_seconds, max_attempts) as queue:
+        data = queue.results()
+        failures = queue.failures()
+
+    if failures:
+        print(f"{len(failures)} URLs could not be scraped:")
+        for failed_url, error in failures.items():
+            print(f"  - {failed_url}: {error}")
+
+    elapsed = time.perf_counter() - start_time
+    print(f"Extracted data for {len(data)} units with {workers} local workers in {elapsed:.2f}s")
+    export_units_data(data, output_file)
+
+
+if __name__ == "__main__":
+    URL = "https://ageofempires.fandom.com/"
+    OUTPUT_FILE = "data/units.json"
+    QUEUE_FILE = "data/work_queue.sqlite"
+    CACHE_DIR = "data/cache"
+    RATE_LIMIT = 5
+
+    parser = argparse.ArgumentParser(description="Coordinator / worker mode of the scraper")
+    parser.add_argument("role", choices=["coordinator", "worker"])
+    parser.add_argument("--workers", type=int, default=4, help="Local workers started by the coordinator")
+    parser.add_argument("--queue", default=QUEUE_FILE)
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--lease-seconds", type=float, default=DEFAULT_LEASE_SECONDS)
+    parser.add_argument(
+        "--fresh", action="store_true", help="Scrape again the pages done by an unfinished previous run of the queue"
+    )
+    args = parser.parse_args()
+
+    if args.role == "coordinator":
+        run_coordinator(
+            URL,
+            args.queue,
+            OUTPUT_FILE,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            lease_seconds=args.lease_seconds,
+            rate_limit=RATE_LIMIT,
+            cache_dir=CACHE_DIR,
+            fresh=args.fresh,
+        )
+    else:
+        run_worker(args.queue, batch_size=args.batch_size, lease_seconds=args.lease_seconds, rate_limit=RATE_LIMIT)
@@ -0,0 +1,152 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Persistent crawl frontier: canonical unit URLs
+                        with their pending / done / failed state
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+# States of a URL in the frontier
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class CrawlFrontier:
+    """
+    URLs of a crawl stored in a SQLite file with their state
+
+    Every URL is stored once (canonical form as primary key) in the order it
+    was discovered. Pages are `pending` until they are scraped: `done` pages
+    keep their records, so a resumed or repeated crawl never scrapes them
+    again, and `failed` pages are retried by the next run.
+
+    A done page is not scraped again when the wiki page changes until
+    `reset` is called, which sets every page back to pending. The URLs that
+    are no longer in the unit list are dropped with `retain`.
+
+    Parameters:
+    ---
+    filename (str):
+        SQLite file of the frontier, created if it does not exist
+    """
+
+    def __init__(self, filename):
+        folder = os.path.dirname(filename)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.filename = filename
+        self._connection = sqlite3.connect(filename)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS frontier (
+                position INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL UNIQUE,
+                state TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                records TEXT,
+                updated REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS frontier_state ON frontier (state)")
+        self._connection.commit()
+
+    def add(self, urls) -> int:
+        """Adds the URLs not already in the frontier as pending, returns how many were new."""
+        now = time.time()
+        with self._connection:
+            cursor = self._connection.executemany(
+                "INSERT OR IGNORE INTO frontier (url, state, updated) VALUES (?, ?, ?)",
+                ((url, PENDING, now) for url in urls),
+            )
+        return cursor.rowcount
+
+    def pending(self, retry_failed=True) -> list:
+        """Returns the URLs still to scrape in the order they were discovered."""
+        states = (PENDING, FAILED) if retry_failed else (PENDING,)
+        rows = self._connection.execute(
+            f"SELECT url FROM frontier WHERE state IN ({', '.join('?' * len(states))}) ORDER BY position",
+            states,
+        )
+        return [url for (url,) in rows]
+
+    def mark_done(self, url, records):
+        with self._connection:
+            self._connection.execute(
+                "UPDATE frontier SET state = ?, attempts = attempts + 1, error = NULL, records = ?, updated = ? WHERE url = ?",
+                (DONE, json.dumps(records), time.time(), url),
+            )
+
+    def mark_failed(self, url, error):
+        with self._connection:
+            self._connection.execute(
+                "UPDATE frontier SET state = ?, attempts = attempts + 1, error = ?, updated = ? WHERE url = ?",
+                (FAILED, error, time.time(), url),
+            )
+
+    def scraped_records(self) -> list:
+        """
+        Returns the last records of every page scraped at least once, in the
+        order the pages were discovered
+
+        A page that failed after a `reset` keeps the records of its last
+        successful scrape.
+        """
+        rows = self._connection.execute("SELECT records FROM frontier WHERE records IS NOT NULL ORDER BY position")
+        return [record for (records,) in rows for record in json.loads(records)]
+
+    def failures(self) -> dict:
+        """Returns URL -> error of the failed pages."""
+        rows = self._connection.execute("SELECT url, error FROM frontier WHERE state = ? ORDER BY position", (FAILED,))
+        return dict(rows)
+
+    def counts(self) -> dict:
+        """Returns the number of URLs in each state."""
+        counts = {PENDING: 0, DONE: 0, FAILED: 0}
+        counts.update(self._connection.execute("SELECT state, COUNT(*) FROM frontier GROUP BY state"))
+        return counts
+
+    def reset(self):
+        """
+        Sets every URL back to pending, so the next run scrapes everything again
+
+        The records are kept until their page is scraped again.
+        """
+        with self._connection:
+            self._connection.execute("UPDATE frontier SET state = ?, error = NULL", (PENDING,))
+
+    def retain(self, urls) -> int:
+        """Removes the URLs that are not in `urls` (e.g. units removed from the unit list), returns how many."""
+        with self._connection:
+            self._connection.execute("CREATE TEMP TABLE IF NOT EXISTS listed (url TEXT PRIMARY KEY)")
+            self._connection.execute("DELETE FROM listed")
+            self._connection.executemany("INSERT OR IGNORE INTO listed (url) VALUES (?)", ((url,) for url in urls))
+            cursor = self._connection.execute("DELETE FROM frontier WHERE url NOT IN (SELECT url FROM listed)")
+            self._connection.execute("DELETE FROM listed")
+        return cursor.rowcount
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
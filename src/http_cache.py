@@ -0,0 +1,174 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : On-disk HTTP response cache with conditional
+                        revalidation and offline replay
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from src.urls import canonicalize_url
+
+# Default size cap of the cache (bytes of stored HTML)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Version of the cache file, kept in its SQLite user_version
+# 1: the pages are keyed by their canonical URL (see `urls.canonicalize_url`)
+CACHE_VERSION = 1
+
+# Access times kept in memory before they are written in one transaction
+ACCESS_FLUSH_EVERY = 100
+
+
+class ResponseCache:
+    """
+    Response cache keyed by URL and stored in a SQLite file.
+
+    Each entry keeps the body of the page and its validators (ETag and
+    Last-Modified) so it can be revalidated with a conditional request.
+    When the stored bodies exceed `max_bytes`, the least recently used
+    entries are evicted. The access times of the reads are written in
+    batches (never in offline mode, where nothing is evicted), and the total
+    size is kept in memory instead of being summed on every store.
+
+    Parameters:
+    ---
+    path (str):
+        Directory where the cache file is stored
+    max_bytes (int):
+        Size cap of the stored bodies
+    offline (bool):
+        Replay mode: pages are served only from the cache, the network is
+        never used
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, offline=False):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path / "responses.sqlite", check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed)")
+        self._conn.commit()
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < CACHE_VERSION:
+            self._canonicalize_keys()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        # URL -> access time of the reads not written yet
+        self._accessed = {}
+
+    def _canonicalize_keys(self):
+        """Re-keys the entries stored before the URLs were canonical (e.g. '//wiki' links)."""
+        urls = [url for (url,) in self._conn.execute("SELECT url FROM responses")]
+        migrated = 0
+        for url in urls:
+            canonical_url = canonicalize_url(url, "")
+            if canonical_url == url:
+                continue
+            self._conn.execute("UPDATE OR IGNORE responses SET url = ? WHERE url = ?", (canonical_url, url))
+            # Left only when the canonical URL was already cached
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            migrated += 1
+        self._conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self._conn.commit()
+        if migrated:
+            print(f"Response cache: {migrated} entries re-keyed by their canonical URL")
+
+    def get(self, url):
+        """Returns the cached entry of the URL as a dict, or None if it is not cached."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            if not self.offline:
+                self._accessed[url] = time.time()
+                if len(self._accessed) >= ACCESS_FLUSH_EVERY:
+                    self._flush_accessed()
+                    self._conn.commit()
+        etag, last_modified, body = row
+        return {"etag": etag, "last_modified": last_modified, "body": body}
+
+    def conditional_headers(self, entry) -> dict:
+        """Builds the headers of a conditional request for a cached entry."""
+        headers = {}
+        if entry is None:
+            return headers
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """Stores (or replaces) the response of the URL and applies the size cap."""
+        size = len(body.encode("utf-8"))
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, last_modified, body, size, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, size, time.time()),
+            )
+            self._accessed.pop(url, None)
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    def _flush_accessed(self):
+        """Writes the access times of the reads, the caller commits."""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE responses SET accessed = ? WHERE url = ?",
+                [(accessed, url) for url, accessed in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _evict(self):
+        """Deletes the least recently used entries until the cache fits in `max_bytes`."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        # The order of the entries needs the access times of the last reads
+        self._flush_accessed()
+        rows = self._conn.execute("SELECT url, size FROM responses ORDER BY accessed ASC").fetchall()
+        for url, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._total_bytes -= size
+
+    def close(self):
+        with self._lock:
+            self._flush_accessed()
+            self._conn.commit()
+            self._conn.close()
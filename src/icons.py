@@ -0,0 +1,254 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Concurrent, deduplicating download of the unit
+                        icons
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.utils import DEFAULT_WORKERS, get_session, request_with_retries
+
+# File, inside the icons folder, with the URL and hash of every downloaded icon
+ICONS_MANIFEST = "icons.json"
+
+# Seconds after which the lock of the icons manifest is taken as left by a dead process
+MANIFEST_LOCK_STALE_SECONDS = 30
+
+# Characters kept in the file names of the icons, the others are replaced by '_'
+UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def sanitize_icon_name(icon_name) -> str:
+    """
+    Get a file name for the icon that stays inside the icons folder
+
+    The name comes from the wiki ('data-image-name'), so any directory part is
+    dropped and only letters, digits, '.', '_' and '-' are kept. Raises a
+    ValueError when nothing usable is left.
+    """
+    name = UNSAFE_NAME_CHARS.sub("_", os.path.basename(icon_name.replace("\\", "/")))
+    if name.strip(".") == "" or name in (ICONS_MANIFEST, f"{ICONS_MANIFEST}.lock"):
+        raise ValueError(f"Invalid icon name: '{icon_name}'")
+    return name
+
+
+def file_sha256(path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(64 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def write_atomic(path, data: bytes):
+    """
+    Writes the file through a temporary file so a partial icon is never left on disk
+
+    The temporary file has a unique name, so processes writing the same file
+    at the same time never write into each other's temporary file.
+    """
+    path = Path(path)
+    file = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+    try:
+        with file:
+            file.write(data)
+        os.replace(file.name, path)
+    except BaseException:
+        if os.path.exists(file.name):
+            os.remove(file.name)
+        raise
+
+
+@contextmanager
+def manifest_lock(manifest_path):
+    """
+    Holds the lock file of the icons manifest while it is read and rewritten
+
+    The lock is a file created exclusively next to the manifest, so it works
+    between processes (e.g. distributed workers sharing the icons folder). A
+    lock older than `MANIFEST_LOCK_STALE_SECONDS` was left by a process that
+    died while holding it and is removed.
+    """
+    lock_path = f"{manifest_path}.lock"
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                stale = time.time() - os.path.getmtime(lock_path) > MANIFEST_LOCK_STALE_SECONDS
+            except FileNotFoundError:
+                continue
+            if stale:
+                try:
+                    os.remove(lock_path)
+                except FileNotFoundError:
+                    pass
+                continue
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(lock_path)
+
+
+class IconHarvester:
+    """
+    Downloads the unit icons in the background while the crawl goes on.
+
+    Icons are deduplicated by name, so units sharing the same
+    `data-image-name` download it once. An icon already on disk is skipped
+    when it was downloaded from the same URL and its content hash still
+    matches the one recorded in the icons manifest. An icon on disk that is
+    not in the manifest (e.g. saved by `download_unit_icon`) is kept and
+    recorded instead of being downloaded again.
+
+    Downloads go through the retries and the rate limiter of the page
+    fetches. A failed icon is recorded in `failures` and never stops the
+    crawl.
+
+    Parameters:
+    ---
+    img_path (str):
+        Folder where the icons are saved
+    max_workers (int):
+        Number of simultaneous downloads
+    """
+
+    def __init__(self, img_path, max_workers=DEFAULT_WORKERS):
+        self.img_path = Path(img_path)
+        self.img_path.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.img_path / ICONS_MANIFEST
+        self.manifest = {}
+        if self.manifest_path.exists():
+            with open(self.manifest_path) as file:
+                self.manifest = json.load(file)
+
+        self.downloaded = 0
+        self.skipped = 0
+        self.failed = 0
+        self.bytes_downloaded = 0
+        # Icon name -> reason of the icons that could not be saved
+        self.failures = {}
+
+        self._seen = set()
+        self._lock = threading.Lock()
+        self._session = get_session(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = []
+        self._start_time = time.perf_counter()
+
+    def add(self, icon_name, icon_url):
+        """Schedules the download of an icon, if it was not scheduled before."""
+        try:
+            icon_name = sanitize_icon_name(icon_name)
+        except ValueError as e:
+            print(f"\nError al descargar la imagen '{icon_name}': {e}")
+            with self._lock:
+                self.failed += 1
+                self.failures[icon_name] = str(e)
+            return
+        with self._lock:
+            if icon_name in self._seen:
+                return
+            self._seen.add(icon_name)
+        self._futures.append(self._executor.submit(self._download, icon_name, icon_url))
+
+    def _is_up_to_date(self, icon_name, icon_url) -> bool:
+        entry = self.manifest.get(icon_name)
+        icon_path = self.img_path / icon_name
+        if not icon_path.is_file():
+            return False
+        if entry is None:
+            # Saved before the manifest existed: adopted as the icon of this URL
+            with self._lock:
+                self.manifest[icon_name] = {"url": icon_url, "sha256": file_sha256(icon_path)}
+            return True
+        return entry["url"] == icon_url and file_sha256(icon_path) == entry["sha256"]
+
+    def _download(self, icon_name, icon_url):
+        if self._is_up_to_date(icon_name, icon_url):
+            with self._lock:
+                self.skipped += 1
+            return
+
+        try:
+            response = request_with_retries(self._session, icon_url)
+            if response is None:
+                raise ValueError("No response after the retries")
+            response.raise_for_status()
+            icon_data = response.content
+            write_atomic(self.img_path / icon_name, icon_data)
+        except Exception as e:
+            print(f"\nError al descargar la imagen '{icon_name}': {e}")
+            with self._lock:
+                self.failed += 1
+                self.failures[icon_name] = str(e)
+            return
+
+        with self._lock:
+            self.manifest[icon_name] = {"url": icon_url, "sha256": hashlib.sha256(icon_data).hexdigest()}
+            self.downloaded += 1
+            self.bytes_downloaded += len(icon_data)
+
+    def close(self) -> dict:
+        """
+        Waits for the pending downloads and saves the icons manifest
+
+        Returns:
+        ---
+        dict:
+            Report with the downloaded, skipped and failed icons, the bytes
+            downloaded and the elapsed time
+        """
+        self._executor.shutdown(wait=True)
+        for future in self._futures:
+            future.result()
+
+        # Keep the entries saved meanwhile by another harvester of the folder (e.g. distributed workers),
+        # under the lock so two harvesters closing at the same time do not drop each other's entries
+        with manifest_lock(self.manifest_path):
+            manifest = {}
+            if self.manifest_path.exists():
+                with open(self.manifest_path) as file:
+                    manifest = json.load(file)
+            manifest.update(self.manifest)
+            manifest_data = json.dumps(manifest, indent=4, sort_keys=True).encode("utf-8")
+            write_atomic(self.manifest_path, manifest_data)
+
+        report = {
+            "downloaded": self.downloaded,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "failures": dict(self.failures),
+            "bytes": self.bytes_downloaded,
+            "elapsed": time.perf_counter() - self._start_time,
+        }
+        print(
+            f"Icons: {report['downloaded']} downloaded ({report['bytes'] / 1024:.1f} KiB), "
+            f"{report['skipped']} up to date, {report['failed']} failed in {report['elapsed']:.2f}s"
+        )
+        for icon_name, reason in report["failures"].items():
+            print(f"  - {icon_name}: {reason}")
+        return report
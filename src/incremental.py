@@ -0,0 +1,88 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Manifest of scraped pages for incremental
+                        re-scrapes
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from src.constants import EXTRACTOR_VERSION
+
+# 2: the pages are keyed by their canonical URL (see `urls.canonicalize_url`)
+MANIFEST_VERSION = 2
+
+# MediaWiki exposes the revision of the rendered page in its JS config
+REVISION_PATTERN = re.compile(r'"wgCurRevisionId"\s*:\s*(\d+)')
+
+
+def page_fingerprint(page_html: str) -> str:
+    """
+    Get the fingerprint of the content of a page
+
+    The wiki revision id is used when the page exposes it, since the rendered
+    HTML also changes with ads and scripts. Otherwise the SHA-256 of the HTML
+    is used.
+    """
+    match = REVISION_PATTERN.search(page_html)
+    if match:
+        return f"rev:{match.group(1)}"
+    return "sha256:" + hashlib.sha256(page_html.encode("utf-8")).hexdigest()
+
+
+def empty_manifest() -> dict:
+    """Returns a manifest without pages for the current format and extractor."""
+    return {"version": MANIFEST_VERSION, "extractor": EXTRACTOR_VERSION, "pages": {}}
+
+
+def load_manifest(filename) -> dict:
+    """
+    Loads the manifest of a previous run, or an empty one if it does not exist
+
+    The manifest is discarded when it was written in another format or when its
+    records were extracted by another version of the extractor, since reusing
+    them would keep the output of the old extraction for unchanged pages.
+    """
+    if not os.path.exists(filename):
+        return empty_manifest()
+    with open(filename) as file:
+        manifest = json.load(file)
+    if manifest.get("version") != MANIFEST_VERSION:
+        print(f"Manifest '{filename}' has an unsupported version, a full scrape will be done")
+        return empty_manifest()
+    if manifest.get("extractor") != EXTRACTOR_VERSION:
+        print(f"Manifest '{filename}' was written by another extractor version, a full scrape will be done")
+        return empty_manifest()
+    return manifest
+
+
+def save_manifest(manifest, filename):
+    """Saves the manifest, replacing the previous file only once it is fully written."""
+    folder = os.path.dirname(filename)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "w") as file:
+        json.dump(manifest, file)
+    os.replace(tmp_filename, filename)
+
+
+def get_unchanged_records(manifest, url, fingerprint):
+    """Returns the records of the previous run for the URL if its content has not changed."""
+    page = manifest["pages"].get(url)
+    if page is not None and page["fingerprint"] == fingerprint:
+        return page["records"]
+    return None
@@ -0,0 +1,252 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Fetch backend based on the MediaWiki api.php
+                        endpoints instead of the rendered pages
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+from urllib.parse import unquote, urlencode, urlparse
+
+from src import metrics
+from src.utils import DEFAULT_PER_HOST_LIMIT, fetch_page_content, iter_pages_content
+
+# Maximum number of titles per query accepted by MediaWiki
+MAX_TITLES_PER_REQUEST = 50
+MAX_CHANGES_PER_REQUEST = 500
+
+
+def get_api_url(url) -> str:
+    """Returns the api.php endpoint of the wiki (e.g. 'https://ageofempires.fandom.com/api.php')."""
+    return url.rstrip("/") + "/api.php"
+
+
+def normalize_title(title) -> str:
+    return unquote(title).replace("_", " ").strip()
+
+
+def title_from_url(page_url) -> str:
+    """Returns the page title of a '/wiki/<title>' URL."""
+    path = urlparse(page_url).path
+    return normalize_title(path.split("/wiki/", 1)[-1])
+
+
+def build_api_request(api_url, **params) -> str:
+    params = {"format": "json", "formatversion": "2", **params}
+    return f"{api_url}?{urlencode(params)}"
+
+
+def load_api_response(content, request_url):
+    """
+    Decodes the JSON of an API response
+
+    Returns None, as the other fetch failures, when there is no content, when
+    the body is not JSON (e.g. an HTML error page of a proxy) or when it is
+    an API error.
+    """
+    if content is None:
+        return None
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError as e:
+        print(f"\nInvalid API response for '{request_url}': {e}")
+        metrics.record_error(
+            "fetch", "invalid_response", type(e).__name__, request_url, f"Invalid API response: {e}"
+        )
+        return None
+    if "error" in data:
+        print(f"\nAPI error for '{request_url}': {data['error'].get('info')}")
+        return None
+    return data
+
+
+def fetch_api_json(request_url):
+    """Sends an API request through the fetch layer (cache, retries, rate limit)."""
+    return load_api_response(fetch_page_content(request_url), request_url)
+
+
+def resolve_titles(query, titles) -> dict:
+    """
+    Map the requested titles to the pages the API answered with
+
+    The API reports the titles it normalized (e.g. first letter capitalized)
+    and, with `redirects=1`, the redirects it followed. The pages of the
+    response carry the final titles only.
+
+    Returns:
+    ---
+    dict:
+        Requested title -> normalized title of the page it resolves to
+    """
+    normalized = {normalize_title(item["from"]): normalize_title(item["to"]) for item in query.get("normalized", [])}
+    redirects = {normalize_title(item["from"]): normalize_title(item["to"]) for item in query.get("redirects", [])}
+    resolved = {}
+    for title in titles:
+        page_title = normalized.get(title, title)
+        # The API follows a single redirect (double redirects are not resolved)
+        resolved[title] = redirects.get(page_title, page_title)
+    return resolved
+
+
+def fetch_revisions(api_url, titles) -> dict:
+    """
+    Get the current revision id of several pages
+
+    The titles are sent in batches of `MAX_TITLES_PER_REQUEST`. Redirects
+    are followed: a redirect title gets the revision of its target page.
+
+    Returns:
+    ---
+    dict:
+        Normalized requested title -> revision id. Missing pages are not
+        included
+    """
+    revisions = {}
+    titles = list(dict.fromkeys(normalize_title(title) for title in titles))
+
+    for start in range(0, len(titles), MAX_TITLES_PER_REQUEST):
+        batch = titles[start:start + MAX_TITLES_PER_REQUEST]
+        data = fetch_api_json(
+            build_api_request(
+                api_url, action="query", prop="revisions", rvprop="ids", redirects="1", titles="|".join(batch)
+            )
+        )
+        if data is None:
+            continue
+
+        query = data.get("query", {})
+        page_revisions = {
+            normalize_title(page["title"]): page["revisions"][0]["revid"]
+            for page in query.get("pages", [])
+            if not page.get("missing") and page.get("revisions")
+        }
+        # Revisions are keyed by the requested titles, several of them can resolve to the same page
+        for title, page_title in resolve_titles(query, batch).items():
+            if page_title in page_revisions:
+                revisions[title] = page_revisions[page_title]
+
+    return revisions
+
+
+def fetch_recent_changes(api_url, since, limit=MAX_CHANGES_PER_REQUEST) -> list:
+    """
+    Get the edits of the articles made since a moment
+
+    Parameters:
+    ---
+    api_url (str):
+        api.php endpoint of the wiki
+    since (str):
+        ISO 8601 timestamp (e.g. '2026-10-18T10:00:00Z'), included
+    limit (int):
+        Changes per request, the following pages are requested with the
+        continuation token of the API
+
+    Returns:
+    ---
+    list:
+        Recent change entries (title, revid, timestamp, user, comment), the
+        oldest first. None if the feed could not be fetched
+    """
+    params = {
+        "action": "query",
+        "list": "recentchanges",
+        "rcstart": since,
+        "rcdir": "newer",
+        "rcnamespace": "0",
+        "rctype": "edit|new",
+        "rcprop": "title|ids|timestamp|user|comment",
+        "rclimit": str(limit),
+    }
+    changes = []
+
+    while True:
+        data = fetch_api_json(build_api_request(api_url, **params))
+        if data is None:
+            return None
+        changes.extend(data.get("query", {}).get("recentchanges", []))
+        if "continue" not in data:
+            return changes
+        params.update(data["continue"])
+
+
+def build_parse_request(api_url, title) -> str:
+    """Request of the parsed HTML of a page: only the article content, without the skin."""
+    return build_api_request(
+        api_url,
+        action="parse",
+        page=title,
+        prop="text",
+        redirects="1",
+        disablelimitreport="1",
+        disableeditsection="1",
+    )
+
+
+def parse_response_html(content, request_url=None):
+    """
+    Returns the HTML of an `action=parse` response
+
+    The page is parsed with `redirects=1`, so the HTML of a redirect is the
+    one of its target and is returned for the requested title.
+    """
+    data = load_api_response(content, request_url)
+    if data is None:
+        return None
+    return data["parse"]["text"]
+
+
+def fetch_parsed_content(api_url, title):
+    """Returns the parsed HTML of a page (the `mw-parser-output` div), or None."""
+    request_url = build_parse_request(api_url, title)
+    return parse_response_html(fetch_page_content(request_url), request_url)
+
+
+def iter_api_pages(url, units_urls, workers=1, per_host_limit=DEFAULT_PER_HOST_LIMIT, skip_urls=(), byte_budget=None):
+    """
+    Get the parsed HTML of every unit URL through the API
+
+    Parameters:
+    ---
+    url (str):
+        Base URL of the wiki
+    units_urls (list):
+        Rendered page URLs of the units
+    workers (int):
+        Number of simultaneous requests
+    skip_urls (set):
+        URLs that are not fetched (e.g. unchanged since the previous run)
+    byte_budget (ByteBudget):
+        Caps the size of the responses downloaded ahead of the consumer
+
+    Yields:
+    ---
+    tuple:
+        Pairs (url, html) in the order of `units_urls`. The html is None for
+        skipped pages and for pages that could not be fetched
+    """
+    api_url = get_api_url(url)
+    request_urls = [
+        build_parse_request(api_url, title_from_url(unit_url))
+        for unit_url in units_urls
+        if unit_url not in skip_urls
+    ]
+
+    fetched = iter_pages_content(request_urls, workers, per_host_limit, byte_budget)
+
+    for unit_url in units_urls:
+        if unit_url in skip_urls:
+            yield unit_url, None
+            continue
+        request_url, content = next(fetched)
+        yield unit_url, parse_response_html(content, request_url)
@@ -0,0 +1,117 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Byte budget of the pages in flight and memory
+                        usage of the process for the memory-bounded mode
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import sys
+import threading
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Size reserved for the first page, before the size of any page is known
+DEFAULT_PAGE_ESTIMATE = 256 * 1024
+
+
+class ByteBudget:
+    """
+    Caps the size of the pages downloaded but not processed yet.
+
+    Pages are admitted in order (`ticket` is the position of the page): a
+    page waits until every previous page was admitted and its size fits in
+    the budget. A page bigger than the whole budget is admitted alone, so the
+    crawl never blocks.
+
+    A page is admitted before it is downloaded with `reserve`, for the mean
+    size of the pages downloaded so far, and its reservation is replaced by
+    its actual size with `adjust` once it is downloaded.
+
+    Parameters:
+    ---
+    max_bytes (int):
+        Maximum size of the pages in flight (characters of their HTML)
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._pages = 0
+        self._total_bytes = 0
+        self._next_ticket = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def acquire(self, ticket, size):
+        """Blocks until the page with this ticket fits in the budget."""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._closed
+                or (ticket == self._next_ticket and (self.in_flight == 0 or self.in_flight + size <= self.max_bytes))
+            )
+            self._next_ticket += 1
+            self.in_flight += size
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self._condition.notify_all()
+
+    def estimate(self) -> int:
+        """Expected size of the next page: the mean size of the pages downloaded so far, within the budget."""
+        with self._condition:
+            if self._pages == 0:
+                return min(DEFAULT_PAGE_ESTIMATE, self.max_bytes)
+            return min(self._total_bytes // self._pages, self.max_bytes)
+
+    def reserve(self, ticket) -> int:
+        """Blocks until the page with this ticket fits in the budget with its estimated size, returns the bytes reserved."""
+        size = self.estimate()
+        self.acquire(ticket, size)
+        return size
+
+    def adjust(self, reserved, size):
+        """Replaces the reservation of a downloaded page by its actual size."""
+        with self._condition:
+            self.in_flight += size - reserved
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self._pages += 1
+            self._total_bytes += size
+            self._condition.notify_all()
+
+    def release(self, size):
+        with self._condition:
+            self.in_flight -= size
+            self._condition.notify_all()
+
+    def close(self):
+        """Admits every waiting page (e.g. the consumer stopped before the end)."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
+def peak_rss_bytes(children=False):
+    """
+    Peak resident set size of the process, or None if it is not available
+
+    With `children` it is the peak of the largest finished child process
+    (e.g. the parse processes once their pool is closed).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
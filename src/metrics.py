@@ -0,0 +1,311 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Per-stage metrics of the scraping pipeline with
+                        JSON / Prometheus export and a cProfile hook
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import cProfile
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# Stages that can be profiled with cProfile
+PROFILE_STAGES = ["fetch", "parse", "extract"]
+
+# Kinds of errors, the `kind` label of `errors_total`:
+# - network: connection errors and timeouts
+# - http: error status of the server (after the retries for 429/5xx)
+# - cache: page missing from the response cache (offline replay)
+# - invalid_response: body that cannot be decoded (e.g. not JSON from the API)
+# - markup: page without the expected elements (e.g. no infobox)
+ERROR_KINDS = ["network", "http", "cache", "invalid_response", "markup"]
+
+
+class MetricsRegistry:
+    """
+    Counters and timing summaries identified by a name and a set of labels.
+
+    A timing summary keeps the count, the sum and the maximum of the
+    observed values. Registries are plain data once exported with
+    `snapshot`, so the metrics of a worker process can be merged into the
+    registry of the main process.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.summaries = {}
+        # Detail of each error (stage, kind, error class, url and reason), only in the JSON summary
+        self.errors = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name, labels):
+        if len(labels) <= 1:
+            return name, tuple(labels.items())
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            count, total, maximum = self.summaries.get(key, (0, 0.0, 0.0))
+            self.summaries[key] = (count + 1, total + value, max(maximum, value))
+
+    def observe_many(self, name, label_name, observations):
+        """Observes several (label value, value) pairs of a single-label metric under one lock."""
+        with self._lock:
+            for label_value, value in observations:
+                key = (name, ((label_name, label_value),))
+                count, total, maximum = self.summaries.get(key, (0, 0.0, 0.0))
+                self.summaries[key] = (count + 1, total + value, max(maximum, value))
+
+    def record_error(self, stage, kind, error, url=None, reason=None):
+        """
+        Counts an error in `errors_total`, labelled by stage, kind (one of
+        `ERROR_KINDS`) and error class so the Prometheus series stay bounded,
+        and keeps its url and reason for the JSON summary.
+        """
+        if kind not in ERROR_KINDS:
+            raise ValueError(f"Invalid error kind: {kind}")
+        key = self._key("errors_total", {"stage": stage, "kind": kind, "error": error})
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+            self.errors.append({"stage": stage, "kind": kind, "error": error, "url": url, "reason": reason})
+
+    def timer(self, name, **labels):
+        return _Timer(self, name, labels)
+
+    def summary(self, name, **labels):
+        """Returns the (count, sum, max) of a summary, or None if nothing was observed."""
+        with self._lock:
+            return self.summaries.get(self._key(name, labels))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "counters": [[name, list(labels), value] for (name, labels), value in self.counters.items()],
+                "summaries": [[name, list(labels), list(values)] for (name, labels), values in self.summaries.items()],
+                "errors": list(self.errors),
+            }
+
+    def merge(self, snapshot):
+        """Adds the metrics of a snapshot (e.g. from a worker process)."""
+        with self._lock:
+            for name, labels, value in snapshot["counters"]:
+                key = (name, tuple(tuple(label) for label in labels))
+                self.counters[key] = self.counters.get(key, 0) + value
+            for name, labels, (count, total, maximum) in snapshot["summaries"]:
+                key = (name, tuple(tuple(label) for label in labels))
+                old_count, old_total, old_maximum = self.summaries.get(key, (0, 0.0, 0.0))
+                self.summaries[key] = (old_count + count, old_total + total, max(old_maximum, maximum))
+            self.errors.extend(snapshot.get("errors", ()))
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.summaries.clear()
+            self.errors.clear()
+
+    def to_dict(self) -> dict:
+        """JSON summary: every metric with its labels and values."""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+            summaries = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": count,
+                    "sum": total,
+                    "mean": total / count if count else 0.0,
+                    "max": maximum,
+                }
+                for (name, labels), (count, total, maximum) in sorted(self.summaries.items())
+            ]
+            errors = list(self.errors)
+        return {"counters": counters, "summaries": summaries, "errors": errors}
+
+    def to_prometheus(self) -> str:
+        """
+        Prometheus text exposition format (for the node exporter textfile collector)
+
+        A summary gives the `_count` and `_sum` samples of its family, its
+        maximum is a gauge family of its own (`<name>_max`): a summary family
+        only accepts quantiles, `_count` and `_sum`.
+        """
+
+        def format_labels(labels):
+            if not labels:
+                return ""
+            return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels) + "}"
+
+        lines = []
+        with self._lock:
+            names = sorted({name for name, _ in self.counters})
+            for metric in names:
+                lines.append(f"# TYPE aoe3de_{metric} counter")
+                for (name, labels), value in sorted(self.counters.items()):
+                    if name == metric:
+                        lines.append(f"aoe3de_{name}{format_labels(labels)} {value}")
+
+            names = sorted({name for name, _ in self.summaries})
+            for metric in names:
+                summaries = [(labels, values) for (name, labels), values in sorted(self.summaries.items()) if name == metric]
+                lines.append(f"# TYPE aoe3de_{metric} summary")
+                for labels, (count, total, _) in summaries:
+                    lines.append(f"aoe3de_{metric}_count{format_labels(labels)} {count}")
+                    lines.append(f"aoe3de_{metric}_sum{format_labels(labels)} {total}")
+                lines.append(f"# TYPE aoe3de_{metric}_max gauge")
+                for labels, (_, _, maximum) in summaries:
+                    lines.append(f"aoe3de_{metric}_max{format_labels(labels)} {maximum}")
+        return "\n".join(lines) + "\n"
+
+
+class _Timer:
+    """Context manager that observes the time spent in its block (lighter than a generator)."""
+
+    __slots__ = ("registry", "name", "labels", "start_time")
+
+    def __init__(self, registry, name, labels):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.registry.observe(self.name, time.perf_counter() - self.start_time, **self.labels)
+        return False
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Registry of the process, the metrics of a thread can be redirected with `use_registry`
+_registry = MetricsRegistry()
+_local = threading.local()
+
+# Per-block and per-label timings of the extraction (see `enable_detailed_timings`)
+detailed_timings = False
+
+# cProfile hook (see `enable_profiling`)
+_profile_stage = None
+_profiler = None
+
+
+def get_registry() -> MetricsRegistry:
+    """Returns the registry of the current thread (the process registry by default)."""
+    return getattr(_local, "registry", None) or _registry
+
+
+@contextmanager
+def use_registry(registry):
+    """Records the metrics of the current thread in another registry."""
+    previous = getattr(_local, "registry", None)
+    _local.registry = registry
+    try:
+        yield registry
+    finally:
+        _local.registry = previous
+
+
+def inc(name, value=1, **labels):
+    get_registry().inc(name, value, **labels)
+
+
+def observe(name, value, **labels):
+    get_registry().observe(name, value, **labels)
+
+
+def timer(name, **labels):
+    return get_registry().timer(name, **labels)
+
+
+def record_error(stage, kind, error, url=None, reason=None):
+    get_registry().record_error(stage, kind, error, url, reason)
+
+
+def enable_detailed_timings(enabled=True):
+    """
+    Record the extraction time of every infobox block and label
+
+    They are off by default: timing every label slows the extraction down
+    by 20 to 40 %, so they are only recorded when the metrics of the run are
+    exported.
+    """
+    global detailed_timings
+    detailed_timings = enabled
+
+
+def enable_profiling(stage):
+    """
+    Profile one stage of the pipeline with cProfile
+
+    Only the work done in the main thread of the process is profiled, so use
+    it with a sequential run (workers=1, parse_processes=0).
+
+    Parameters:
+    ---
+    stage (str):
+        One of `PROFILE_STAGES`, or None to disable the profiling
+    """
+    global _profile_stage, _profiler
+    if stage is not None and stage not in PROFILE_STAGES:
+        raise ValueError(f"Invalid profile stage: {stage}")
+    _profile_stage = stage
+    _profiler = cProfile.Profile() if stage is not None else None
+
+
+@contextmanager
+def profile_stage(stage):
+    """Enables the profiler around the block when it is the profiled stage."""
+    profiler = _profiler
+    if stage != _profile_stage or profiler is None or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+
+
+def dump_profile(filename):
+    """Saves the profile of the stage, readable with `python -m pstats <filename>`."""
+    if _profiler is None:
+        return
+    _profiler.dump_stats(filename)
+    print(f"Profile of stage '{_profile_stage}' saved in {filename}")
+
+
+def export_metrics(json_file=None, prometheus_file=None):
+    """Writes the metrics of the process registry as a JSON summary and/or a Prometheus text file."""
+    if json_file:
+        with open(json_file, "w") as file:
+            json.dump(_registry.to_dict(), file, indent=4)
+        print(f"Metrics saved in {json_file}")
+    if prometheus_file:
+        with open(prometheus_file, "w") as file:
+            file.write(_registry.to_prometheus())
+        print(f"Prometheus metrics saved in {prometheus_file}")
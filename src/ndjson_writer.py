@@ -0,0 +1,141 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Streaming NDJSON output with checkpoint/resume
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import os
+
+# Number of pages written between two checkpoints
+DEFAULT_CHECKPOINT_EVERY = 25
+
+# 2: the done URLs are canonical (see `urls.canonicalize_url`)
+CHECKPOINT_VERSION = 2
+
+
+class CheckpointedWriter:
+    """
+    Appends one unit per line to an NDJSON file as the pages are extracted.
+
+    Every `checkpoint_every` pages the file is fsynced and a checkpoint with
+    the done URLs and the size of the file is saved next to it. When resuming,
+    the lines written after the last checkpoint are discarded and the done
+    URLs are available in `done_urls` to skip them. A checkpoint of another
+    version is not resumed: its URLs would not match the ones of this run.
+
+    Parameters:
+    ---
+    filename (str):
+        NDJSON output file
+    checkpoint_every (int):
+        Number of pages written between two checkpoints
+    resume (bool):
+        Continue from the checkpoint of a previous run instead of starting
+        a new file
+    """
+
+    def __init__(self, filename, checkpoint_every=DEFAULT_CHECKPOINT_EVERY, resume=False):
+        self.filename = filename
+        self.checkpoint_filename = f"{filename}.checkpoint"
+        self.checkpoint_every = checkpoint_every
+        self.done_urls = set()
+        self.units_written = 0
+        self._pages_since_checkpoint = 0
+
+        folder = os.path.dirname(filename)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        offset = 0
+        if resume and os.path.exists(self.checkpoint_filename):
+            with open(self.checkpoint_filename) as file:
+                checkpoint = json.load(file)
+            if checkpoint.get("version") == CHECKPOINT_VERSION:
+                self.done_urls = set(checkpoint["done_urls"])
+                self.units_written = checkpoint["units_written"]
+                offset = checkpoint["offset"]
+            else:
+                print(f"Checkpoint of '{filename}' has an unsupported version, starting from scratch")
+        elif resume:
+            print(f"No checkpoint found for '{filename}', starting from scratch")
+
+        self._file = open(filename, "a+b")
+        # Drop the lines written after the last checkpoint
+        self._file.truncate(offset)
+        self._file.seek(offset)
+
+    def write_page(self, url, records):
+        """Appends the units of a page and marks its URL as done."""
+        # Serialized before writing, so an error does not leave part of a page in the file
+        lines = b"".join(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n" for record in records)
+        self._file.write(lines)
+        self.units_written += len(records)
+        self.done_urls.add(url)
+
+        self._pages_since_checkpoint += 1
+        if self._pages_since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Flushes the output to disk and saves the done URLs."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "done_urls": sorted(self.done_urls),
+            "units_written": self.units_written,
+            "offset": self._file.tell(),
+        }
+        tmp_filename = f"{self.checkpoint_filename}.tmp"
+        with open(tmp_filename, "w") as file:
+            json.dump(checkpoint, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_filename, self.checkpoint_filename)
+        self._pages_since_checkpoint = 0
+
+    def close(self):
+        self.checkpoint()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_ndjson(filename):
+    """Yields the records of an NDJSON file."""
+    with open(filename, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def finalize_ndjson(ndjson_file, output_file, extra_records=()):
+    """
+    Writes the pretty JSON list expected by the consumers of `units.json`
+
+    `extra_records` are appended after the records of the NDJSON file (e.g.
+    the records kept from the previous run for the pages that failed).
+    """
+    data = [*read_ndjson(ndjson_file), *extra_records]
+    # Written aside and renamed, so readers of the file (e.g. the read API) never see a partial file
+    tmp_filename = f"{output_file}.tmp"
+    with open(tmp_filename, "w") as file:
+        json.dump(data, file, indent=4)
+    os.replace(tmp_filename, output_file)
+    print(f"Data saved in {output_file}")
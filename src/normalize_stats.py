@@ -0,0 +1,217 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Normalization of the extracted stat strings into
+                        typed values for the whole roster at once
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import re
+import time
+
+import pandas as pd
+
+# Labels whose values are numbers, possibly with a unit or a target
+# (e.g. '160', '20%', '1.5x vs cavalry', '27 seconds')
+NUMERIC_LABELS = [
+    "Area of Effect",
+    "Bonus damage",
+    "Cost",
+    "Damage",
+    "Fatten rate",
+    "Healing",
+    "Hit points",
+    "Kill XP",
+    "Line of Sight",
+    "Range",
+    "Rate of Fire",
+    "Regeneration",
+    "Resistance",
+    "Resource amount",
+    "Resource bounty",
+    "Speed",
+    "Train limit",
+    "Train time",
+    "Train XP",
+    "XP kill bounty",
+    "XP train bounty",
+]
+
+_NUMERIC_LABELS = frozenset(NUMERIC_LABELS)
+
+# Several values in one cell: '3x vs cavalry, 2x vs light infantry'
+# (a comma without a space is a thousands separator: '1,000')
+PART_SEPARATOR = r"\s*;\s*|,\s+"
+
+VALUE_PATTERN = (
+    r"^\s*(?P<number>[-+]?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?|[-+]?\.\d+)"
+    r"\s*(?P<suffix>%|x|×|s|sec|secs|seconds?)?"
+    r"(?:\s+vs\.?\s+(?P<target>.+?))?\s*$"
+)
+
+# Suffix of the value -> kind of the typed value
+SUFFIX_KINDS = {
+    "%": "percent",
+    "x": "multiplier",
+    "×": "multiplier",
+    "s": "seconds",
+    "sec": "seconds",
+    "secs": "seconds",
+    "second": "seconds",
+    "seconds": "seconds",
+}
+
+# Separator of the nested keys in the field names, as in the change log of the watch mode
+FIELD_SEPARATOR = " / "
+
+
+def _iter_stat_cells(unit):
+    """Yields the (field, raw string) of the numeric labels of a unit."""
+    for block, block_data in unit.items():
+        if not isinstance(block_data, dict):
+            continue
+        for label, values in block_data.items():
+            if label not in _NUMERIC_LABELS:
+                continue
+            if isinstance(values, dict):
+                for key, value in values.items():
+                    if isinstance(value, str):
+                        yield f"{block}{FIELD_SEPARATOR}{label}{FIELD_SEPARATOR}{key}", value
+            elif isinstance(values, str):
+                yield f"{block}{FIELD_SEPARATOR}{label}", values
+
+
+def stat_cells(units) -> pd.DataFrame:
+    """
+    Long table of the raw stat strings of the roster
+
+    Building the table is the only step that walks the records, everything
+    after it works on whole columns.
+
+    Returns:
+    ---
+    DataFrame:
+        One row per cell with the columns `unit_id` (position in the roster,
+        from 1), `name`, `field` (e.g. 'Training / Cost / Food') and `raw`
+    """
+    rows = [
+        (unit_id, unit["name"], field, raw)
+        for unit_id, unit in enumerate(units, start=1)
+        for field, raw in _iter_stat_cells(unit)
+    ]
+    return pd.DataFrame(rows, columns=["unit_id", "name", "field", "raw"])
+
+
+def _on_unique(values, func) -> pd.DataFrame:
+    """
+    Apply a string operation to the distinct values only
+
+    Stats repeat a lot across a roster ('12', '3.0', '20%'), so the regex
+    runs once per distinct string and the result is spread back by position.
+    """
+    codes, uniques = pd.factorize(values)
+    result = func(pd.Series(uniques, dtype=object))
+    return result.take(codes).set_axis(values.index)
+
+
+def normalize_stats(units) -> tuple:
+    """
+    Turn the stat strings of the whole roster into typed values
+
+    The cells are split into their parts and parsed with one vectorized
+    regex extraction: '1.5x vs cavalry' -> value 1.5, kind 'multiplier',
+    target 'cavalry'; '25%' -> value 25.0, kind 'percent'.
+
+    Parameters:
+    ---
+    units (list):
+        Unit dicts as returned by `extract_unit_data`
+
+    Returns:
+    ---
+    tuple:
+        (values, unparseable) DataFrames. values has one row per parsed part
+        with the columns `unit_id`, `name`, `field`, `part`, `raw`, `value`
+        (float), `kind` ('number', 'percent', 'multiplier' or 'seconds') and
+        `target`. unparseable has the `unit_id`, `name`, `field` and `raw`
+        of every cell with a part that could not be parsed
+    """
+    cells = stat_cells(units)
+
+    split = _on_unique(cells["raw"], lambda raw: raw.str.split(PART_SEPARATOR, regex=True))
+    parts = cells.assign(raw=split).explode("raw")
+    parts = parts[parts["raw"].str.strip().ne("")]
+    parts.insert(3, "part", parts.groupby(level=0).cumcount())
+
+    def extract(raw):
+        # Suffix and 'vs' in any case (e.g. '2X vs artillery')
+        extracted = raw.str.extract(VALUE_PATTERN, flags=re.IGNORECASE)
+        extracted["number"] = pd.to_numeric(extracted["number"].str.replace(",", "", regex=False), errors="coerce")
+        extracted["suffix"] = extracted["suffix"].str.lower().map(SUFFIX_KINDS)
+        return extracted
+
+    extracted = _on_unique(parts["raw"], extract)
+    parts["value"] = extracted["number"].astype(float)
+    parts["kind"] = extracted["suffix"].fillna("number")
+    # e.g. 'Training / Train time / seconds'
+    parts.loc[parts["field"].str.endswith(f"{FIELD_SEPARATOR}seconds"), "kind"] = "seconds"
+    parts["target"] = extracted["target"]
+
+    parsed = parts["value"].notna()
+    values = parts[parsed].reset_index(drop=True)
+
+    failed_cells = parts.index[~parsed].unique()
+    unparseable = cells.loc[failed_cells].reset_index(drop=True)
+
+    return values, unparseable
+
+
+def typed_stats(values) -> pd.DataFrame:
+    """
+    Wide table of the typed values: one row per unit, one float column per field
+
+    Only the single values without a target are kept (e.g. 'Hit points',
+    'Training / Cost / Food'); multipliers against targets stay in the long
+    table.
+    """
+    single = values[values["target"].isna()].drop_duplicates(["unit_id", "field"], keep=False)
+    table = single.pivot(index=["unit_id", "name"], columns="field", values="value")
+    table.columns.name = None
+    return table.reset_index()
+
+
+def report_unparseable(unparseable):
+    """Prints the cells that could not be parsed with their source unit."""
+    if unparseable.empty:
+        return
+    print(f"{len(unparseable)} stat cells could not be parsed:")
+    for row in unparseable.itertuples(index=False):
+        print(f"  - {row.name} (unit {row.unit_id}) {row.field}: {row.raw!r}")
+
+
+if __name__ == "__main__":
+    # Typed stats of the last scrape
+    INPUT_FILE = "data/units.json"
+    OUTPUT_FILE = "data/units_stats.csv"
+
+    with open(INPUT_FILE) as file:
+        units = json.load(file)
+
+    start_time = time.perf_counter()
+    values, unparseable = normalize_stats(units)
+    elapsed = time.perf_counter() - start_time
+    print(f"{len(values)} typed values of {len(units)} units in {elapsed * 1000:.1f} ms")
+
+    report_unparseable(unparseable)
+    values.to_csv(OUTPUT_FILE, index=False)
+    print(f"Typed stats saved in {OUTPUT_FILE}")
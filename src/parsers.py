@@ -0,0 +1,122 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Configurable HTML parser backend
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import re
+import weakref
+
+from bs4 import BeautifulSoup as bs
+from bs4 import FeatureNotFound, SoupStrainer
+
+# Tree builders supported by BeautifulSoup, "lxml" requires the lxml package
+PARSER_BACKENDS = ["html.parser", "lxml"]
+
+# Restricted parse: only the elements the scraper reads are built.
+# The class attribute is matched as a whole string while parsing, hence the regex
+INFOBOX_STRAINER = SoupStrainer("aside", class_=re.compile(r"(^|\s)portable-infobox(\s|$)"))
+CONTENT_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)mw-parser-output(\s|$)"))
+
+_parser_backend = "html.parser"
+_restricted_parse = False
+_release_trees = False
+
+# Ids of the soups built by `make_soup` that are still alive
+# (not a WeakSet: the hash of a tag serializes its whole tree)
+_live_trees = set()
+
+
+def set_parser_backend(backend: str = "html.parser", restricted: bool = False, release_trees: bool = False):
+    """
+    Set the parser used to build every soup of the scraper
+
+    Parameters:
+    ---
+    backend (str):
+        Tree builder of BeautifulSoup, one of `PARSER_BACKENDS`
+    restricted (bool):
+        Build only the subtrees the scraper reads (infoboxes and page
+        content) instead of the whole page
+    release_trees (bool):
+        Decompose the trees with `release_trees` as soon as their data is
+        extracted, instead of waiting for the garbage collector
+    """
+    global _parser_backend, _restricted_parse, _release_trees
+
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Invalid parser backend: {backend}")
+
+    # Fail now instead of on the first page if the backend is not installed
+    try:
+        bs("", backend)
+    except FeatureNotFound:
+        raise ValueError(f"Parser backend '{backend}' is not installed")
+
+    _parser_backend = backend
+    _restricted_parse = restricted
+    _release_trees = release_trees
+
+
+def get_parser_backend() -> tuple:
+    """Returns the configured (backend, restricted, release_trees) settings."""
+    return _parser_backend, _restricted_parse, _release_trees
+
+
+def make_soup(markup, strainer=None):
+    """
+    Parse an HTML document with the configured backend
+
+    Parameters:
+    ---
+    markup (str):
+        HTML document
+    strainer (SoupStrainer):
+        Subtrees to build when the restricted parse is enabled
+
+    Returns:
+    ---
+    BeautifulSoup:
+        Parsed document
+    """
+    parse_only = strainer if _restricted_parse else None
+    soup = bs(markup, _parser_backend, parse_only=parse_only)
+    _live_trees.add(id(soup))
+    weakref.finalize(soup, _live_trees.discard, id(soup))
+    return soup
+
+
+def release_trees(tags):
+    """
+    Decompose the whole trees of the given tags when the release is enabled
+
+    A soup is full of parent/child reference cycles, so without this it is
+    only freed by the cyclic garbage collector, long after its page.
+    """
+    if not _release_trees:
+        return
+    roots = {}
+    for tag in tags:
+        while tag.parent is not None:
+            tag = tag.parent
+        roots[id(tag)] = tag
+    for root in roots.values():
+        # Decomposing the nodes breaks their cycles, the empty soup left is negligible
+        for child in list(root.contents):
+            child.decompose()
+        _live_trees.discard(id(root))
+
+
+def count_live_trees() -> int:
+    """Number of soups built by `make_soup` that have been neither released nor freed yet."""
+    return len(_live_trees)
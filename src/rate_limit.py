@@ -0,0 +1,127 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Adaptive token-bucket rate limiter and retry
+                        backoff of the fetch layer
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# Default requests per second of the rate limiter
+DEFAULT_RATE = 5.0
+DEFAULT_MAX_RATE = 50.0
+DEFAULT_MIN_RATE = 0.2
+
+# Exponential backoff of the retries: base * 2**attempt seconds, capped
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+# Longest `Retry-After` honoured, a longer delay sent by the server is clamped to it
+MAX_RETRY_AFTER = BACKOFF_CAP
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket whose rate adapts to the responses of the server.
+
+    Every successful response increases the rate additively up to
+    `max_rate`; every throttling response (429/503) halves it down to
+    `min_rate` and, when the server sends `Retry-After`, pauses every request
+    until that moment.
+
+    Parameters:
+    ---
+    rate (float):
+        Initial requests per second
+    max_rate (float):
+        Upper bound of the rate
+    min_rate (float):
+        Lower bound of the rate
+    burst (int):
+        Maximum number of tokens that can be accumulated
+    increase (float):
+        Requests per second added after each successful response
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, max_rate=DEFAULT_MAX_RATE, min_rate=DEFAULT_MIN_RATE, burst=1, increase=0.1):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.increase = increase
+        self.throttled = 0
+        self._tokens = burst
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self):
+        """Blocks until a request can be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after=None):
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+
+def parse_retry_after(value):
+    """
+    Returns the seconds of a `Retry-After` header (delay or HTTP date), or None
+
+    The delay is clamped to `MAX_RETRY_AFTER`, so a misconfigured server
+    cannot pause every request for hours.
+    """
+    if not value:
+        return None
+    try:
+        delay = max(0.0, float(value))
+    except ValueError:
+        try:
+            delay = max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    if delay > MAX_RETRY_AFTER:
+        print(f"\nRetry-After of {delay:.0f}s clamped to {MAX_RETRY_AFTER:.0f}s")
+        return MAX_RETRY_AFTER
+    return delay
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry attempt (0-based)."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
@@ -0,0 +1,383 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Local HTTP read API over the scraped units with
+                        precomputed responses, ETags and gzip
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+
+Endpoints (GET and HEAD):
+    /                                    name and version of the API, units loaded
+    /units?civilization=&age=&unit_type=&trained_at=&name=&offset=&limit=
+    /units/<name>                        units with a normalized name (e.g. 'musketeer'), a list
+                                         as a name can appear in several pages
+    /civilizations                       normalized civilization names
+    /civilizations/<civilization>/units  units of a civilization
+    POST /admin/reload                   reload the units file now (if SHOW_ADMIN_ROUTES, off by default)
+"""
+
+import functools
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+if __name__ == "__main__":
+    # Run as a script (python src/read_api.py): `src` is imported from the project root
+    sys.path.append(os.path.abspath("."))
+
+from config.settings import settings
+from src.scrap_infobox import norm_string
+from src.unit_store import INDEXED_FIELDS, UnitStore
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Filtered listings kept in memory per snapshot of the units
+MAX_CACHED_QUERIES = 1024
+
+# Smaller bodies are sent uncompressed, gzip would not pay off
+MIN_GZIP_SIZE = 1024
+
+# Seconds between two checks of the units file
+DEFAULT_RELOAD_INTERVAL = 5.0
+
+# Largest request body read and discarded to keep the connection alive
+MAX_DISCARDED_BODY = 64 * 1024
+
+QUERY_FILTERS = ("name", *INDEXED_FIELDS)
+
+
+class Response:
+    """
+    Body of a response serialized once, with its strong ETag
+
+    The gzip copy is compressed on the first request that accepts it and has
+    its own ETag, as it is another representation of the same resource.
+    """
+
+    def __init__(self, body, status=HTTPStatus.OK):
+        self.status = status
+        self.body = body
+        self.etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        self.gzip_etag = f'{self.etag[:-1]}-gzip"'
+        self._gzip_body = None
+
+    @property
+    def gzip_body(self):
+        if self._gzip_body is None:
+            # mtime=0: the same body always gives the same bytes
+            self._gzip_body = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzip_body
+
+    def matches(self, if_none_match) -> bool:
+        """Checks the If-None-Match header (weak comparison, as required for it)."""
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return self.etag in tags or self.gzip_etag in tags
+
+
+def json_response(data, status=HTTPStatus.OK) -> Response:
+    return Response(json.dumps(data, ensure_ascii=False).encode("utf-8"), status)
+
+
+def error_response(status, message) -> Response:
+    return json_response({"error": message}, status)
+
+
+class UnitsSnapshot:
+    """
+    Read-only view of one version of the units file and its responses
+
+    Every unit is serialized once; the listings are built by joining those
+    bytes. The responses of the units, of the civilizations and of the
+    filtered listings are kept, so a repeated request costs a dict lookup.
+    A new scrape gives a new snapshot, nothing here is modified after it is
+    built.
+
+    Parameters:
+    ---
+    store (UnitStore):
+        Units and their indexes
+    signature (tuple):
+        (size, modification time) of the units file the snapshot was read from
+    """
+
+    def __init__(self, store, signature=None):
+        self.store = store
+        self.signature = signature
+        self.loaded = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        self.unit_bodies = [json.dumps(unit, ensure_ascii=False).encode("utf-8") for unit in store.units]
+
+        # Every unit of a name, as `UnitStore.get`
+        self.unit_responses = {
+            name: Response(b"[" + b", ".join(self.unit_bodies[position] for position in positions) + b"]")
+            for name, positions in store.by_name.items()
+        }
+        self.index_response = json_response({
+            "name": settings.PROJECT_NAME,
+            "version": settings.PROJECT_VERSION,
+            "units": len(store),
+            "loaded": self.loaded,
+        })
+        self.civilizations_response = json_response(store.values("civilization"))
+
+        self.listing = functools.lru_cache(maxsize=MAX_CACHED_QUERIES)(self._listing)
+        # The unfiltered first page is the most requested one
+        self.listing((), 0, DEFAULT_PAGE_SIZE)
+
+    def _listing(self, filters, offset, limit) -> Response:
+        """Page of the units matching the filters ((field, value) pairs)."""
+        positions = self.store.query_positions(**dict(filters))
+        page = positions[offset:offset + limit]
+        header = json.dumps({"total": len(positions), "offset": offset, "limit": limit})
+        body = b"".join([
+            header[:-1].encode("utf-8"),
+            b', "units": [',
+            b", ".join(self.unit_bodies[position] for position in page),
+            b"]}",
+        ])
+        return Response(body)
+
+
+def _listing_response(snapshot, params, filters=()) -> Response:
+    """Page of a listing, `params` are the query parameters of the request."""
+    try:
+        offset = int(params.pop("offset", 0))
+        limit = int(params.pop("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return error_response(HTTPStatus.BAD_REQUEST, "offset and limit must be integers")
+    if offset < 0 or not 0 < limit <= MAX_PAGE_SIZE:
+        return error_response(HTTPStatus.BAD_REQUEST, f"offset must be 0 or more and limit between 1 and {MAX_PAGE_SIZE}")
+
+    unknown = params.keys() - set(QUERY_FILTERS)
+    if unknown:
+        return error_response(HTTPStatus.BAD_REQUEST, f"Unknown filters: {', '.join(sorted(unknown))}")
+
+    filters = {**params, **dict(filters)}
+    return snapshot.listing(tuple(sorted(filters.items())), offset, limit)
+
+
+def route(snapshot, path, query) -> Response:
+    """Response of a GET request, from the precomputed ones when possible."""
+    parts = [unquote(part) for part in path.strip("/").split("/")] if path.strip("/") else []
+    params = dict(parse_qsl(query))
+
+    if not parts:
+        return snapshot.index_response
+
+    if parts[0] == "units" and len(parts) == 1:
+        return _listing_response(snapshot, params)
+
+    if parts[0] == "units" and len(parts) == 2:
+        response = snapshot.unit_responses.get(norm_string(parts[1]))
+        return response or error_response(HTTPStatus.NOT_FOUND, f"Unit not found: {parts[1]}")
+
+    if parts[0] == "civilizations" and len(parts) == 1:
+        return snapshot.civilizations_response
+
+    if parts[0] == "civilizations" and len(parts) == 3 and parts[2] == "units":
+        return _listing_response(snapshot, params, [("civilization", parts[1])])
+
+    return error_response(HTTPStatus.NOT_FOUND, f"Not found: {path}")
+
+
+def _accepts_gzip(accept_encoding) -> bool:
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+class UnitsRequestHandler(BaseHTTPRequestHandler):
+    # Keep-alive connections: a client does not pay a TCP handshake per request
+    protocol_version = "HTTP/1.1"
+    server_version = "aoe3de-read-api"
+    # Headers and body are written separately, with Nagle the body would wait for the ACK of the headers
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_POST(self):
+        self._discard_body()
+        if urlsplit(self.path).path.rstrip("/") == "/admin/reload" and settings.SHOW_ADMIN_ROUTES:
+            reloaded = self.server.reload(force=True)
+            self._send(json_response({"reloaded": reloaded, "units": len(self.server.snapshot.store)}))
+        else:
+            self._send(error_response(HTTPStatus.NOT_FOUND, f"Not found: {self.path}"))
+
+    def _discard_body(self):
+        """
+        Reads the unused body of the request, so the next request of the
+        connection is read from its first line. A body that cannot be read
+        whole closes the connection after the response.
+        """
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if "Transfer-Encoding" in self.headers or not 0 <= length <= MAX_DISCARDED_BODY:
+            self.close_connection = True
+            return
+        self.rfile.read(length)
+
+    def _representation(self, response) -> tuple:
+        """Returns the (body, ETag, gzip) of the response negotiated with the Accept-Encoding of the request."""
+        if len(response.body) >= MIN_GZIP_SIZE and _accepts_gzip(self.headers.get("Accept-Encoding", "")):
+            return response.gzip_body, response.gzip_etag, True
+        return response.body, response.etag, False
+
+    def _respond(self, send_body):
+        # The snapshot is read once: a reload during the request does not mix two versions
+        snapshot = self.server.snapshot
+        url = urlsplit(self.path)
+        response = route(snapshot, url.path, url.query)
+
+        if response.status == HTTPStatus.OK and response.matches(self.headers.get("If-None-Match", "")):
+            # Same validators as the 200 of this request would have
+            _, etag, _ = self._representation(response)
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        self._send(response, send_body)
+
+    def _send(self, response, send_body=True):
+        body, etag, use_gzip = self._representation(response)
+
+        self.send_response(response.status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if response.status == HTTPStatus.OK:
+            self.send_header("ETag", etag)
+            # Clients keep the response but revalidate it, getting a 304 while it is unchanged
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # One line per request would cost more than building most responses
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+
+class UnitsApiServer(ThreadingHTTPServer):
+    """
+    HTTP server of the read API
+
+    The units file is checked every `reload_interval` seconds; when it
+    changes a new snapshot is built aside and swapped in with one
+    assignment, so requests see the old or the new units, never a mix.
+
+    Parameters:
+    ---
+    address (tuple):
+        (host, port) to listen on, port 0 for a free one
+    units_file (str):
+        JSON output file of the scraper
+    reload_interval (float):
+        Seconds between two checks of the units file, None to only reload
+        through `reload` or the admin route
+    access_log (bool):
+        Print a line per request
+    """
+
+    daemon_threads = True
+    # The default backlog (5) drops connections under load
+    request_queue_size = 128
+
+    def __init__(self, address, units_file, reload_interval=DEFAULT_RELOAD_INTERVAL, access_log=False):
+        self.units_file = units_file
+        self.access_log = access_log
+        self._reload_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self.snapshot = None
+        if not self.reload(force=True):
+            raise ValueError(f"The units file could not be loaded: {units_file}")
+        super().__init__(address, UnitsRequestHandler)
+
+        if reload_interval:
+            threading.Thread(target=self._watch, args=(reload_interval,), daemon=True).start()
+
+    def _signature(self):
+        stat = os.stat(self.units_file)
+        return stat.st_size, stat.st_mtime_ns
+
+    def reload(self, force=False) -> bool:
+        """
+        Build a new snapshot if the units file changed (always with `force`)
+
+        Returns:
+        ---
+        bool:
+            True if a new snapshot is served. On an error the previous one is kept
+        """
+        with self._reload_lock:
+            try:
+                signature = self._signature()
+                if not force and self.snapshot is not None and signature == self.snapshot.signature:
+                    return False
+                snapshot = UnitsSnapshot(UnitStore.load(self.units_file), signature)
+            except Exception as e:
+                # Any error of a file being rewritten or of its records (e.g. a unit without a name)
+                # must not stop the watcher thread
+                print(
+                    "The units file could not be reloaded, the previous units are kept: "
+                    f"{type(e).__name__}: {e}"
+                )
+                return False
+            self.snapshot = snapshot
+            return True
+
+    def _watch(self, interval):
+        while not self._stopped.wait(interval):
+            self.reload()
+
+    def server_close(self):
+        self._stopped.set()
+        super().server_close()
+
+
+def serve_units(units_file, host="127.0.0.1", port=8000, reload_interval=DEFAULT_RELOAD_INTERVAL, access_log=False):
+    """Serves the read API until interrupted."""
+    with UnitsApiServer((host, port), units_file, reload_interval, access_log) as server:
+        print(f"{settings.PROJECT_NAME} {settings.PROJECT_VERSION}: serving {units_file} on http://{host}:{server.server_port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    UNITS_FILE = "data/units.json"
+
+    serve_units(UNITS_FILE)
@@ -14,20 +14,64 @@
 ╚═════════════════════════════════════════════════════════════════════╝
 """
 
+import time
 from pathlib import Path
 
 import requests
 from bs4.element import Tag
 
+from src import metrics
+from src.constants import WARNINGS_KEY
+from src.icons import sanitize_icon_name
+
 
 def norm_string(s):
     return s.strip().replace(" ", "_").lower()
 
 
+def is_game_infobox(infobox: Tag, target_game: str) -> bool:
+    """Checks if the infobox belongs to the target game."""
+    game_div = infobox.find("div", class_="pi-data-value")
+
+    if not game_div:
+        return False
+
+    return target_game in game_div.text.strip()
+
+
+def index_unit_infoboxes(infoboxes, target_game="Age of Empires III") -> dict:
+    """
+    Index the infoboxes of the target game by normalized unit name
+
+    The index can be passed to `find_unit_infobox` instead of the list, so
+    several units can be searched without scanning every infobox each time.
+    """
+    index = {}
+
+    for infobox in infoboxes:
+        if not is_game_infobox(infobox, target_game):
+            continue
+
+        unit_name = infobox.find("h2")
+        if not unit_name:
+            continue
+
+        # The first infobox of a unit wins, as in the linear search
+        index.setdefault(norm_string(unit_name.text), infobox)
+
+    return index
+
+
 def find_unit_infobox(unit_to_search, infoboxes):
 
     TARGET_GAME = "Age of Empires III"
 
+    # Index built with `index_unit_infoboxes`
+    if isinstance(infoboxes, dict):
+        if unit_to_search not in infoboxes:
+            raise ValueError("Infobox not found")
+        return infoboxes[unit_to_search]
+
     for infobox in infoboxes:
 
         game_div = infobox.find("div", class_="pi-data-value")
@@ -54,18 +98,27 @@ def find_unit_infobox(unit_to_search, infoboxes):
     raise ValueError("Infobox not found")
 
 
-def download_unit_icon(infobox: Tag, img_path: str):
-    """Downloads the icon of the unit."""
+def get_unit_icon(infobox: Tag):
+    """Returns the (icon name, icon URL) of the unit, or None if the infobox has no icon."""
     # Find the icon image element in the infobox element
     icon = infobox.find("img", class_="pi-image-thumbnail", alt="Definitive")
-    if icon and icon.has_attr("src"):
-        # Fetch the icon image URL
-        icon_url = icon["src"]
+    if icon and icon.has_attr("src") and icon.has_attr("data-image-name"):
+        # Get the icon name from the 'data-image-name' attribute
+        icon_name = icon["data-image-name"].replace(" ", "_").lower()
+        return icon_name, icon["src"]
+    return None
+
+
+def download_unit_icon(infobox: Tag, img_path: str):
+    """Downloads the icon of the unit."""
+    icon = get_unit_icon(infobox)
+    if icon:
+        icon_name, icon_url = icon
         try:
+            # The name comes from the page, it must not point outside the images folder
+            icon_name = sanitize_icon_name(icon_name)
             # Download the icon image
             icon_data = requests.get(icon_url).content
-            # Get the icon name from the 'data-image-name' attribute
-            icon_name = icon["data-image-name"].replace(" ", "_").lower()
             # Save the icon image to the images folder
             with open(Path(img_path) / icon_name, "wb") as file:
                 file.write(icon_data)
@@ -74,172 +127,267 @@ def download_unit_icon(infobox: Tag, img_path: str):
             print(f"Error al descargar la imagen: {e}")
 
 
-def extract_item_vals(item, item_type: str):
+# Declarative extraction schema: item type -> infobox labels of that type
+ITEM_TYPES = {
+    "text": [
+        "Ability",
+        "Area of Effect",
+        "Auto gather",
+        "Bonus damage",
+        "Banner army",
+        "Garrison",
+        "Gatherers",
+        "Hit points",
+        "Healing",
+        "Introduced in",
+        "Kill XP",
+        "Line of Sight",
+        "Pronunciation",
+        "Range",
+        "Rate of Fire",
+        "Regeneration",
+        "Resource amount",
+        "Required Home City Card",
+        "Requires",
+        "Special ability",
+        "Speed",
+        "Train limit",
+        "Train XP",
+        "XP kill bounty",
+        "XP train bounty",
+    ],
+    "list": [
+        "Age",
+        "Civilization(s)",
+        "Fatten rate",
+        "Trained at",
+        "Type",
+    ],
+    "dict": [
+        # "Bonus damage",
+        "Cost",
+        "Damage",
+        "Fatten rate",
+        "Resistance",
+        "Resource bounty",
+        "Train time",
+    ],
+    "ignore": ["Internal name", "Size", "Use"],
+}
+
+
+def extract_text_vals(item):
+    return item.text.strip()
+
+
+def extract_list_vals(item):
+    full_text = ""
+    vals = []
+    for child in item.children:
+        if child.name == "br":
+            if full_text:
+                vals.append(full_text.strip())
+                full_text = ""
+        else:
+            full_text += child.text
+    if full_text:
+        vals.append(full_text.strip())
+    return vals
+
+
+def extract_dict_vals(item):
+    grouped_tags = []
+    current_group = []
+
+    for child in item.children:
+        # Saltar etiquetas con class="image"
+        if isinstance(child, Tag) and "image" in (child.get("class") or []):
+            continue
 
-    if item_type == "text":
-        vals = item.text.strip()
-        return vals
-
-    if item_type == "list":
-        full_text = ""
-        vals = []
-        for child in item.children:
-            if child.name == "br":
-                if full_text:
-                    vals.append(full_text.strip())
-                    full_text = ""
-            else:
-                full_text += child.text
-        if full_text:
-            vals.append(full_text.strip())
-        return vals
-
-    elif item_type == "dict":
-        grouped_tags = []
-        current_group = []
-
-        for child in item.children:
-            # Saltar etiquetas con class="image"
-            if isinstance(child, Tag) and "image" in (child.get("class") or []):
-                continue
-
-            if child.name == "br":
-                # Agregar grupo si tiene elementos
-                if current_group:
-                    grouped_tags.append(current_group)
-                    current_group = []
-            else:
-                # Añadir texto no vacío
-                text = child.text.strip()
-                if text:
-                    current_group.append(text)
-
-        # Agregar el último grupo si no está vacío
-        if current_group:
-            grouped_tags.append(current_group)
-
-        # Crear diccionario con la información identificada
-        vals = {}
-        for group in grouped_tags:
-            try:
-                vals[group[1]] = group[0]
-            except IndexError:
-                raise ValueError(f"Error extracting dictionary values, present values: {current_group}")
-                
-        return vals
-
-    elif item_type == "ignore":
-        return None
+        if child.name == "br":
+            # Agregar grupo si tiene elementos
+            if current_group:
+                grouped_tags.append(current_group)
+                current_group = []
+        else:
+            # Añadir texto no vacío
+            text = child.text.strip()
+            if text:
+                current_group.append(text)
+
+    # Agregar el último grupo si no está vacío
+    if current_group:
+        grouped_tags.append(current_group)
+
+    # Crear diccionario con la información identificada
+    vals = {}
+    for group in grouped_tags:
+        try:
+            vals[group[1]] = group[0]
+        except IndexError:
+            raise ValueError(f"Error extracting dictionary values, present values: {current_group}")
+            
+    return vals
+
+
+# Item type -> function that extracts its values, "ignore" items are skipped
+ITEM_HANDLERS = {
+    "text": extract_text_vals,
+    "list": extract_list_vals,
+    "dict": extract_dict_vals,
+    "ignore": None,
+}
+
+
+def compile_schema(item_types: dict) -> dict:
+    """
+    Compile the extraction schema into a label -> handler table
 
-    else:
+    The handler of an "ignore" label is None. A label listed under several
+    types keeps the first one (e.g. "Fatten rate" is extracted as a list).
+    """
+    label_handlers = {}
+    for item_type, labels in item_types.items():
+        if item_type not in ITEM_HANDLERS:
+            raise ValueError(f"Invalid item type: {str(item_type)}")
+        for label in labels:
+            label_handlers.setdefault(label, ITEM_HANDLERS[item_type])
+    return label_handlers
+
+
+LABEL_HANDLERS = compile_schema(ITEM_TYPES)
+
+
+def extract_item_vals(item, item_type: str):
+
+    if item_type not in ITEM_HANDLERS:
         raise ValueError(f"Invalid item type: {str(item_type)}")
 
+    handler = ITEM_HANDLERS[item_type]
+    if handler is None:
+        return None
+    return handler(item)
+
 
 def get_item_type(val: str) -> str:
-    item_types = {
-        "text": [
-            "Ability",
-            "Area of Effect",
-            "Auto gather",
-            "Bonus damage",
-            "Banner army",
-            "Garrison",
-            "Gatherers",
-            "Hit points",
-            "Healing",
-            "Introduced in",
-            "Kill XP",
-            "Line of Sight",
-            "Pronunciation",
-            "Range",
-            "Rate of Fire",
-            "Regeneration",
-            "Resource amount",
-            "Required Home City Card",
-            "Requires",
-            "Special ability",
-            "Speed",
-            "Train limit",
-            "Train XP",
-            "XP kill bounty",
-            "XP train bounty",
-        ],
-        "list": [
-            "Age",
-            "Civilization(s)",
-            "Fatten rate",
-            "Trained at",
-            "Type",
-        ],
-        "dict": [
-            # "Bonus damage",
-            "Cost",
-            "Damage",
-            "Fatten rate",
-            "Resistance",
-            "Resource bounty",
-            "Train time",
-        ],
-        "ignore": ["Internal name", "Size", "Use"],
-    }
-    for key, values in item_types.items():
-        if val in values:
-            return key
+    for item_type, labels in ITEM_TYPES.items():
+        if val in labels:
+            return item_type
     return None
 
 
-def extract_block_data(block: Tag) -> dict:
-    """Extracts the data from a block of the infobox."""
+def _is_item_row(tag) -> bool:
+    return tag.name == "div" and "pi-item" in (tag.get("class") or [])
 
-    rows = block.find_all("div", class_="pi-item", recursive=False)
-    data = {}
 
-    for row in rows:
+def _get_row_parts(row: Tag) -> tuple:
+    """Returns the label (h3) and value (div.pi-data-value) elements of a row."""
+    h3 = None
+    item = None
+    for child in row.children:
+        if not isinstance(child, Tag):
+            continue
+        if h3 is None and child.name == "h3":
+            h3 = child
+        elif item is None and child.name == "div" and "pi-data-value" in (child.get("class") or []):
+            item = child
+
+    # Rows whose elements are not direct children
+    if h3 is None:
         h3 = row.find("h3")
+    if item is None:
+        item = row.find("div", class_="pi-data-value")
+    return h3, item
+
+
+def extract_block_data(block: Tag, warnings: list = None) -> dict:
+    """
+    Extracts the data from a block of the infobox.
+
+    Unknown labels raise a ValueError, unless a `warnings` list is given: in
+    that case they are recorded in it and the row is skipped.
+    """
+
+    data = {}
+    # Extraction time of each label, recorded at the end of the block when the detailed timings are enabled
+    label_timings = [] if metrics.detailed_timings else None
+
+    for row in block.children:
+        if not isinstance(row, Tag) or not _is_item_row(row):
+            continue
+
+        h3, item = _get_row_parts(row)
         if h3 is None:
             continue
         label = h3.text
-        item = row.find("div", class_="pi-data-value")
-
-        item_type = get_item_type(label)
 
-        if item_type == "ignore":
+        if label not in LABEL_HANDLERS:
+            metrics.inc("unknown_labels_total", label=label)
+            if warnings is None:
+                raise ValueError(f"Item type not found for label: '{label}'")
+            warnings.append(f"Item type not found for label: '{label}'")
             continue
 
-        if item_type is None:
-            raise ValueError(f"Item type not found for label: '{label}'")
+        handler = LABEL_HANDLERS[label]
+        if handler is None:
+            continue
 
+        if label_timings is not None:
+            start_time = time.perf_counter()
         try:
-            values = extract_item_vals(item, item_type)
+            values = handler(item)
         except ValueError as e:
             raise ValueError(f"\nError extracting values for label '{label}': {e}")
+        if label_timings is not None:
+            label_timings.append((label, time.perf_counter() - start_time))
 
         # Fill the block data dictionary with the label and its values
         data[label] = values
 
+    if label_timings:
+        metrics.get_registry().observe_many("extract_label_seconds", "label", label_timings)
+
     return data
 
 
-def extract_unit_data(infobox: Tag) -> dict:
+def _iter_sections(tag: Tag):
+    """Yields the sections under the tag in document order, as `find_all("section")`."""
+    for child in tag.children:
+        if not isinstance(child, Tag):
+            continue
+        if child.name == "section":
+            yield child
+        yield from _iter_sections(child)
 
-    # Sections correspond to Groups of information Information, Training, Statistics, etc.
-    blocks = infobox.find_all("section")
+
+def extract_unit_data(infobox: Tag) -> dict:
 
     unit_name = infobox.find("h2").text.strip()
     
     unit_data = {}
     unit_data["name"] = unit_name
+    warnings = []
 
-    for block in blocks:
+    # Sections correspond to Groups of information Information, Training, Statistics, etc.
+    for block in _iter_sections(infobox):
         block_title = block.find("h2").text.strip()
 
+        block_warnings = []
         try:
-            block_data = extract_block_data(block)
+            if metrics.detailed_timings:
+                with metrics.timer("extract_block_seconds", block=block_title):
+                    block_data = extract_block_data(block, block_warnings)
+            else:
+                block_data = extract_block_data(block, block_warnings)
         except ValueError as e:
             raise ValueError(f"\nError extracting data form block '{block_title}' in infobox '{unit_name}': {e}")
-            continue
+
+        warnings.extend(f"Block '{block_title}': {warning}" for warning in block_warnings)
 
         # Fill the unit data dictionary with the block title and its data
         unit_data[block_title] = block_data
 
+    if warnings:
+        unit_data[WARNINGS_KEY] = warnings
+
     return unit_data
\ No newline at end of file
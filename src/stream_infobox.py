@@ -0,0 +1,142 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Low-memory infobox extraction that tokenizes the
+                        page and only builds the infobox elements
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import tracemalloc
+from html.parser import HTMLParser
+
+from src.parsers import make_soup
+from src.scrap_infobox import is_game_infobox
+
+# Size of the chunks fed to the tokenizer when the page is given as a string
+CHUNK_SIZE = 64 * 1024
+
+
+class InfoboxTokenizer(HTMLParser):
+    """
+    Tokenizer that keeps only the markup of the `aside.portable-infobox` elements.
+
+    The rest of the page is discarded as it is tokenized, so no tree of the
+    whole page is ever built. The markup of each infobox is available in
+    `fragments` once its closing tag has been read.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.fragments = []
+        self._buffer = None
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self._buffer is None:
+            if tag != "aside":
+                return
+            classes = (dict(attrs).get("class") or "").split()
+            if "portable-infobox" not in classes:
+                return
+            self._buffer = []
+            self._depth = 0
+
+        if tag == "aside":
+            self._depth += 1
+        self._buffer.append(self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        if self._buffer is not None:
+            self._buffer.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if self._buffer is None:
+            return
+        self._buffer.append(f"</{tag}>")
+        if tag == "aside":
+            self._depth -= 1
+            if self._depth == 0:
+                self.fragments.append("".join(self._buffer))
+                self._buffer = None
+
+    def handle_data(self, data):
+        if self._buffer is not None:
+            self._buffer.append(data)
+
+    def handle_entityref(self, name):
+        if self._buffer is not None:
+            self._buffer.append(f"&{name};")
+
+    def handle_charref(self, name):
+        if self._buffer is not None:
+            self._buffer.append(f"&#{name};")
+
+
+def iter_infobox_fragments(chunks):
+    """
+    Yield the markup of each infobox of a page
+
+    Parameters:
+    ---
+    chunks (str | iterable):
+        HTML of the page, as a string or as an iterable of text chunks (e.g.
+        `response.iter_content(decode_unicode=True)`)
+
+    Yields:
+    ---
+    str:
+        Markup of an infobox
+    """
+    if isinstance(chunks, str):
+        page_html = chunks
+        chunks = (page_html[i:i + CHUNK_SIZE] for i in range(0, len(page_html), CHUNK_SIZE))
+
+    tokenizer = InfoboxTokenizer()
+    for chunk in chunks:
+        tokenizer.feed(chunk)
+        yield from tokenizer.fragments
+        tokenizer.fragments.clear()
+    tokenizer.close()
+    yield from tokenizer.fragments
+
+
+def stream_infoboxes(chunks, target_game) -> list:
+    """Returns the infoboxes of the target game, building only their elements."""
+    valid_infoboxes = []
+    for fragment in iter_infobox_fragments(chunks):
+        infobox = make_soup(fragment).find("aside")
+        if infobox is not None and is_game_infobox(infobox, target_game):
+            valid_infoboxes.append(infobox)
+    return valid_infoboxes
+
+
+def measure_peak_memory(func, *args, **kwargs) -> tuple:
+    """
+    Run a function and measure the peak of memory allocated by it
+
+    Returns:
+    ---
+    tuple:
+        (result, peak bytes)
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        result = func(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, peak
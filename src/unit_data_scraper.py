@@ -17,107 +17,599 @@
 import json
 import os
 import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 
-project_path = os.path.abspath(".")
-
-sys.path.append(project_path)
+if __name__ == "__main__":
+    # Run as a script (python src/unit_data_scraper.py): `src` is imported from the project root
+    sys.path.append(os.path.abspath("."))
 
-from bs4 import BeautifulSoup as bs
 from tqdm import tqdm
 
-from src.scrap_infobox import extract_unit_data
-from src.utils import fetch_page_content, get_section_hrefs
+from src import metrics
+from src.frontier import CrawlFrontier
+from src.http_cache import DEFAULT_MAX_BYTES, ResponseCache
+from src.memory_budget import ByteBudget, peak_rss_bytes
+from src.incremental import (
+    empty_manifest,
+    get_unchanged_records,
+    load_manifest,
+    page_fingerprint,
+    save_manifest,
+)
+from src.mediawiki_api import fetch_parsed_content, fetch_revisions, get_api_url, iter_api_pages, title_from_url
+from src.ndjson_writer import DEFAULT_CHECKPOINT_EVERY, CheckpointedWriter, finalize_ndjson, read_ndjson
+from src.parsers import (
+    CONTENT_STRAINER,
+    INFOBOX_STRAINER,
+    count_live_trees,
+    get_parser_backend,
+    make_soup,
+    release_trees,
+    set_parser_backend,
+)
+from src.icons import IconHarvester
+from src.scrap_infobox import extract_unit_data, get_unit_icon, is_game_infobox
+from src.rate_limit import AdaptiveRateLimiter
+from src.stream_infobox import measure_peak_memory, stream_infoboxes
+from src.urls import canonicalize_url
+from src.utils import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_PER_HOST_LIMIT,
+    clear_fetch_failures,
+    fetch_page_content,
+    get_fetch_failures,
+    get_sections_hrefs,
+    iter_pages_content,
+    set_rate_limiter,
+    set_response_cache,
+)
+
+
+# Fetch backends: rendered pages ("html") or MediaWiki api.php ("api")
+FETCH_BACKENDS = ["html", "api"]
+UNITS_LIST_PAGE = "Unit_(Age_of_Empires_III)"
 
 
 def norm_string(s):
     return s.strip().replace(" ", "_").lower()
 
 
-def get_units_urls(url) -> list:
+def get_units_urls(url, fetch_backend="html") -> list:
     
-    units_url = url + "wiki/Unit_(Age_of_Empires_III)"
-    unit_list_html = fetch_page_content(units_url)
-    href_soup = bs(unit_list_html, "html.parser")
+    units_url = url + "wiki/" + UNITS_LIST_PAGE
+    if fetch_backend == "api":
+        unit_list_html = fetch_parsed_content(get_api_url(url), UNITS_LIST_PAGE)
+    else:
+        unit_list_html = fetch_page_content(units_url)
+    if unit_list_html is None:
+        raise ValueError(f"No content was obtained for url '{units_url}'")
 
-    content = href_soup.find('div', class_='mw-parser-output')
-    h2s = content.find_all('h2', recursive=False)
-    sections = [h2.find('span', class_='mw-headline', recursive=False).text for h2 in h2s]
-    # section_unit_hrefs = {section: get_units_hrefs(section, content) for section in sections}
-    units_urls = [
-        url + href
-        for section in sections
-        for href in get_section_hrefs(section, content).values()
-    ]
+    with metrics.timer("unit_list_parse_seconds"), metrics.profile_stage("parse"):
+        href_soup = make_soup(unit_list_html, CONTENT_STRAINER)
 
-    return units_urls
+        content = href_soup.find('div', class_='mw-parser-output')
+        # Every section is read in one pass, a unit linked from several sections is kept once
+        units_urls = [
+            canonicalize_url(url, href)
+            for section_hrefs in get_sections_hrefs(content).values()
+            for href in section_hrefs.values()
+        ]
+        release_trees([href_soup])
 
+    return list(dict.fromkeys(units_urls))
 
-def get_infoboxes(url, target_game):
 
-    try:
+def parse_infoboxes(unit_html, target_game):
+    """Parses the HTML of a unit page and returns the infoboxes of the target game."""
 
-        unit_html = fetch_page_content(url)
-        unit_soup = bs(unit_html, "html.parser")
-        infoboxes = unit_soup.find_all("aside", class_="portable-infobox")
+    unit_soup = make_soup(unit_html, INFOBOX_STRAINER)
+    infoboxes = unit_soup.find_all("aside", class_="portable-infobox")
+
+    game_infoboxes = [infobox for infobox in infoboxes if is_game_infobox(infobox, target_game)]
+    if not game_infoboxes:
+        release_trees([unit_soup])
+    return game_infoboxes
 
-        valid_infoboxes = []
-        for infobox in infoboxes:
-            
-            game_div = infobox.find("div", class_="pi-data-value")
-            
-            if not game_div:
-                continue
 
-            game = game_div.text.strip()
+def get_infoboxes(url, target_game):
 
-            if target_game in game:
-                valid_infoboxes.append(infobox)
+    try:
 
-        return valid_infoboxes
+        unit_html = fetch_page_content(url)
+        if unit_html is None:
+            raise ValueError(f"No content was obtained for url '{url}'")
+        return parse_infoboxes(unit_html, target_game)
 
     except Exception as e:
         raise Exception(f"Error: {e}")
 
 
 def export_units_data(data, filename):
-    with open(filename, 'w') as file:
+    # Written aside and renamed, so readers of the file never see a partial scrape
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, 'w') as file:
         json.dump(data, file, indent=4)
+    os.replace(tmp_filename, filename)
     print(f"Data saved in {filename}")
 
 
-def scrape_units_data(url, output_file):
+def iter_units_pages(units_urls, workers=1, per_host_limit=DEFAULT_PER_HOST_LIMIT, byte_budget=None):
+    """
+    Get the HTML of every unit URL
+
+    With `workers` greater than 1 the pages are downloaded concurrently, the
+    pages are still yielded in the order of `units_urls`. A `byte_budget`
+    caps the size of the pages downloaded ahead, sequential downloads
+    included.
+
+    Yields:
+    ---
+    tuple:
+        Pairs (url, html) for each unit URL, html is None if the page could
+        not be fetched
+    """
+    yield from iter_pages_content(units_urls, workers, per_host_limit, byte_budget)
+
+
+def extract_page_units(url, unit_html, target_game, streaming=False, icons=None) -> list:
+    """
+    Extracts the data of every unit of the target game present in a page.
+
+    With `streaming` the page is tokenized and only the infoboxes are built,
+    instead of the tree of the whole page. When an `icons` list is given, the
+    (icon name, icon URL) of each unit is appended to it.
+    """
+
+    try:
+        with metrics.timer("parse_seconds", mode="streaming" if streaming else "dom"), metrics.profile_stage("parse"):
+            if streaming:
+                infoboxes = stream_infoboxes(unit_html, target_game)
+            else:
+                infoboxes = parse_infoboxes(unit_html, target_game)
+    except Exception as e:
+        metrics.record_error("parse", "markup", type(e).__name__, url, str(e))
+        raise Exception(f"Error: {e}")
+
+    units = []
+    for infobox in infoboxes:
+        try:
+            with metrics.timer("extract_unit_seconds"), metrics.profile_stage("extract"):
+                units.append(extract_unit_data(infobox))
+        except Exception as e:
+            metrics.record_error("extract", "markup", type(e).__name__, url, str(e).strip())
+            print(f"\nExtraction error for url '{url}': {e}")
+            continue
+        if icons is not None:
+            icon = get_unit_icon(infobox)
+            if icon:
+                icons.append(icon)
+
+    # Memory-bounded mode: the records are plain dicts, the tree is not needed anymore
+    release_trees(infoboxes)
+    return units
+
+
+def _extract_page(url, unit_html, target_game, streaming, with_icons, measure_memory=False) -> tuple:
+    """
+    Returns the (records, icons, metrics) of a page, as plain data that can
+    leave a worker process.
+
+    With `measure_memory` the peak of memory allocated to parse and extract
+    the page is observed in the `parse_peak_bytes` metric.
+    """
+    icons = [] if with_icons else None
+    with metrics.use_registry(metrics.MetricsRegistry()) as registry:
+        if measure_memory:
+            records, peak = measure_peak_memory(extract_page_units, url, unit_html, target_game, streaming, icons)
+            metrics.observe("parse_peak_bytes", peak, mode="streaming" if streaming else "dom")
+        else:
+            records = extract_page_units(url, unit_html, target_game, streaming, icons)
+    return records, icons or [], registry.snapshot()
+
+
+def _init_parse_process(parser_backend, detailed_timings):
+    set_parser_backend(*parser_backend)
+    metrics.enable_detailed_timings(detailed_timings)
+
+
+def iter_units_records(
+    units_pages,
+    target_game,
+    manifest=None,
+    parse_processes=0,
+    streaming=False,
+    with_icons=False,
+    fingerprints=None,
+    measure_memory=False,
+):
+    """
+    Extract the units data of every fetched page
+
+    With `parse_processes` greater than 0 the pages are parsed in a process
+    pool while the next pages are still being downloaded. The records are
+    always yielded in the order of `units_pages`.
+
+    Parameters:
+    ---
+    units_pages (iterable):
+        Pairs (url, html) of the unit pages
+    target_game (str):
+        Game of the infoboxes to extract
+    manifest (dict):
+        Manifest of the previous run, pages whose content has not changed
+        reuse its records instead of being parsed again
+    parse_processes (int):
+        Number of processes used to parse the pages
+    streaming (bool):
+        Tokenize the pages and build only their infoboxes
+    with_icons (bool):
+        Collect the icons of the extracted units
+    fingerprints (dict):
+        Fingerprints of the pages known before fetching them (e.g. revision
+        ids from the API). Unchanged pages can then be yielded without HTML
+    measure_memory (bool):
+        Measure the peak memory of the extraction of each page (tracemalloc,
+        it slows the extraction down)
+
+    Yields:
+    ---
+    tuple:
+        (url, fingerprint, records, unchanged, icons) for each page. Records
+        is None when the page could not be fetched, icons is None for an
+        unchanged page whose icons are not in the manifest
+    """
+    if parse_processes <= 0:
+        for url, unit_html in units_pages:
+            yield _resolve(
+                _page_records(url, unit_html, target_game, manifest, streaming, with_icons, fingerprints, measure_memory)
+            )
+        return
+
+    # Bound the number of pages waiting to be parsed so the HTML does not pile up in memory
+    max_pending = parse_processes * 4
+    pending = deque()
+
+    # Workers use the same parser backend and metrics settings as the main process
+    with ProcessPoolExecutor(
+        max_workers=parse_processes,
+        initializer=_init_parse_process,
+        initargs=(get_parser_backend(), metrics.detailed_timings),
+    ) as executor:
+        for url, unit_html in units_pages:
+            pending.append(
+                _page_records(
+                    url, unit_html, target_game, manifest, streaming, with_icons, fingerprints, measure_memory, executor
+                )
+            )
+            while pending and (len(pending) > max_pending or _is_ready(pending[0])):
+                yield _resolve(pending.popleft())
+        while pending:
+            yield _resolve(pending.popleft())
+
+
+def _page_records(
+    url,
+    unit_html,
+    target_game,
+    manifest,
+    streaming=False,
+    with_icons=False,
+    fingerprints=None,
+    measure_memory=False,
+    executor=None,
+):
+    fingerprint = (fingerprints or {}).get(url)
+    if fingerprint is None and unit_html is not None and manifest is not None:
+        fingerprint = page_fingerprint(unit_html)
+
+    if manifest is not None:
+        records = get_unchanged_records(manifest, url, fingerprint)
+        # Unchanged pages give the icons kept in the manifest, so a new or cleaned icons folder is
+        # filled again. Pages saved before the icons were kept are extracted again to get them
+        icons = manifest["pages"][url].get("icons") if records is not None else None
+        if records is not None and (icons is not None or not with_icons or unit_html is None):
+            return url, fingerprint, (records, icons, None), True
+
+    if unit_html is None:
+        return url, None, (None, [], None), False
+
+    if executor is None:
+        extracted = _extract_page(url, unit_html, target_game, streaming, with_icons, measure_memory)
+    else:
+        extracted = executor.submit(_extract_page, url, unit_html, target_game, streaming, with_icons, measure_memory)
+    return url, fingerprint, extracted, False
+
+
+def _is_ready(page):
+    extracted = page[2]
+    return not isinstance(extracted, Future) or extracted.done()
+
+
+def _resolve(page):
+    url, fingerprint, extracted, unchanged = page
+    if isinstance(extracted, Future):
+        extracted = extracted.result()
+    records, icons, page_metrics = extracted
+    if page_metrics is not None:
+        metrics.get_registry().merge(page_metrics)
+    return url, fingerprint, records, unchanged, icons
+
+
+def scrape_units_data(
+    url,
+    output_file,
+    workers=1,
+    per_host_limit=DEFAULT_PER_HOST_LIMIT,
+    cache_dir=None,
+    cache_max_bytes=DEFAULT_MAX_BYTES,
+    offline=False,
+    manifest_file=None,
+    parse_processes=0,
+    parser_backend="html.parser",
+    restricted_parse=False,
+    streaming_parse=False,
+    stream_file=None,
+    resume=False,
+    checkpoint_every=DEFAULT_CHECKPOINT_EVERY,
+    finalize=True,
+    icons_dir=None,
+    rate_limit=None,
+    max_retries=DEFAULT_MAX_RETRIES,
+    fetch_backend="html",
+    metrics_file=None,
+    prometheus_file=None,
+    profile=None,
+    parquet_dir=None,
+    frontier_file=None,
+    refresh_frontier=False,
+    memory_budget=None,
+    measure_memory=False,
+):
 
     TARGET_GAME = "Age of Empires III"
 
-    print("Starting extraction process...")
+    # Memory-bounded mode: the pages downloaded ahead are capped and each tree is freed once extracted
+    byte_budget = ByteBudget(memory_budget) if memory_budget else None
+    set_parser_backend(parser_backend, restricted_parse, release_trees=byte_budget is not None)
+    max_live_trees = 0
 
-    units_urls = get_units_urls(url)
+    # Metrics of this run, exported when it ends
+    metrics.get_registry().reset()
+    metrics.enable_profiling(profile)
+    metrics.enable_detailed_timings(bool(metrics_file or prometheus_file))
 
-    print(f"{len(units_urls)} unit URLs available for scraping")
+    if offline and cache_dir is None:
+        raise ValueError("Offline mode requires a cache directory")
 
-    if not units_urls:
-        print("No unit URLs were obtained")
-    
-    print("Extracting data from the URLs...")
-    
-    data = []
-    for url in tqdm(units_urls, desc="Scraping", unit="units", colour="green"):
-        infoboxes = get_infoboxes(url, TARGET_GAME)
-        for infobox in infoboxes:
-            try:
-                unit_data = extract_unit_data(infobox)
-                data.append(unit_data)
-            except Exception as e:
-                print(f"\nExtraction error for url '{url}': {e}")
-    
-    print(f"Extracted data for {len(data)} units")
+    if fetch_backend not in FETCH_BACKENDS:
+        raise ValueError(f"Invalid fetch backend: {fetch_backend}")
+
+    if resume and stream_file is None:
+        raise ValueError("Resume mode requires a stream file")
+
+    if frontier_file is not None and stream_file is not None:
+        raise ValueError("The frontier keeps the scraped records, it cannot be combined with a stream file")
 
-    export_units_data(data, output_file)
+    # Incremental mode: pages whose content has not changed reuse their previous records
+    manifest = load_manifest(manifest_file) if manifest_file else None
+    new_manifest = empty_manifest()
+    unchanged_pages = 0
+
+    # Icons are downloaded in the background while the crawl goes on
+    icon_harvester = IconHarvester(icons_dir, workers) if icons_dir else None
+
+    # Streaming mode: units are appended to an NDJSON file instead of kept in memory
+    writer = CheckpointedWriter(stream_file, checkpoint_every, resume) if stream_file else None
+
+    # Pages that failed keep their records from the previous run; in streaming mode they are not
+    # written to the NDJSON file (nor checkpointed as done), so a resume retries them
+    fallback_records = []
+
+    # The cache and the rate limiter are used by the fetches of this call only
+    response_cache = ResponseCache(cache_dir, cache_max_bytes, offline) if cache_dir is not None else None
+    set_response_cache(response_cache)
+    # Requests per second to start with, adapted to the responses of the server
+    limiter = AdaptiveRateLimiter(rate_limit) if rate_limit else None
+    set_rate_limiter(limiter, max_retries)
+    clear_fetch_failures()
+
+    try:
+        # Frontier mode: the state of every URL is kept in SQLite, done pages are not scraped again
+        frontier = CrawlFrontier(frontier_file) if frontier_file else None
+
+        print("Starting extraction process...")
+
+        units_urls = get_units_urls(url, fetch_backend)
+
+        print(f"{len(units_urls)} unit URLs available for scraping")
+
+        if not units_urls:
+            print("No unit URLs were obtained")
+
+        if frontier is not None:
+            # Pages removed from the unit list leave the output. An empty list (e.g. a changed layout) removes nothing
+            removed_urls = frontier.retain(units_urls) if units_urls else 0
+            if refresh_frontier:
+                frontier.reset()
+            new_urls = frontier.add(units_urls)
+            units_urls = frontier.pending()
+            print(
+                f"Frontier: {new_urls} new URLs, {removed_urls} removed, {len(units_urls)} URLs pending"
+                + ("" if refresh_frontier else " (done pages are kept, refresh the frontier to scrape them again)")
+            )
+
+        if writer is not None and writer.done_urls:
+            print(f"Resuming: {len(writer.done_urls)} URLs were already scraped")
+            if manifest is not None:
+                for done_url in writer.done_urls & manifest["pages"].keys():
+                    new_manifest["pages"][done_url] = manifest["pages"][done_url]
+            units_urls = [unit_url for unit_url in units_urls if unit_url not in writer.done_urls]
+
+        print("Extracting data from the URLs...")
+
+        data = []
+        units_count = writer.units_written if writer is not None else 0
+        fingerprints = None
+        if fetch_backend == "api":
+            # Revision ids of every page in batched requests, unchanged pages are not fetched
+            revisions = fetch_revisions(get_api_url(url), [title_from_url(unit_url) for unit_url in units_urls])
+            fingerprints = {
+                unit_url: f"rev:{revisions[title_from_url(unit_url)]}"
+                for unit_url in units_urls
+                if title_from_url(unit_url) in revisions
+            }
+            skip_urls = set()
+            if manifest is not None:
+                skip_urls = {
+                    unit_url
+                    for unit_url, fingerprint in fingerprints.items()
+                    if get_unchanged_records(manifest, unit_url, fingerprint) is not None
+                }
+            units_pages = iter_api_pages(url, units_urls, workers, per_host_limit, skip_urls, byte_budget)
+        else:
+            units_pages = iter_units_pages(units_urls, workers, per_host_limit, byte_budget)
+        units_records = iter_units_records(
+            units_pages,
+            TARGET_GAME,
+            manifest,
+            parse_processes,
+            streaming_parse,
+            # The manifest keeps the icons of each page for the runs where it is unchanged
+            icon_harvester is not None or manifest is not None,
+            fingerprints,
+            measure_memory,
+        )
+        for url, fingerprint, records, unchanged, icons in tqdm(units_records, total=len(units_urls), desc="Scraping", unit="units", colour="green"):
+            if records is None:
+                print(f"\nNo content was obtained for url '{url}'")
+                if frontier is not None:
+                    frontier.mark_failed(url, get_fetch_failures().get(url, "No content was obtained"))
+                # Keep the records of the previous run for pages that could not be fetched
+                if manifest is None or url not in manifest["pages"]:
+                    continue
+                new_manifest["pages"][url] = manifest["pages"][url]
+                records = manifest["pages"][url]["records"]
+                if writer is not None:
+                    units_count += len(records)
+                    fallback_records.extend(records)
+                    continue
+            else:
+                if frontier is not None:
+                    frontier.mark_done(url, records)
+                if manifest is not None:
+                    unchanged_pages += unchanged
+                    new_manifest["pages"][url] = {"fingerprint": fingerprint, "records": records}
+                    if icons is not None:
+                        new_manifest["pages"][url]["icons"] = icons
+
+            if icon_harvester is not None:
+                for icon_name, icon_url in icons or []:
+                    icon_harvester.add(icon_name, icon_url)
+
+            if byte_budget is not None:
+                live_trees = count_live_trees()
+                max_live_trees = max(max_live_trees, live_trees)
+                metrics.observe("live_parse_trees", live_trees)
+
+            units_count += len(records)
+            if writer is not None:
+                writer.write_page(url, records)
+            else:
+                data.extend(records)
+
+    finally:
+        # The checkpoint is saved even if the scrape fails, the pages written are not scraped again
+        if writer is not None:
+            writer.close()
+        # The icons still downloading go through the rate limiter of the crawl
+        if icon_harvester is not None:
+            icon_harvester.close()
+        set_response_cache(None)
+        set_rate_limiter(None)
+        if response_cache is not None:
+            response_cache.close()
+
+    print(f"Extracted data for {units_count} units")
+
+    failures = get_fetch_failures()
+    if failures:
+        print(f"{len(failures)} URLs could not be fetched:")
+        for failed_url, reason in failures.items():
+            print(f"  - {failed_url}: {reason}")
+    if byte_budget is not None:
+        peak_rss = peak_rss_bytes()
+        if peak_rss is not None:
+            metrics.observe("peak_rss_bytes", peak_rss)
+            print(f"Peak RSS: {peak_rss / 2**20:.1f} MiB")
+        if parse_processes > 0 and peak_rss is not None:
+            print(f"Peak RSS of the parse processes: {peak_rss_bytes(children=True) / 2**20:.1f} MiB")
+        print(f"Live parse trees: {count_live_trees()} (max {max_live_trees} during the crawl)")
+        print(f"Pages in flight: {byte_budget.peak_in_flight / 1024:.0f} KiB peak (budget {byte_budget.max_bytes / 1024:.0f} KiB)")
+    if measure_memory:
+        page_peaks = metrics.get_registry().summary("parse_peak_bytes", mode="streaming" if streaming_parse else "dom")
+        if page_peaks is not None:
+            count, total, maximum = page_peaks
+            print(f"Peak memory per page: {total / count / 1024:.0f} KiB mean, {maximum / 1024:.0f} KiB max ({count} pages)")
+    if limiter is not None:
+        print(f"Final request rate: {limiter.rate:.2f} req/s ({limiter.throttled} throttled responses)")
+
+    metrics.export_metrics(metrics_file, prometheus_file)
+    if profile is not None:
+        metrics.dump_profile(f"{os.path.splitext(output_file)[0]}.{profile}.prof")
+
+    if manifest is not None:
+        print(f"{unchanged_pages} of {len(units_urls)} pages were unchanged since the previous run")
+        save_manifest(new_manifest, manifest_file)
+
+    if frontier is not None:
+        # Records of the pages done in this run and in the previous ones
+        print(f"Frontier state: {frontier.counts()}")
+        data = frontier.scraped_records()
+        frontier.close()
+
+    if writer is None:
+        export_units_data(data, output_file)
+    else:
+        print(f"Data streamed to {stream_file}")
+        if fallback_records:
+            print(f"{len(fallback_records)} units of the previous run were kept for the pages that failed")
+        if finalize:
+            finalize_ndjson(stream_file, output_file, fallback_records)
+
+    # Columnar copy of the units for the analytics consumers (pandas is only imported here)
+    if parquet_dir is not None:
+        from src.columnar_export import export_units_parquet
+        export_units_parquet(data if writer is None else [*read_ndjson(stream_file), *fallback_records], parquet_dir)
 
 
 if __name__ == "__main__":
     # Execute the ETL process
     URL = "https://ageofempires.fandom.com/"
     OUTPUT_FILE = "data/units.json"
-
-    scrape_units_data(URL, OUTPUT_FILE)
\ No newline at end of file
+    WORKERS = 8
+    CACHE_DIR = "data/cache"
+    MANIFEST_FILE = "data/units_manifest.json"
+    PARSE_PROCESSES = os.cpu_count() or 1
+    STREAM_FILE = "data/units.ndjson"
+    ICONS_DIR = "data/icons"
+    RATE_LIMIT = 5
+    METRICS_FILE = "data/metrics.json"
+    PROMETHEUS_FILE = "data/metrics.prom"
+    PARQUET_DIR = "data/parquet"
+
+    scrape_units_data(
+        URL,
+        OUTPUT_FILE,
+        workers=WORKERS,
+        cache_dir=CACHE_DIR,
+        manifest_file=MANIFEST_FILE,
+        parse_processes=PARSE_PROCESSES,
+        stream_file=STREAM_FILE,
+        resume="--resume" in sys.argv,
+        icons_dir=ICONS_DIR,
+        rate_limit=RATE_LIMIT,
+        metrics_file=METRICS_FILE,
+        prometheus_file=PROMETHEUS_FILE,
+        parquet_dir=PARQUET_DIR,
+    )
\ No newline at end of file
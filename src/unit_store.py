@@ -0,0 +1,170 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : In-memory store of the extracted units with
+                        indexes by name, civilization, age, type and
+                        building
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import time
+
+from src.scrap_infobox import norm_string
+
+# Indexed field -> (block, label) of the unit dict
+INDEXED_FIELDS = {
+    "civilization": ("Information", "Civilization(s)"),
+    "unit_type": ("Information", "Type"),
+    "age": ("Training", "Age"),
+    "trained_at": ("Training", "Trained at"),
+}
+
+# Short names of the ages accepted in the queries (e.g. age="III")
+AGE_ALIASES = {
+    "i": "discovery_age",
+    "ii": "colonial_age",
+    "iii": "fortress_age",
+    "iv": "industrial_age",
+    "v": "imperial_age",
+    "discovery": "discovery_age",
+    "colonial": "colonial_age",
+    "fortress": "fortress_age",
+    "industrial": "industrial_age",
+    "imperial": "imperial_age",
+}
+
+
+def _field_values(unit, field) -> list:
+    block, label = INDEXED_FIELDS[field]
+    values = unit.get(block, {}).get(label, [])
+    return values if isinstance(values, list) else [values]
+
+
+def _norm_key(field, value) -> str:
+    key = norm_string(value)
+    if field == "age":
+        return AGE_ALIASES.get(key, key)
+    return key
+
+
+class UnitStore:
+    """
+    Units of a scrape with a hash index by name and inverted indexes by
+    civilization, age, unit type and training building.
+
+    The indexes map a normalized value (see `norm_string`) to the positions
+    of the units in `units`, so a composed query is the intersection of a
+    few sets.
+
+    Parameters:
+    ---
+    units (list):
+        Unit dicts as returned by `extract_unit_data`
+    """
+
+    def __init__(self, units):
+        self.units = list(units)
+        self.by_name = {}
+        self.indexes = {field: {} for field in INDEXED_FIELDS}
+
+        for position, unit in enumerate(self.units):
+            self.by_name.setdefault(norm_string(unit["name"]), []).append(position)
+            for field, index in self.indexes.items():
+                for value in _field_values(unit, field):
+                    index.setdefault(_norm_key(field, value), set()).add(position)
+
+        # Sets are frozen once built, the store is read-only
+        self.indexes = {
+            field: {key: frozenset(positions) for key, positions in index.items()}
+            for field, index in self.indexes.items()
+        }
+
+    def __len__(self):
+        return len(self.units)
+
+    def get(self, name) -> list:
+        """Returns the units with the given name (a name can appear in several pages)."""
+        return [self.units[position] for position in self.by_name.get(norm_string(name), [])]
+
+    def values(self, field) -> list:
+        """Returns the normalized values of an indexed field."""
+        return sorted(self.indexes[field])
+
+    def query_positions(self, name=None, civilization=None, age=None, unit_type=None, trained_at=None) -> list:
+        """Same as `query`, but returns the positions of the units in `units`."""
+        candidates = []
+        if name is not None:
+            candidates.append(frozenset(self.by_name.get(norm_string(name), ())))
+
+        filters = {"civilization": civilization, "age": age, "unit_type": unit_type, "trained_at": trained_at}
+        for field, value in filters.items():
+            if value is not None:
+                candidates.append(self.indexes[field].get(_norm_key(field, value), frozenset()))
+
+        if not candidates:
+            return list(range(len(self.units)))
+
+        # Intersect starting from the smallest set
+        candidates.sort(key=len)
+        positions = set(candidates[0])
+        for other in candidates[1:]:
+            if not positions:
+                break
+            positions &= other
+
+        return sorted(positions)
+
+    def query(self, name=None, civilization=None, age=None, unit_type=None, trained_at=None) -> list:
+        """
+        Get the units matching every given filter
+
+        e.g. `store.query(civilization="British", age="III", trained_at="Barracks")`
+
+        Parameters:
+        ---
+        name (str):
+            Unit name
+        civilization, age, unit_type, trained_at (str):
+            Value of the indexed field, compared after normalization. The age
+            also accepts its number ('I' to 'V') or its short name ('Fortress')
+
+        Returns:
+        ---
+        list:
+            Matching units in the order of the scrape
+        """
+        positions = self.query_positions(name, civilization, age, unit_type, trained_at)
+        return [self.units[position] for position in positions]
+
+    @classmethod
+    def load(cls, units_file):
+        """
+        Get the store of a JSON output file of the scraper
+
+        The indexes are always rebuilt: building them costs a fraction of
+        decoding the units, so a saved index does not make the load faster.
+        """
+        start_time = time.perf_counter()
+        with open(units_file) as file:
+            store = cls(json.load(file))
+        print(f"Unit index built for {units_file} ({len(store)} units) in {time.perf_counter() - start_time:.3f}s")
+        return store
+
+
+if __name__ == "__main__":
+    # Example query over the last scrape
+    UNITS_FILE = "data/units.json"
+
+    store = UnitStore.load(UNITS_FILE)
+    for unit in store.query(civilization="British", age="II", trained_at="Barracks"):
+        print(unit["name"])
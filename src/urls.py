@@ -0,0 +1,51 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Canonical form of the URLs of the wiki, shared by
+                        the fetch layer, the cache and the frontier
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import re
+from urllib.parse import quote, unquote, urljoin, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Characters kept as they are in the canonical path of a page
+_SAFE_PATH_CHARS = "/:()',!*;@$&=+~"
+
+# Encoded '/' of a path: decoding it would split a title into path segments
+_ENCODED_SLASH = re.compile("%2F", re.IGNORECASE)
+
+
+def canonicalize_url(base_url, href) -> str:
+    """
+    Get the canonical form of a link of the wiki
+
+    The link is resolved against the base URL (no '//wiki' double slash),
+    the scheme and host are lowercased, the default port and the fragment
+    are dropped, and the path is percent-encoded the same way whatever the
+    form of the link (spaces as underscores, as MediaWiki does). An encoded
+    '/' (%2F) is part of the title, it stays encoded.
+
+    e.g. ('https://ageofempires.fandom.com/', '/wiki/Musketeer#Overview')
+    -> 'https://ageofempires.fandom.com/wiki/Musketeer'
+    """
+    parts = urlsplit(urljoin(base_url, href))
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    netloc = host if parts.port in (None, DEFAULT_PORTS.get(scheme)) else f"{host}:{parts.port}"
+    path = "%2F".join(
+        quote(re.sub(r"/{2,}", "/", unquote(segment).replace(" ", "_")), safe=_SAFE_PATH_CHARS)
+        for segment in _ENCODED_SLASH.split(parts.path)
+    )
+    return urlunsplit((scheme, netloc, path, parts.query, ""))
@@ -15,19 +15,308 @@
 """
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 import requests
 from bs4 import Tag
+from requests.adapters import HTTPAdapter
 
+from src import metrics
+from src.rate_limit import backoff_delay, parse_retry_after
 
-def fetch_page_content(url):
+# Default limits for the concurrent fetch mode
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 4
+
+_session = None
+_session_pool_size = 0
+_session_lock = threading.Lock()
+
+# Response cache used by `fetch_page_content` (see `set_response_cache`)
+_response_cache = None
+
+# Retries of transient errors and timeout of each request
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_TIMEOUT = 30
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+# Rate limiter used by `fetch_page_content` (see `set_rate_limiter`)
+_rate_limiter = None
+_max_retries = DEFAULT_MAX_RETRIES
+
+# URL -> reason of the pages that could not be fetched
+_fetch_failures = {}
+_failures_lock = threading.Lock()
+
+
+def get_session(pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    The session keeps connections alive between requests, so consecutive
+    pages from the same host reuse the TCP/TLS connection. When a larger
+    pool than the current one is requested (e.g. more workers than the
+    default), the adapters are mounted again with the larger size, so the
+    extra connections are kept alive instead of being discarded.
+
+    Parameters:
+    ---
+    pool_size (int):
+        Maximum number of pooled connections kept per host
+
+    Returns:
+    ---
+    requests.Session:
+        Session shared by every fetch of the process
+    """
+    global _session, _session_pool_size
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+        if pool_size > _session_pool_size:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+            _session_pool_size = pool_size
+        return _session
+
+
+def set_response_cache(cache):
+    """
+    Set the response cache used by every page fetch
+
+    Parameters:
+    ---
+    cache (ResponseCache):
+        Cache to use, or None to always download the pages
+    """
+    global _response_cache
+    _response_cache = cache
+
+
+def set_rate_limiter(limiter, max_retries=DEFAULT_MAX_RETRIES):
+    """
+    Set the rate limiter and the retries used by every page fetch
+
+    Parameters:
+    ---
+    limiter (AdaptiveRateLimiter):
+        Rate limiter to use, or None to send the requests without throttling
+    max_retries (int):
+        Number of retries of a request that failed with a transient error
+    """
+    global _rate_limiter, _max_retries
+    _rate_limiter = limiter
+    _max_retries = max_retries
+
+
+def get_fetch_failures() -> dict:
+    """Returns the URLs that could not be fetched with the reason of the failure."""
+    with _failures_lock:
+        return dict(_fetch_failures)
+
+
+def clear_fetch_failures():
+    with _failures_lock:
+        _fetch_failures.clear()
+
+
+def _record_failure(url, reason, kind, error):
+    with _failures_lock:
+        _fetch_failures[url] = reason
+    metrics.record_error("fetch", kind, error, url, reason)
+
+
+def request_with_retries(session, url, headers=None, params=None):
+    """
+    Send a GET request, retrying the transient errors
+
+    Connection errors, timeouts and 429/5xx responses are retried with
+    exponential backoff and jitter, or after the `Retry-After` delay of the
+    server. The rate limiter, if any, is applied to every attempt and adapted
+    to the responses.
+
+    Returns:
+    ---
+    requests.Response:
+        Final response (which may be an HTTP error), or None if every
+        attempt failed with a transient error
+    """
+    limiter = _rate_limiter
+    error = error_kind = error_class = None
+    host = urlparse(url).netloc
+
+    for attempt in range(_max_retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+
+        retry_after = None
+        start_time = time.perf_counter()
+        try:
+            with metrics.profile_stage("fetch"):
+                response = session.get(url, headers=headers, params=params, timeout=DEFAULT_TIMEOUT)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            error = f"{type(e).__name__}: {e}"
+            error_kind = "network"
+            error_class = type(e).__name__
+            metrics.inc("fetch_requests_total", host=host, status="error")
+        else:
+            metrics.observe("fetch_seconds", time.perf_counter() - start_time, host=host)
+            metrics.inc("fetch_requests_total", host=host, status=str(response.status_code))
+            metrics.inc("fetch_bytes_total", len(response.content), host=host)
+
+            if response.status_code not in RETRY_STATUSES:
+                if limiter is not None:
+                    limiter.on_success()
+                return response
+
+            error = f"HTTP {response.status_code}"
+            error_kind = "http"
+            error_class = "HTTPError"
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if limiter is not None and response.status_code in THROTTLE_STATUSES:
+                limiter.on_throttle(retry_after)
+
+        if attempt < _max_retries:
+            time.sleep(retry_after if retry_after is not None else backoff_delay(attempt))
+
+    _record_failure(url, f"{error} after {_max_retries + 1} attempts", error_kind, error_class)
+    print(f"\nError fetching '{url}': {error} after {_max_retries + 1} attempts")
+    return None
+
+
+def fetch_page_content(url, session=None):
     """Fetches the HTML content of the page."""
-    response = requests.get(url)
+    cache = _response_cache
+    entry = cache.get(url) if cache is not None else None
+
+    if cache is not None and cache.offline:
+        if entry is None:
+            _record_failure(url, "Not available in the cache", "cache", "NotCached")
+            print(f"Page not available in the cache: {url}")
+            return None
+        metrics.inc("cache_requests_total", result="hit")
+        return entry["body"]
+
+    session = session or get_session()
+    headers = cache.conditional_headers(entry) if cache is not None else {}
+    response = request_with_retries(session, url, headers=headers)
+    if response is None:
+        return None
+
+    # The cached copy is still valid
+    if response.status_code == 304 and entry is not None:
+        metrics.inc("cache_requests_total", result="revalidated")
+        return entry["body"]
+
+    # A 304 with no cached copy to match is a miss: the page is requested again without validators
+    if response.status_code == 304:
+        response = request_with_retries(session, url)
+        if response is None:
+            return None
+        if response.status_code == 304:
+            _record_failure(url, "Not modified response without a cached copy", "http", "NotModified")
+            print(f"\nError fetching '{url}': not modified response without a cached copy")
+            return None
+
     try:
         response.raise_for_status()
-        return response.text
     except requests.exceptions.HTTPError as e:
+        _record_failure(url, str(e), "http", type(e).__name__)
         print(f"Error HTTP: {e}")
+        return None
+
+    if cache is not None:
+        metrics.inc("cache_requests_total", result="miss")
+        cache.store(
+            url,
+            response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+    return response.text
+
+
+def iter_pages_content(urls, max_workers=DEFAULT_WORKERS, per_host_limit=DEFAULT_PER_HOST_LIMIT, byte_budget=None):
+    """
+    Fetch several pages concurrently over pooled keep-alive connections
+
+    With `max_workers` 1 the pages are fetched one by one in the calling
+    thread.
+
+    Parameters:
+    ---
+    urls (list):
+        URLs of the pages to fetch
+    max_workers (int):
+        Number of threads used to download the pages
+    per_host_limit (int):
+        Maximum number of simultaneous requests sent to the same host
+    byte_budget (ByteBudget):
+        Caps the size of the pages downloaded ahead of the consumer. A page
+        is reserved before its download starts and counts until the consumer
+        asks for the next one
+
+    Yields:
+    ---
+    tuple:
+        Pairs (url, html) in the same order as `urls`. The html is None when
+        the page could not be fetched
+    """
+    host_limits = {}
+    for url in urls:
+        host = urlparse(url).netloc
+        if host not in host_limits:
+            host_limits[host] = threading.BoundedSemaphore(per_host_limit)
+
+    session = get_session(max(max_workers, per_host_limit))
+
+    def fetch(url):
+        with host_limits[urlparse(url).netloc]:
+            try:
+                return fetch_page_content(url, session)
+            except requests.exceptions.RequestException as e:
+                _record_failure(url, str(e), "network", type(e).__name__)
+                print(f"\nError fetching '{url}': {e}")
+                return None
+
+    def fetch_budgeted(ticket, url):
+        # Every page takes its turn before its download starts, the reservation is then set to its size
+        reserved = byte_budget.reserve(ticket)
+        content = None
+        try:
+            content = fetch(url)
+        finally:
+            byte_budget.adjust(reserved, len(content or ""))
+        return content
+
+    def iter_fetched(fetched):
+        if byte_budget is None:
+            yield from zip(urls, fetched)
+            return
+
+        try:
+            for url, content in zip(urls, fetched):
+                yield url, content
+                # The consumer is done with the page
+                byte_budget.release(len(content or ""))
+        finally:
+            # Do not leave threads waiting for a turn if the consumer stops early
+            byte_budget.close()
+
+    task, args = (fetch, (urls,)) if byte_budget is None else (fetch_budgeted, (range(len(urls)), urls))
+
+    if max_workers <= 1:
+        yield from iter_fetched(map(task, *args))
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # `map` returns the results in the order of the input URLs
+        yield from iter_fetched(executor.map(task, *args))
 
 
 # Save the HTML content of the infobox in a file for each block
@@ -65,13 +354,38 @@ def get_section_hrefs(section: str, content: Tag) -> dict:
     h2s = content.find_all("h2", recursive=False)
     for h2 in h2s:
         if h2.find("span", class_="mw-headline", recursive=False).text == section:
-            ul = h2.find_next_sibling("ul")
-            lis = ul.find_all("li", recursive=False)
-            section_units = {}
-            for li in lis:
-                anchor = li.find("a", recursive=False, class_=lambda x: x != "image")
-                if anchor is not None:
-                    unit_name = anchor.text
-                    unit_url = anchor.get("href")
-                    section_units[unit_name] = unit_url
-            return section_units
+            return _get_list_hrefs(h2.find_next_sibling("ul"))
+
+
+def _get_list_hrefs(ul: Tag) -> dict:
+    """Unit names and hyperlinks of the items of a section list."""
+    section_units = {}
+    for li in ul.find_all("li", recursive=False):
+        anchor = li.find("a", recursive=False, class_=lambda x: x != "image")
+        if anchor is not None:
+            unit_name = anchor.text
+            unit_url = anchor.get("href")
+            section_units[unit_name] = unit_url
+    return section_units
+
+
+def get_sections_hrefs(content: Tag) -> dict:
+    """
+    Get the hyperlinks of the units of every section in a single pass
+
+    Parameters:
+    ---
+    content (Tag):
+        HTML content that contains the sections of units
+
+    Returns:
+    ---
+    dict:
+        Section -> dictionary with the unit names as keys and the hyperlinks
+        as values, in the order of the page
+    """
+    sections_hrefs = {}
+    for h2 in content.find_all("h2", recursive=False):
+        section = h2.find("span", class_="mw-headline", recursive=False).text
+        sections_hrefs[section] = _get_list_hrefs(h2.find_next_sibling("ul"))
+    return sections_hrefs
@@ -0,0 +1,289 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Watch mode: re-extracts the units edited in the
+                        wiki recent changes feed and logs what changed
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+if __name__ == "__main__":
+    # Run as a script (python src/watch.py): `src` is imported from the project root
+    sys.path.append(os.path.abspath("."))
+
+from src.incremental import REVISION_PATTERN, load_manifest, page_fingerprint, save_manifest
+from src.mediawiki_api import fetch_parsed_content, fetch_recent_changes, get_api_url, normalize_title, title_from_url
+from src.unit_data_scraper import FETCH_BACKENDS, export_units_data, extract_page_units, scrape_units_data
+from src.utils import fetch_page_content
+
+TARGET_GAME = "Age of Empires III"
+
+# Seconds between two polls of the recent changes feed
+DEFAULT_INTERVAL = 300
+
+
+def utc_timestamp() -> str:
+    """Current time in the ISO 8601 format of the MediaWiki API."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _flatten_unit(unit) -> dict:
+    """'Block / Label' (and 'Block / Label / key' for dicts) -> value of a unit."""
+    fields = {}
+    for block, block_data in unit.items():
+        if not isinstance(block_data, dict):
+            fields[block] = block_data
+            continue
+        for label, values in block_data.items():
+            if isinstance(values, dict):
+                for key, value in values.items():
+                    fields[f"{block} / {label} / {key}"] = value
+            else:
+                fields[f"{block} / {label}"] = values
+    return fields
+
+
+def diff_units(old_units, new_units) -> list:
+    """
+    Compare the records of a page before and after an edit
+
+    Returns:
+    ---
+    list:
+        One entry per unit that changed: {"unit", "change", "fields"} where
+        change is 'added', 'removed' or 'modified' and fields maps each
+        changed field to its {"old", "new"} values
+    """
+    old_by_name = {unit["name"]: _flatten_unit(unit) for unit in old_units}
+    new_by_name = {unit["name"]: _flatten_unit(unit) for unit in new_units}
+
+    changes = []
+    for name in dict.fromkeys([*old_by_name, *new_by_name]):
+        old_fields = old_by_name.get(name, {})
+        new_fields = new_by_name.get(name, {})
+        fields = {
+            field: {"old": old_fields.get(field), "new": new_fields.get(field)}
+            for field in dict.fromkeys([*old_fields, *new_fields])
+            if old_fields.get(field) != new_fields.get(field)
+        }
+        if name not in old_by_name:
+            changes.append({"unit": name, "change": "added", "fields": fields})
+        elif name not in new_by_name:
+            changes.append({"unit": name, "change": "removed", "fields": fields})
+        elif fields:
+            changes.append({"unit": name, "change": "modified", "fields": fields})
+    return changes
+
+
+def _load_state(filename) -> dict:
+    if filename is None or not os.path.exists(filename):
+        return {}
+    with open(filename) as file:
+        return json.load(file)
+
+
+def _save_state(state, filename):
+    if filename is None:
+        return
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "w") as file:
+        json.dump(state, file)
+    os.replace(tmp_filename, filename)
+
+
+def poll_changes(url, manifest, since, fetch_backend="html") -> tuple:
+    """
+    Re-extract the unit pages edited since a moment
+
+    Parameters:
+    ---
+    url (str):
+        Base URL of the wiki
+    manifest (dict):
+        Manifest of the last scrape (see `src.incremental`), updated with the
+        new records of the edited pages
+    since (str):
+        ISO 8601 timestamp of the oldest edit to read from the feed
+    fetch_backend (str):
+        'html' (rendered pages) or 'api' (parsed content of api.php)
+
+    Returns:
+    ---
+    tuple:
+        (change log entries, number of pages fetched again, timestamp of the
+        next poll). The entries are None if the feed could not be read. When
+        a page could not be fetched, or the rendered page is older than the
+        edit of the feed, the next poll starts from that edit to retry it
+    """
+    api_url = get_api_url(url)
+    changes = fetch_recent_changes(api_url, since)
+    if changes is None:
+        return None, 0, since
+
+    # Only the last edit of each known unit page matters
+    titles = {title_from_url(page_url): page_url for page_url in manifest["pages"]}
+    edits = {}
+    for change in changes:
+        page_url = titles.get(normalize_title(change["title"]))
+        if page_url is not None:
+            edits[page_url] = change
+
+    log_entries = []
+    refreshed = 0
+    # Timestamps of the edits whose page must be fetched again by the next poll
+    retry_timestamps = []
+    for page_url, change in edits.items():
+        page = manifest["pages"][page_url]
+        # The feed includes the edits of the `since` second again
+        if page["fingerprint"] == f"rev:{change['revid']}":
+            continue
+
+        if fetch_backend == "api":
+            page_html = fetch_parsed_content(api_url, title_from_url(page_url))
+            fingerprint = f"rev:{change['revid']}"
+        else:
+            page_html = fetch_page_content(page_url)
+            fingerprint = page_fingerprint(page_html) if page_html is not None else None
+        if page_html is None:
+            print(f"\nNo content was obtained for url '{page_url}', it is retried in the next poll")
+            retry_timestamps.append(change["timestamp"])
+            continue
+        revision = REVISION_PATTERN.search(page_html) if fetch_backend == "html" else None
+        if revision is not None and int(revision.group(1)) < change["revid"]:
+            # A cached copy of the page served before the edit reached it
+            print(
+                f"\nThe page of url '{page_url}' is older than revision {change['revid']}, "
+                "it is retried in the next poll"
+            )
+            retry_timestamps.append(change["timestamp"])
+            continue
+
+        records = extract_page_units(page_url, page_html, TARGET_GAME)
+        for unit_change in diff_units(page["records"], records):
+            log_entries.append({
+                "detected": utc_timestamp(),
+                "timestamp": change["timestamp"],
+                "url": page_url,
+                "revid": change["revid"],
+                "user": change.get("user"),
+                "comment": change.get("comment"),
+                **unit_change,
+            })
+        manifest["pages"][page_url] = {"fingerprint": fingerprint, "records": records}
+        refreshed += 1
+
+    # Next poll from the newest edit read (included again, filtered by its fingerprint),
+    # or from the oldest edit to retry
+    if retry_timestamps:
+        next_since = min(retry_timestamps)
+    else:
+        next_since = max([since, *(change["timestamp"] for change in changes)])
+    return log_entries, refreshed, next_since
+
+
+def watch_units(
+    url,
+    output_file,
+    manifest_file,
+    changelog_file,
+    state_file=None,
+    interval=DEFAULT_INTERVAL,
+    iterations=None,
+    fetch_backend="html",
+    **scrape_kwargs,
+):
+    """
+    Keep the units output up to date with the edits of the wiki
+
+    When there is no manifest yet, a full scrape is done first with
+    `scrape_units_data`. Then the recent changes feed is polled every
+    `interval` seconds: only the edited unit pages are fetched again, the
+    output file and the manifest are rewritten and every changed unit is
+    appended to the change log (NDJSON).
+
+    Parameters:
+    ---
+    url (str):
+        Base URL of the wiki
+    output_file (str):
+        JSON file of the units
+    manifest_file (str):
+        Manifest of the pages and their records
+    changelog_file (str):
+        NDJSON file where the changes of each unit are appended
+    state_file (str):
+        JSON file with the timestamp of the last poll, to continue after a
+        restart without missing edits
+    interval (float):
+        Seconds between two polls
+    iterations (int):
+        Number of polls, None to watch until interrupted
+    scrape_kwargs:
+        Options of `scrape_units_data` for the initial scrape, not used when
+        the manifest already exists
+    """
+    if fetch_backend not in FETCH_BACKENDS:
+        raise ValueError(f"Invalid fetch backend: {fetch_backend}")
+
+    manifest = load_manifest(manifest_file)
+    since = _load_state(state_file).get("since")
+
+    if not manifest["pages"]:
+        # Edits made during the initial scrape are read by the first poll
+        since = utc_timestamp()
+        scrape_units_data(url, output_file, manifest_file=manifest_file, fetch_backend=fetch_backend, **scrape_kwargs)
+        manifest = load_manifest(manifest_file)
+    elif scrape_kwargs:
+        print(
+            f"Manifest '{manifest_file}' already exists, no initial scrape is done: "
+            f"the options {', '.join(sorted(scrape_kwargs))} are not used"
+        )
+    since = since or utc_timestamp()
+
+    print(f"Watching {len(manifest['pages'])} unit pages for edits since {since}")
+
+    iteration = 0
+    while iterations is None or iteration < iterations:
+        if iteration:
+            time.sleep(interval)
+        iteration += 1
+
+        log_entries, refreshed, since = poll_changes(url, manifest, since, fetch_backend)
+        if log_entries is None:
+            print("The recent changes feed could not be read")
+            continue
+
+        if log_entries:
+            with open(changelog_file, "a", encoding="utf-8") as file:
+                for entry in log_entries:
+                    file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            export_units_data([record for page in manifest["pages"].values() for record in page["records"]], output_file)
+            print(f"[{utc_timestamp()}] {len(log_entries)} unit changes: {', '.join(entry['unit'] for entry in log_entries)}")
+        if refreshed:
+            save_manifest(manifest, manifest_file)
+
+        _save_state({"since": since}, state_file)
+
+
+if __name__ == "__main__":
+    URL = "https://ageofempires.fandom.com/"
+    OUTPUT_FILE = "data/units.json"
+    MANIFEST_FILE = "data/units_manifest.json"
+    CHANGELOG_FILE = "data/units_changes.ndjson"
+    STATE_FILE = "data/watch_state.json"
+
+    watch_units(URL, OUTPUT_FILE, MANIFEST_FILE, CHANGELOG_FILE, STATE_FILE, workers=8, cache_dir="data/cache")
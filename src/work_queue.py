@@ -0,0 +1,185 @@
+"""
+╔═════════════════════════════════════════════════════════════════════╗
+║                      🧩 SCRIPT INFORMATION 🧩                      ║
+╠═════════════════════════════════════════════════════════════════════╣
+    -  👨‍💻 Author      : Jonathan Diaz
+    -  📧 Email       : jonathan.diazm5@gmail.com
+    -  📅 Created on  : 2026-10-18
+    -  📝 Description : Lease-based work queue in SQLite shared by the
+                        scraping workers
+╠═════════════════════════════════════════════════════════════════════╣
+║  Note: This script is the intellectual property of the author.      ║
+║  Its use and modification for educational or personal purposes is   ║
+║  permitted, provided that proper credit is given. For any questions ║
+║  or comments, please do not hesitate to contact me. 🙌🙌           ║
+╚═════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+# States of a task
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+# Seconds a worker owns a task before it can be issued to another worker
+DEFAULT_LEASE_SECONDS = 120
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Seconds to wait for the lock of the database held by another worker
+_BUSY_TIMEOUT = 60
+
+
+class WorkQueue:
+    """
+    Queue of unit URLs shared by several worker processes through a SQLite file
+
+    A worker leases tasks for `lease_seconds`; a task whose lease expires
+    (e.g. its worker died) is issued again to the next worker asking for
+    work. The first result submitted for a task wins, so a task run twice
+    after a lease expiration does not duplicate its records.
+
+    Parameters:
+    ---
+    filename (str):
+        SQLite file of the queue, on a filesystem visible to every worker
+    lease_seconds (float):
+        Duration of the leases
+    max_attempts (int):
+        Leases of a task before it is marked as failed
+    """
+
+    def __init__(self, filename, lease_seconds=DEFAULT_LEASE_SECONDS, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        folder = os.path.dirname(filename)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.filename = filename
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # Transactions are handled explicitly (BEGIN IMMEDIATE to lease)
+        self._connection = sqlite3.connect(filename, timeout=_BUSY_TIMEOUT, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                position INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL UNIQUE,
+                state TEXT NOT NULL,
+                worker TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                records TEXT
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, lease_expires)")
+
+    def enqueue(self, urls) -> int:
+        """Adds the URLs that are not in the queue yet, returns how many were added."""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self._connection.executemany(
+                "INSERT OR IGNORE INTO tasks (url, state) VALUES (?, ?)", ((url, PENDING) for url in urls)
+            )
+            self._connection.execute("COMMIT")
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        return cursor.rowcount
+
+    def lease(self, worker_id, count=1) -> list:
+        """
+        Lease up to `count` tasks: pending ones first, then expired leases
+
+        Returns:
+        ---
+        list:
+            URLs leased to the worker, empty if there is no task available
+        """
+        now = time.time()
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Expired leases that used every attempt are not issued again
+            self._connection.execute(
+                "UPDATE tasks SET state = ?, error = 'Lease expired' WHERE state = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, LEASED, now, self.max_attempts),
+            )
+            rows = self._connection.execute(
+                """
+                SELECT position, url FROM tasks
+                WHERE state = ? OR (state = ? AND lease_expires < ?)
+                ORDER BY position LIMIT ?
+                """,
+                (PENDING, LEASED, now, count),
+            ).fetchall()
+            self._connection.executemany(
+                "UPDATE tasks SET state = ?, worker = ?, lease_expires = ?, attempts = attempts + 1 WHERE position = ?",
+                ((LEASED, worker_id, now + self.lease_seconds, position) for position, _ in rows),
+            )
+            self._connection.execute("COMMIT")
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        return [url for _, url in rows]
+
+    def complete(self, url, worker_id, records) -> bool:
+        """Stores the records of a task, returns False if the task was already done."""
+        cursor = self._connection.execute(
+            "UPDATE tasks SET state = ?, worker = ?, records = ?, error = NULL WHERE url = ? AND state != ?",
+            (DONE, worker_id, json.dumps(records), url, DONE),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, url, worker_id, error):
+        """Releases a task that could not be done, it is retried until `max_attempts`."""
+        self._connection.execute(
+            """
+            UPDATE tasks SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, error = ?, lease_expires = NULL
+            WHERE url = ? AND state = ? AND worker = ?
+            """,
+            (self.max_attempts, FAILED, PENDING, error, url, LEASED, worker_id),
+        )
+
+    def clear_finished(self) -> int:
+        """
+        Removes the done and failed tasks, returns how many were removed
+
+        Their URLs are scraped again once they are enqueued, and their records
+        are not part of the results anymore. Pending and leased tasks are kept.
+        """
+        cursor = self._connection.execute("DELETE FROM tasks WHERE state IN (?, ?)", (DONE, FAILED))
+        return cursor.rowcount
+
+    def counts(self) -> dict:
+        """Returns the number of tasks in each state."""
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update(self._connection.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state"))
+        return counts
+
+    def is_finished(self) -> bool:
+        """Checks if every task is done or failed."""
+        counts = self.counts()
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    def results(self) -> list:
+        """Returns the records of the done tasks in the order they were enqueued."""
+        rows = self._connection.execute("SELECT records FROM tasks WHERE state = ? ORDER BY position", (DONE,))
+        return [record for (records,) in rows for record in json.loads(records)]
+
+    def failures(self) -> dict:
+        """Returns URL -> error of the failed tasks."""
+        return dict(self._connection.execute("SELECT url, error FROM tasks WHERE state = ? ORDER BY position", (FAILED,)))
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,46 @@
+from benchmarks.bench_suite import URL, bench_end_to_end, build_offline_cache, find_regressions
+from src.unit_data_scraper import get_units_urls
+from src.utils import set_rate_limiter, set_response_cache
+
+BASELINE = {
+    "extract_unit_data": {"ms": 0.3, "relative": 0.30, "alloc_kib": 6.0},
+    "end_to_end": {"units_per_s": 20.0, "relative": 30.0},
+}
+
+
+def test_regressions_are_relative_to_the_calibration_loop():
+    # Twice the milliseconds on a machine twice as slow: same relative time
+    results = {
+        "extract_unit_data": {"ms": 0.6, "relative": 0.31, "alloc_kib": 6.1},
+        "end_to_end": {"units_per_s": 10.0, "relative": 30.5},
+    }
+    assert find_regressions(results, BASELINE, threshold=0.25) == []
+
+    results["extract_unit_data"]["relative"] = 0.45
+    results["end_to_end"]["relative"] = 40.0
+    assert find_regressions(results, BASELINE, threshold=0.25) == [
+        "extract_unit_data: 50 % slower than the baseline",
+        "end_to_end: 33 % slower than the baseline",
+    ]
+
+
+def test_allocation_growth_is_a_regression():
+    results = {"extract_unit_data": {"ms": 0.3, "relative": 0.30, "alloc_kib": 7.0}, "new_benchmark": {"relative": 9.0}}
+
+    assert find_regressions(results, BASELINE, threshold=0.25) == [
+        "extract_unit_data: 7.0 KiB allocated vs 6.0 KiB"
+    ]
+
+
+def test_end_to_end_runs_offline_from_the_fixtures(tmp_path):
+    set_rate_limiter(None)
+    cache = build_offline_cache(tmp_path)
+    try:
+        units_urls = get_units_urls(URL)
+    finally:
+        set_response_cache(None)
+        cache.close()
+
+    # Every page of the unit list is served from the fixtures, without network
+    assert len(units_urls) == 4
+    assert bench_end_to_end(str(tmp_path)) > 0
@@ -0,0 +1,55 @@
+import json
+import sqlite3
+
+from src.urls import canonicalize_url
+from src.http_cache import ResponseCache
+from src.ndjson_writer import CheckpointedWriter
+
+URL = "https://ageofempires.fandom.com/"
+
+
+def test_canonicalize_url():
+    assert canonicalize_url(URL, "/wiki/Musketeer#Overview") == URL + "wiki/Musketeer"
+    assert canonicalize_url(URL, "/wiki/Coureur des bois") == URL + "wiki/Coureur_des_bois"
+    assert canonicalize_url("HTTPS://AgeOfEmpires.fandom.com:443/", "/wiki/Hussar") == URL + "wiki/Hussar"
+    # Links of the previous versions ('url + href')
+    assert canonicalize_url(URL + "/wiki/Hussar", "") == URL + "wiki/Hussar"
+    # An encoded '/' belongs to the title, it is not a path separator
+    assert canonicalize_url(URL, "/wiki/AC%2fDC_(unit)") == URL + "wiki/AC%2FDC_(unit)"
+    assert canonicalize_url(URL, "/wiki/Caf%C3%A9 au lait") == URL + "wiki/Caf%C3%A9_au_lait"
+
+
+def test_cache_entries_of_old_urls_are_rekeyed(tmp_path):
+    # Cache written before the URLs were canonical
+    connection = sqlite3.connect(tmp_path / "responses.sqlite")
+    connection.execute(
+        "CREATE TABLE responses (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT NOT NULL, "
+        "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+    )
+    connection.executemany(
+        "INSERT INTO responses VALUES (?, NULL, NULL, ?, 1, 0)",
+        [(URL + "/wiki/Hussar", "old hussar"), (URL + "/wiki/Musketeer", "old"), (URL + "wiki/Musketeer", "new")],
+    )
+    connection.commit()
+    connection.close()
+
+    cache = ResponseCache(tmp_path)
+
+    assert cache.get(URL + "wiki/Hussar")["body"] == "old hussar"
+    assert cache.get(URL + "wiki/Musketeer")["body"] == "new"
+    assert cache.get(URL + "/wiki/Hussar") is None
+    cache.close()
+
+
+def test_checkpoint_of_old_version_is_not_resumed(tmp_path):
+    stream_file = tmp_path / "units.ndjson"
+    stream_file.write_text('{"name": "Hussar"}\n')
+    (tmp_path / "units.ndjson.checkpoint").write_text(
+        json.dumps({"done_urls": [URL + "/wiki/Hussar"], "units_written": 1, "offset": 19})
+    )
+
+    with CheckpointedWriter(str(stream_file), resume=True) as writer:
+        assert writer.done_urls == set()
+        writer.write_page(URL + "wiki/Hussar", [{"name": "Hussar"}])
+
+    assert stream_file.read_text() == '{"name": "Hussar"}\n'
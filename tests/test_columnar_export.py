@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+
+from src.columnar_export import export_units_parquet, flatten_units, read_units_table
+
+UNITS = [
+    {
+        "name": "Musketeer",
+        "Information": {"Civilization(s)": ["British", "Swedes"], "Type": ["Infantry"]},
+        "Statistics": {"Hit points": "160", "Hit-points": "5", "Speed": "4.0", "Range": "12"},
+        "Training": {"Cost": {"Food": "75", "Coin": "25"}},
+    },
+    {
+        "name": "Hussar",
+        "Information": {"Civilization(s)": ["British"], "Type": []},
+        "Statistics": {"Hit points": "225", "Speed": "6.75", "Range": "Melee"},
+        "Training": {"Cost": {"Food": "80"}},
+        "Unit ID": "HUS",
+    },
+]
+
+
+def test_colliding_keys_get_distinct_columns():
+    units = flatten_units(UNITS)["units"]
+
+    assert list(units.columns[:3]) == ["unit_id", "name", "statistics_hit_points"]
+    assert units["statistics_hit_points"].tolist() == [160, 225]
+    assert units["statistics_hit_points_2"].tolist()[0] == 5
+    # A key named like the id column does not replace the ids
+    assert units["unit_id"].tolist() == [1, 2]
+    assert units["unit_id_2"].tolist()[1] == "HUS"
+
+
+def test_dtypes_do_not_depend_on_missing_values():
+    tables = flatten_units(UNITS)
+    units = tables["units"]
+
+    assert units["training_cost_coin"].dtype == "Int64" and units["training_cost_coin"].isna().tolist() == [False, True]
+    assert units["statistics_speed"].dtype == "Float64"
+    # A column with a text value stays text
+    assert units["statistics_range"].dtype == "string"
+    assert not any(dtype == object for dtype in units.dtypes)
+
+    civilizations = tables["information_civilizations"]
+    assert civilizations.values.tolist() == [[1, 0, "British"], [1, 1, "Swedes"], [2, 0, "British"]]
+    assert civilizations["value"].dtype == "string"
+
+
+def test_parquet_keeps_the_dtypes(tmp_path):
+    pytest.importorskip("pyarrow")
+    tables = flatten_units(UNITS)
+
+    export_units_parquet(UNITS, tmp_path)
+
+    units = read_units_table(tmp_path, columns=["unit_id", "training_cost_coin", "statistics_range"])
+    pd.testing.assert_frame_equal(units, tables["units"][["unit_id", "training_cost_coin", "statistics_range"]])
+    assert read_units_table(tmp_path, "information_type")["value"].tolist() == ["Infantry"]
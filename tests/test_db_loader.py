@@ -0,0 +1,64 @@
+import json
+from pathlib import Path
+
+from sqlalchemy import select
+
+from src.db_loader import get_engine, load_units, load_units_file, rows_to_csv
+from src.db_models import Unit, UnitCivilization, UnitCost, UnitOtherValue, UnitStat
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+
+def test_load_units_file_into_sqlite(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'units.db'}")
+
+    counts = load_units_file(FIXTURES_PATH / "units.json", engine)
+
+    assert counts == {
+        "units": 2,
+        "unit_stats": 9,
+        "unit_civilizations": 4,
+        "unit_types": 3,
+        "unit_ages": 2,
+        "unit_trained_at": 3,
+        "unit_costs": 3,
+        "unit_damages": 2,
+        "unit_resistances": 1,
+        "unit_other_values": 3,
+    }
+
+    with engine.connect() as connection:
+        assert connection.execute(select(Unit.id, Unit.name).order_by(Unit.id)).all() == [(1, "Hussar"), (2, "Scout")]
+        assert connection.execute(
+            select(UnitCivilization.position, UnitCivilization.civilization)
+            .where(UnitCivilization.unit_id == 1)
+            .order_by(UnitCivilization.position)
+        ).all() == [(0, "British"), (1, "French"), (2, "Germans")]
+        assert connection.execute(
+            select(UnitCost.resource, UnitCost.amount).where(UnitCost.unit_id == 1).order_by(UnitCost.id)
+        ).all() == [("Food", "100"), ("Coin", "25")]
+        assert connection.execute(
+            select(UnitOtherValue.label, UnitOtherValue.key, UnitOtherValue.value).where(UnitOtherValue.unit_id == 2)
+        ).all() == [("Resource bounty", "0", "5"), ("Resource bounty", "1", "10")]
+        # Empty values are stored as '', not NULL
+        assert connection.execute(
+            select(UnitStat.value).where(UnitStat.unit_id == 2, UnitStat.label == "Train XP")
+        ).scalar_one() == ""
+
+
+def test_load_units_replaces_previous_load(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'units.db'}")
+    units = json.loads((FIXTURES_PATH / "units.json").read_text())
+
+    load_units(units, engine)
+    counts = load_units(units[:1], engine)
+
+    with engine.connect() as connection:
+        assert connection.execute(select(Unit.name)).scalars().all() == ["Hussar"]
+        assert len(connection.execute(select(UnitStat.id)).all()) == counts["unit_stats"]
+
+
+def test_copy_csv_keeps_empty_strings_apart_from_null():
+    buffer = rows_to_csv(["id", "value", "other"], [{"id": 1, "value": "", "other": None}, {"id": 2, "value": 'a "b", c'}])
+
+    assert buffer.read() == '"1","",\\N\n"2","a ""b"", c",\\N\n'
@@ -0,0 +1,49 @@
+import json
+
+from benchmarks.stub_wiki import edit_page, start_stub_server
+from src.distributed_scraper import run_coordinator
+from src.unit_data_scraper import get_units_urls
+from src.utils import set_rate_limiter, set_response_cache
+from src.work_queue import WorkQueue
+
+
+def test_coordinator_scrapes_the_tasks_of_a_dead_worker(tmp_path):
+    server, base_url, stats = start_stub_server()
+    set_response_cache(None)
+    set_rate_limiter(None)
+    queue_file = str(tmp_path / "queue.sqlite")
+    output_file = tmp_path / "units.json"
+    try:
+        # A worker leased a task and died
+        with WorkQueue(queue_file, lease_seconds=0.5) as queue:
+            units_urls = get_units_urls(base_url)
+            queue.enqueue(units_urls)
+            assert queue.lease("dead-worker") == units_urls[:1]
+
+        run_coordinator(base_url, queue_file, str(output_file), workers=0, lease_seconds=0.5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    units = json.loads(output_file.read_text())
+    assert [unit["name"] for unit in units] == ["Musketeer", "Crossbowman", "Hussar", "Falconet"]
+    with WorkQueue(queue_file) as queue:
+        assert queue.is_finished() and queue.failures() == {}
+
+
+def test_second_run_of_a_finished_queue_scrapes_again(tmp_path):
+    server, base_url, stats = start_stub_server()
+    set_response_cache(None)
+    set_rate_limiter(None)
+    queue_file = str(tmp_path / "queue.sqlite")
+    output_file = tmp_path / "units.json"
+    try:
+        run_coordinator(base_url, queue_file, str(output_file), workers=0)
+        edit_page(server, "Hussar", 'pi-font">300</div>', 'pi-font">320</div>')
+        run_coordinator(base_url, queue_file, str(output_file), workers=0)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    units = json.loads(output_file.read_text())
+    assert [unit["Statistics"]["Hit points"] for unit in units if unit["name"] == "Hussar"] == ["320"]
@@ -0,0 +1,55 @@
+import json
+
+from benchmarks.stub_wiki import UNIT_LIST_PAGE, edit_page, start_stub_server
+from src.frontier import DONE, CrawlFrontier
+from src.unit_data_scraper import scrape_units_data
+from src.utils import set_rate_limiter, set_response_cache
+
+URL = "https://ageofempires.fandom.com/wiki/"
+
+
+def test_retain_drops_the_urls_no_longer_listed(tmp_path):
+    with CrawlFrontier(str(tmp_path / "frontier.sqlite")) as frontier:
+        frontier.add([URL + "Musketeer", URL + "Hussar", URL + "Falconet"])
+        frontier.mark_done(URL + "Hussar", [{"name": "Hussar"}])
+
+        assert frontier.retain([URL + "Musketeer", URL + "Hussar"]) == 1
+        assert frontier.pending() == [URL + "Musketeer"]
+
+        # A page that fails after a reset keeps its last records
+        frontier.reset()
+        frontier.mark_failed(URL + "Hussar", "HTTP 500")
+        assert frontier.scraped_records() == [{"name": "Hussar"}]
+        assert frontier.counts()[DONE] == 0
+
+
+def test_refresh_scrapes_the_edited_pages_and_drops_the_removed_units(tmp_path):
+    server, base_url, stats = start_stub_server()
+    set_response_cache(None)
+    set_rate_limiter(None)
+    frontier_file = str(tmp_path / "frontier.sqlite")
+    output_file = tmp_path / "units.json"
+
+    def hussar_hit_points():
+        units = json.loads(output_file.read_text())
+        return [unit["Statistics"]["Hit points"] for unit in units if unit["name"] == "Hussar"]
+
+    try:
+        scrape_units_data(base_url, str(output_file), frontier_file=frontier_file)
+        assert hussar_hit_points() == ["300"]
+
+        edit_page(server, "Hussar", 'pi-font">300</div>', 'pi-font">320</div>')
+        # The Falconet is listed in two sections
+        for _ in range(2):
+            edit_page(server, UNIT_LIST_PAGE, '<a href="/wiki/Falconet" title="Falconet">Falconet</a>', "")
+
+        # Done pages are kept without a refresh, removed units leave the output
+        scrape_units_data(base_url, str(output_file), frontier_file=frontier_file)
+        assert hussar_hit_points() == ["300"]
+        assert "Falconet" not in [unit["name"] for unit in json.loads(output_file.read_text())]
+
+        scrape_units_data(base_url, str(output_file), frontier_file=frontier_file, refresh_frontier=True)
+        assert hussar_hit_points() == ["320"]
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,37 @@
+from src.http_cache import ResponseCache
+
+URL = "https://ageofempires.fandom.com/wiki/"
+
+
+def test_least_recently_read_entries_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=10)
+    cache.store(URL + "Musketeer", "aaaa")
+    cache.store(URL + "Hussar", "bbbb")
+    # Read after the store: Hussar is now the least recently used entry
+    assert cache.get(URL + "Musketeer")["body"] == "aaaa"
+
+    cache.store(URL + "Falconet", "cccc")
+
+    assert cache.get(URL + "Hussar") is None
+    assert cache.get(URL + "Musketeer")["body"] == "aaaa"
+    assert cache.total_bytes() == 8
+    cache.close()
+
+    # The running total matches the stored bodies when the file is reopened
+    cache = ResponseCache(tmp_path, max_bytes=10)
+    assert cache.total_bytes() == 8
+    cache.store(URL + "Musketeer", "a")
+    assert cache.total_bytes() == 5
+    cache.close()
+
+
+def test_offline_reads_do_not_write(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.store(URL + "Hussar", "bbbb")
+    cache.close()
+
+    cache = ResponseCache(tmp_path, offline=True)
+    changes = cache._conn.total_changes
+    assert cache.get(URL + "Hussar")["body"] == "bbbb"
+    assert cache._conn.total_changes == changes
+    cache.close()
@@ -0,0 +1,65 @@
+import json
+import threading
+
+import pytest
+
+from benchmarks.stub_wiki import start_stub_server
+from src.icons import ICONS_MANIFEST, IconHarvester, manifest_lock, sanitize_icon_name, write_atomic
+from src.utils import set_rate_limiter, set_response_cache
+
+
+def test_icon_names_stay_inside_the_folder():
+    assert sanitize_icon_name("musketeer_icon.png") == "musketeer_icon.png"
+    assert sanitize_icon_name("../../etc/passwd") == "passwd"
+    assert sanitize_icon_name("..\\icons\\hussar.png") == "hussar.png"
+    assert sanitize_icon_name("hussar (1)?.png") == "hussar__1__.png"
+    for name in ["..", "icons/", ICONS_MANIFEST]:
+        with pytest.raises(ValueError):
+            sanitize_icon_name(name)
+
+
+def test_concurrent_writes_of_the_same_file(tmp_path):
+    path = tmp_path / "icon.png"
+    threads = [threading.Thread(target=write_atomic, args=(path, bytes([i]) * 1000)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One of the writes, whole, and no temporary file left
+    data = path.read_bytes()
+    assert len(data) == 1000 and len(set(data)) == 1
+    assert [file.name for file in tmp_path.iterdir()] == ["icon.png"]
+
+
+def test_icons_on_disk_are_adopted_and_manifests_merged(tmp_path):
+    server, base_url, stats = start_stub_server()
+    set_response_cache(None)
+    set_rate_limiter(None)
+    (tmp_path / "hussar.png").write_bytes(b"saved before the manifest")
+    try:
+        first = IconHarvester(tmp_path, max_workers=2)
+        second = IconHarvester(tmp_path, max_workers=2)
+        first.add("hussar.png", base_url + "images/hussar.png")
+        first.add("../musketeer.png", base_url + "images/musketeer.png")
+        second.add("falconet.png", base_url + "images/falconet.png")
+        with manifest_lock(first.manifest_path):
+            # Both close while the lock is held by someone else, then in turn
+            closers = [threading.Thread(target=harvester.close) for harvester in (first, second)]
+            for closer in closers:
+                closer.start()
+            closers[0].join(0.2)
+            assert closers[0].is_alive()
+        for closer in closers:
+            closer.join()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # The icon already on disk is not downloaded
+    assert stats["requests"] == 2
+    assert (tmp_path / "hussar.png").read_bytes() == b"saved before the manifest"
+    assert first.skipped == 1 and first.downloaded == 1 and second.downloaded == 1
+    manifest = json.loads((tmp_path / ICONS_MANIFEST).read_text())
+    assert sorted(manifest) == ["falconet.png", "hussar.png", "musketeer.png"]
+    assert not (tmp_path / f"{ICONS_MANIFEST}.lock").exists()
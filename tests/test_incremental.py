@@ -0,0 +1,26 @@
+import json
+
+from src import incremental
+from src.incremental import empty_manifest, get_unchanged_records, load_manifest, save_manifest
+
+URL = "https://ageofempires.fandom.com/wiki/Hussar"
+
+
+def test_manifest_of_another_extractor_version_is_discarded(tmp_path, monkeypatch):
+    manifest_file = str(tmp_path / "manifest.json")
+    manifest = empty_manifest()
+    manifest["pages"][URL] = {"fingerprint": "rev:1", "records": [{"name": "Hussar"}]}
+    save_manifest(manifest, manifest_file)
+
+    assert get_unchanged_records(load_manifest(manifest_file), URL, "rev:1") == [{"name": "Hussar"}]
+
+    monkeypatch.setattr(incremental, "EXTRACTOR_VERSION", incremental.EXTRACTOR_VERSION + 1)
+    assert load_manifest(manifest_file)["pages"] == {}
+
+
+def test_manifest_without_extractor_version_is_discarded(tmp_path):
+    manifest_file = tmp_path / "manifest.json"
+    pages = {URL: {"fingerprint": "rev:1", "records": [{"name": "Hussar"}]}}
+    manifest_file.write_text(json.dumps({"version": incremental.MANIFEST_VERSION, "pages": pages}))
+
+    assert load_manifest(str(manifest_file)) == empty_manifest()
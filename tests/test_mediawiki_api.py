@@ -0,0 +1,61 @@
+import json
+
+from benchmarks.stub_wiki import start_stub_server
+from src.mediawiki_api import fetch_api_json, fetch_revisions, get_api_url, iter_api_pages
+from src.unit_data_scraper import extract_page_units, iter_units_pages, scrape_units_data
+from src.utils import set_rate_limiter, set_response_cache
+
+TARGET_GAME = "Age of Empires III"
+
+
+def stub_wiki(**options):
+    server, base_url, stats = start_stub_server(**options)
+    set_response_cache(None)
+    set_rate_limiter(None)
+    return server, base_url, stats
+
+
+def stop(server):
+    server.shutdown()
+    server.server_close()
+
+
+def test_api_and_html_backends_give_the_same_units(tmp_path):
+    server, base_url, stats = stub_wiki()
+    try:
+        scrape_units_data(base_url, str(tmp_path / "html.json"), fetch_backend="html")
+        scrape_units_data(base_url, str(tmp_path / "api.json"), fetch_backend="api")
+    finally:
+        stop(server)
+
+    html_units = json.loads((tmp_path / "html.json").read_text())
+    assert html_units and json.loads((tmp_path / "api.json").read_text()) == html_units
+
+
+def test_redirects_resolve_to_the_requested_titles():
+    server, base_url, stats = stub_wiki()
+    api_url = get_api_url(base_url)
+    urls = [base_url + "wiki/Musketeers", base_url + "wiki/Hussar"]
+    try:
+        revisions = fetch_revisions(api_url, ["Musketeers", "Musketeer", "Hussar", "Missing"])
+        api_pages = list(iter_api_pages(base_url, urls))
+        html_pages = list(iter_units_pages(urls))
+    finally:
+        stop(server)
+
+    assert revisions == {"Musketeers": 1001, "Musketeer": 1001, "Hussar": revisions["Hussar"]}
+    assert [url for url, _ in api_pages] == urls
+    for (url, api_html), (_, page_html) in zip(api_pages, html_pages):
+        api_units = extract_page_units(url, api_html, TARGET_GAME)
+        assert api_units and api_units == extract_page_units(url, page_html, TARGET_GAME)
+
+
+def test_invalid_json_is_a_fetch_failure():
+    # The first responses are plain text bodies with a 200 status (e.g. a proxy error page)
+    server, base_url, stats = stub_wiki(fail_first=[200, 200])
+    api_url = get_api_url(base_url)
+    try:
+        assert fetch_api_json(api_url + "?action=query&format=json") is None
+        assert list(iter_api_pages(base_url, [base_url + "wiki/Hussar"])) == [(base_url + "wiki/Hussar", None)]
+    finally:
+        stop(server)
@@ -0,0 +1,46 @@
+import threading
+
+from benchmarks.stub_wiki import start_stub_server
+from src.memory_budget import DEFAULT_PAGE_ESTIMATE, ByteBudget
+from src.utils import iter_pages_content, set_rate_limiter, set_response_cache
+
+
+def test_pages_are_reserved_before_their_download():
+    budget = ByteBudget(100)
+
+    # The first reservation is the default estimate, within the budget
+    assert budget.reserve(0) == min(DEFAULT_PAGE_ESTIMATE, 100)
+    budget.adjust(100, 40)
+    assert budget.in_flight == 40 and budget.estimate() == 40
+
+    assert budget.reserve(1) == 40
+    assert budget.in_flight == 80
+
+    # The third page does not fit until the consumer is done with the first one
+    admitted = threading.Event()
+    waiting = threading.Thread(target=lambda: (budget.reserve(2), admitted.set()))
+    waiting.start()
+    assert not admitted.wait(0.2)
+    budget.release(40)
+    assert admitted.wait(2)
+    waiting.join()
+    assert budget.in_flight == 80
+
+
+def test_sequential_fetch_uses_the_budget():
+    server, base_url, stats = start_stub_server()
+    set_response_cache(None)
+    set_rate_limiter(None)
+    urls = [base_url + "wiki/Musketeer", base_url + "wiki/Hussar"]
+    budget = ByteBudget(1)
+    try:
+        pages = list(iter_pages_content(urls, max_workers=1, byte_budget=budget))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [url for url, _ in pages] == urls
+    assert all(content for _, content in pages)
+    # One page in flight at a time, and nothing left once consumed
+    assert budget.peak_in_flight == max(len(content) for _, content in pages)
+    assert budget.in_flight == 0
@@ -0,0 +1,61 @@
+import pytest
+
+from benchmarks.stub_wiki import start_stub_server
+from src import metrics
+from src.metrics import MetricsRegistry
+from src.unit_data_scraper import get_units_urls
+from src.utils import fetch_page_content, set_rate_limiter, set_response_cache
+
+
+def parse_families(text) -> dict:
+    """Family name -> (type, sample names), failing on samples outside the family of the last # TYPE line."""
+    families = {}
+    family = None
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, family, metric_type = line.split()
+            assert family not in families
+            families[family] = (metric_type, [])
+            continue
+        sample = line.split("{")[0].split()[0]
+        metric_type = families[family][0]
+        allowed = {family} if metric_type != "summary" else {family + "_count", family + "_sum"}
+        assert sample in allowed, f"{sample} in the {metric_type} family {family}"
+        families[family][1].append(sample)
+    return families
+
+
+def test_summary_max_is_a_gauge_family():
+    registry = MetricsRegistry()
+    registry.observe("fetch_seconds", 0.5, host="a")
+    registry.observe("fetch_seconds", 1.5, host="b")
+    registry.inc("fetch_requests_total", host="a", status="200")
+
+    families = parse_families(registry.to_prometheus())
+
+    assert families["aoe3de_fetch_seconds"][0] == "summary"
+    assert families["aoe3de_fetch_seconds_max"] == ("gauge", ["aoe3de_fetch_seconds_max"] * 2)
+    assert families["aoe3de_fetch_requests_total"][0] == "counter"
+    assert 'aoe3de_fetch_seconds_max{host="b"} 1.5' in registry.to_prometheus()
+
+
+def test_errors_are_labelled_by_kind():
+    server, base_url, stats = start_stub_server()
+    set_response_cache(None)
+    set_rate_limiter(None, max_retries=0)
+    try:
+        with metrics.use_registry(MetricsRegistry()) as registry:
+            assert fetch_page_content(base_url + "wiki/Missing") is None
+            get_units_urls(base_url)
+    finally:
+        set_rate_limiter(None)
+        server.shutdown()
+        server.server_close()
+
+    assert registry.counters[("errors_total", (("error", "HTTPError"), ("kind", "http"), ("stage", "fetch")))] == 1
+    assert registry.errors[0]["kind"] == "http"
+    # The unit list is parsed once
+    assert registry.summary("unit_list_parse_seconds")[0] == 1
+
+    with pytest.raises(ValueError):
+        registry.record_error("fetch", "unknown", "Error")
@@ -0,0 +1,52 @@
+import json
+
+from benchmarks.stub_wiki import start_stub_server
+from src.ndjson_writer import CheckpointedWriter, read_ndjson
+from src.unit_data_scraper import get_units_urls, scrape_units_data
+from src.utils import set_rate_limiter, set_response_cache
+
+URL = "https://ageofempires.fandom.com/wiki/"
+
+
+def test_lines_after_the_last_checkpoint_are_discarded_on_resume(tmp_path):
+    stream_file = str(tmp_path / "units.ndjson")
+    writer = CheckpointedWriter(stream_file, checkpoint_every=2)
+    writer.write_page(URL + "Musketeer", [{"name": "Musketeer"}, {"name": "Musketeer"}])
+    writer.write_page(URL + "Hussar", [{"name": "Hussar"}])
+    # Crash before the next checkpoint: the page is in the file but not in the checkpoint
+    writer.write_page(URL + "Falconet", [{"name": "Falconet"}])
+    writer._file.flush()
+
+    with CheckpointedWriter(stream_file, resume=True) as resumed:
+        assert resumed.done_urls == {URL + "Musketeer", URL + "Hussar"}
+        assert resumed.units_written == 3
+        resumed.write_page(URL + "Falconet", [{"name": "Falconet"}])
+
+    assert [record["name"] for record in read_ndjson(stream_file)] == ["Musketeer", "Musketeer", "Hussar", "Falconet"]
+
+
+def test_resumed_scrape_skips_the_done_pages(tmp_path):
+    server, base_url, stats = start_stub_server()
+    set_response_cache(None)
+    set_rate_limiter(None)
+    stream_file = str(tmp_path / "units.ndjson")
+    output_file = tmp_path / "units.json"
+    try:
+        scrape_units_data(base_url, str(output_file), stream_file=stream_file)
+        expected = json.loads(output_file.read_text())
+
+        # Run interrupted after the first page
+        first_url = get_units_urls(base_url)[0]
+        first_records = [record for record in expected if record["name"] == "Musketeer"]
+        with CheckpointedWriter(stream_file) as writer:
+            writer.write_page(first_url, first_records)
+
+        requests_before = stats["requests"]
+        scrape_units_data(base_url, str(output_file), stream_file=stream_file, resume=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert json.loads(output_file.read_text()) == expected
+    # Unit list and the three pages left
+    assert stats["requests"] - requests_before == 1 + 3
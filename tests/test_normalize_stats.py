@@ -0,0 +1,77 @@
+from src.normalize_stats import normalize_stats, typed_stats
+
+
+def parsed(raw, label="Hit points"):
+    """(value, kind, target) of every part of a single stat cell."""
+    values, unparseable = normalize_stats([{"name": "Hussar", "Statistics": {label: raw}}])
+    assert unparseable.empty
+    return [
+        (row.value, row.kind, row.target if isinstance(row.target, str) else None)
+        for row in values.itertuples(index=False)
+    ]
+
+
+def test_thousands_separator_is_not_a_part_separator():
+    assert parsed("1,000") == [(1000.0, "number", None)]
+    assert parsed("1,234,567") == [(1234567.0, "number", None)]
+    # With a space, the comma separates two values
+    assert parsed("1, 000") == [(1.0, "number", None), (0.0, "number", None)]
+
+
+def test_numbers_with_a_unit():
+    assert parsed("4.5") == [(4.5, "number", None)]
+    assert parsed(".5") == [(0.5, "number", None)]
+    assert parsed("-5") == [(-5.0, "number", None)]
+    assert parsed("20%") == [(20.0, "percent", None)]
+    assert parsed("3 seconds") == [(3.0, "seconds", None)]
+    assert parsed("1 second") == [(1.0, "seconds", None)]
+
+
+def test_multipliers_against_targets():
+    assert parsed("1.5x vs cavalry", "Bonus damage") == [(1.5, "multiplier", "cavalry")]
+    assert parsed("3× vs. light infantry; 2X vs artillery", "Bonus damage") == [
+        (3.0, "multiplier", "light infantry"),
+        (2.0, "multiplier", "artillery"),
+    ]
+
+
+def test_unparseable_cells_keep_their_unit():
+    units = [
+        {"name": "Musketeer", "Statistics": {"Range": "12-22", "Hit points": "150"}},
+        {"name": "Hussar", "Statistics": {"Train limit": "1,00", "Speed": "varies, 4"}},
+    ]
+    values, unparseable = normalize_stats(units)
+
+    assert unparseable[["name", "field", "raw"]].values.tolist() == [
+        ["Musketeer", "Statistics / Range", "12-22"],
+        ["Hussar", "Statistics / Train limit", "1,00"],
+        ["Hussar", "Statistics / Speed", "varies, 4"],
+    ]
+    # The parts that could be parsed are kept
+    assert values[["name", "field", "value"]].values.tolist() == [
+        ["Musketeer", "Statistics / Hit points", 150.0],
+        ["Hussar", "Statistics / Speed", 4.0],
+    ]
+
+
+def test_typed_stats_keep_single_values_only():
+    units = [
+        {
+            "name": "Hussar",
+            "Statistics": {"Hit points": "300", "Bonus damage": "1.5x vs cavalry", "Kill XP": "10; 20"},
+            "Training": {"Cost": {"Food": "100", "Coin": "1,200"}, "Train time": {"seconds": "27"}},
+        }
+    ]
+    values, _ = normalize_stats(units)
+
+    assert values.loc[values["field"] == "Training / Train time / seconds", "kind"].tolist() == ["seconds"]
+    table = typed_stats(values)
+    assert table.columns.tolist() == [
+        "unit_id",
+        "name",
+        "Statistics / Hit points",
+        "Training / Cost / Coin",
+        "Training / Cost / Food",
+        "Training / Train time / seconds",
+    ]
+    assert table.iloc[0].tolist() == [1, "Hussar", 300.0, 1200.0, 100.0, 27.0]
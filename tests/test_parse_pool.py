@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from src.incremental import empty_manifest, page_fingerprint
+from src.unit_data_scraper import iter_units_records
+
+FIXTURES_PATH = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+BASE_URL = "https://ageofempires.fandom.com/wiki/"
+TARGET_GAME = "Age of Empires III"
+
+
+def unit_pages():
+    paths = sorted(path for path in FIXTURES_PATH.glob("*.html") if path.stem != "unit_list")
+    # The last page could not be fetched
+    return [(BASE_URL + path.stem.title(), path.read_text()) for path in paths] + [(BASE_URL + "Missing", None)]
+
+
+def test_process_pool_gives_the_records_of_the_sequential_parse():
+    sequential = list(iter_units_records(unit_pages(), TARGET_GAME))
+    pooled = list(iter_units_records(unit_pages(), TARGET_GAME, parse_processes=2))
+
+    # Same records, in the order of the pages
+    assert pooled == sequential
+    assert [url for url, *_ in pooled] == [url for url, _ in unit_pages()]
+    assert all(records for _, _, records, _, _ in pooled[:-1])
+    assert pooled[-1][2] is None
+
+
+def test_unchanged_pages_are_not_sent_to_the_pool():
+    pages = unit_pages()[:2]
+    manifest = empty_manifest()
+    url, html = pages[0]
+    manifest["pages"][url] = {"fingerprint": page_fingerprint(html), "records": [{"name": "Cached"}]}
+
+    records = list(iter_units_records(pages, TARGET_GAME, manifest=manifest, parse_processes=2))
+
+    assert records[0][2:4] == ([{"name": "Cached"}], True)
+    assert records[1][3] is False and records[1][2][0]["name"] != "Cached"
@@ -0,0 +1,81 @@
+import gzip
+import http.client
+import json
+import threading
+
+import pytest
+
+from config.settings import settings
+from src.read_api import UnitsApiServer
+
+
+@pytest.fixture
+def api(tmp_path):
+    units = [
+        {"name": "Musketeer", "Information": {"Civilization(s)": ["British"]}, "Notes": "x" * 2000},
+        {"name": "Hussar", "Information": {"Civilization(s)": ["British"]}},
+        {"name": "Musketeer", "Information": {"Civilization(s)": ["Swedes"]}},
+    ]
+    units_file = tmp_path / "units.json"
+    units_file.write_text(json.dumps(units))
+
+    server = UnitsApiServer(("127.0.0.1", 0), str(units_file), reload_interval=None)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+    yield connection
+    connection.close()
+    server.shutdown()
+    server.server_close()
+
+
+def request(connection, method, path, body=None, headers=None):
+    connection.request(method, path, body=body, headers=headers or {})
+    response = connection.getresponse()
+    return response, response.read()
+
+
+def test_admin_routes_are_off_by_default(api):
+    response, body = request(api, "POST", "/admin/reload")
+    assert response.status == 404
+
+
+def test_post_body_does_not_break_keep_alive(api, monkeypatch):
+    monkeypatch.setattr(settings, "SHOW_ADMIN_ROUTES", True)
+    response, body = request(api, "POST", "/admin/reload", body=b'{"force": true}')
+    assert response.status == 200 and json.loads(body)["reloaded"] is True
+
+    # Same connection: the body of the POST is not read as the next request
+    response, body = request(api, "GET", "/")
+    assert response.status == 200 and json.loads(body)["units"] == 3
+
+
+def test_unit_route_returns_every_unit_of_the_name(api):
+    response, body = request(api, "GET", "/units/musketeer")
+
+    units = json.loads(body)
+    assert [unit["Information"]["Civilization(s)"] for unit in units] == [["British"], ["Swedes"]]
+
+
+def test_not_modified_has_the_etag_of_the_negotiated_encoding(api):
+    headers = {"Accept-Encoding": "gzip"}
+    response, body = request(api, "GET", "/units/musketeer", headers=headers)
+    etag = response.getheader("ETag")
+    assert response.getheader("Content-Encoding") == "gzip" and json.loads(gzip.decompress(body))
+
+    response, body = request(api, "GET", "/units/musketeer", headers={**headers, "If-None-Match": etag})
+    assert response.status == 304 and body == b""
+    assert response.getheader("ETag") == etag
+    assert response.getheader("Vary") == "Accept-Encoding"
+
+
+def test_failed_reload_keeps_the_previous_units(tmp_path):
+    units_file = tmp_path / "units.json"
+    units_file.write_text(json.dumps([{"name": "Hussar", "Information": {}}]))
+    server = UnitsApiServer(("127.0.0.1", 0), str(units_file), reload_interval=None)
+    try:
+        # A record without a name fails while the store is built
+        units_file.write_text(json.dumps([{"Information": {}}]))
+        assert server.reload(force=True) is False
+        assert len(server.snapshot.store) == 1
+    finally:
+        server.server_close()
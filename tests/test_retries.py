@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from benchmarks.stub_wiki import start_stub_server
+from src import rate_limit
+from src.rate_limit import AdaptiveRateLimiter, parse_retry_after
+from src.utils import (
+    clear_fetch_failures,
+    fetch_page_content,
+    get_fetch_failures,
+    get_session,
+    set_rate_limiter,
+    set_response_cache,
+)
+
+PAGE = "wiki/Musketeer"
+
+
+@pytest.fixture
+def fetch_layer():
+    set_response_cache(None)
+    clear_fetch_failures()
+    yield
+    set_rate_limiter(None)
+    clear_fetch_failures()
+
+
+@pytest.fixture
+def stub_wiki(request):
+    server, base_url, stats = start_stub_server(**request.param)
+    yield base_url, stats
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("stub_wiki", [{"fail_first": [429, 503], "retry_after": 0}], indirect=True)
+def test_throttled_requests_are_retried(fetch_layer, stub_wiki):
+    base_url, stats = stub_wiki
+    limiter = AdaptiveRateLimiter(rate=50)
+    set_rate_limiter(limiter, max_retries=3)
+
+    page_html = fetch_page_content(base_url + PAGE, get_session())
+
+    assert page_html is not None and "Musketeer" in page_html
+    assert stats["requests"] == 3
+    assert limiter.throttled == 2
+    assert limiter.rate < 50
+    assert get_fetch_failures() == {}
+
+
+@pytest.mark.parametrize("stub_wiki", [{"fail_first": [503] * 5, "retry_after": 0}], indirect=True)
+def test_page_fails_once_the_retries_are_exhausted(fetch_layer, stub_wiki):
+    base_url, stats = stub_wiki
+    set_rate_limiter(None, max_retries=2)
+
+    assert fetch_page_content(base_url + PAGE, get_session()) is None
+    assert stats["requests"] == 3
+    assert get_fetch_failures()[base_url + PAGE] == "HTTP 503 after 3 attempts"
+
+
+@pytest.mark.parametrize("stub_wiki", [{"fail_first": [429], "retry_after": 3600}], indirect=True)
+def test_long_retry_after_is_clamped(fetch_layer, stub_wiki, monkeypatch):
+    base_url, stats = stub_wiki
+    monkeypatch.setattr(rate_limit, "MAX_RETRY_AFTER", 0.2)
+    limiter = AdaptiveRateLimiter(rate=50)
+    set_rate_limiter(limiter, max_retries=1)
+
+    start_time = time.monotonic()
+    page_html = fetch_page_content(base_url + PAGE, get_session())
+
+    assert page_html is not None
+    assert time.monotonic() - start_time < 5
+    assert stats["requests"] == 2
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after(str(10 * 3600)) == rate_limit.MAX_RETRY_AFTER
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
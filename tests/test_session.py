@@ -0,0 +1,13 @@
+from src.utils import get_session
+
+
+def test_session_pool_grows_with_the_workers():
+    session = get_session(2)
+    assert get_session(32) is session
+
+    adapter = session.get_adapter("https://ageofempires.fandom.com/")
+    assert adapter._pool_maxsize == 32
+
+    # A smaller request keeps the larger pool
+    get_session(4)
+    assert session.get_adapter("https://ageofempires.fandom.com/")._pool_maxsize == 32
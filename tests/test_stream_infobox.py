@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+from src.scrap_infobox import extract_unit_data
+from src.stream_infobox import iter_infobox_fragments, stream_infoboxes
+from src.unit_data_scraper import extract_page_units, parse_infoboxes
+
+FIXTURES_PATH = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+UNIT_PAGES = sorted(path for path in FIXTURES_PATH.glob("*.html") if path.stem != "unit_list")
+TARGET_GAME = "Age of Empires III"
+
+
+@pytest.mark.parametrize("path", UNIT_PAGES, ids=lambda path: path.stem)
+def test_streaming_gives_the_units_and_icons_of_the_full_tree(path):
+    page_html = path.read_text()
+    tree_icons, stream_icons = [], []
+
+    tree_units = extract_page_units(path.name, page_html, TARGET_GAME, icons=tree_icons)
+    stream_units = extract_page_units(path.name, page_html, TARGET_GAME, streaming=True, icons=stream_icons)
+
+    assert tree_units and stream_units == tree_units
+    assert stream_icons == tree_icons
+
+
+def test_tags_split_across_chunks():
+    page_html = UNIT_PAGES[0].read_text()
+    # Chunks much smaller than a tag, as `iter_content` can give them
+    chunks = (page_html[i:i + 7] for i in range(0, len(page_html), 7))
+
+    assert list(iter_infobox_fragments(chunks)) == list(iter_infobox_fragments(page_html))
+
+
+def test_only_the_infoboxes_of_the_target_game_are_kept():
+    infobox = (
+        '<aside class="portable-infobox"><div class="pi-data-value">{game}</div><h2>Unit</h2>'
+        '<section><h2>Information</h2><div class="pi-item pi-data"><h3>Hit points</h3>'
+        '<div class="pi-data-value">{hp}&amp;more</div></div></section></aside>'
+    )
+    page_html = (
+        "<html><body><script>var html = '<aside class=\"portable-infobox\">';</script>"
+        '<aside class="related"><p>Not an infobox</p></aside>'
+        + infobox.format(game="Age of Empires II", hp=60)
+        + infobox.format(game="Age of Empires III", hp=160)
+        + "</body></html>"
+    )
+
+    stream_units = [extract_unit_data(infobox) for infobox in stream_infoboxes(page_html, TARGET_GAME)]
+    tree_units = [extract_unit_data(infobox) for infobox in parse_infoboxes(page_html, TARGET_GAME)]
+
+    assert stream_units == tree_units
+    assert [unit["Information"]["Hit points"] for unit in stream_units] == ["160&more"]
@@ -0,0 +1,34 @@
+import json
+
+from src.unit_store import UnitStore
+
+UNITS = [
+    {
+        "name": "Musketeer",
+        "Information": {"Civilization(s)": ["British", "Swedes"], "Type": ["Infantry", "Gunpowder"]},
+        "Training": {"Age": ["Colonial Age"], "Trained at": ["Barracks"]},
+    },
+    {
+        "name": "Hussar",
+        "Information": {"Civilization(s)": ["British"], "Type": ["Cavalry"]},
+        "Training": {"Age": ["Fortress Age"], "Trained at": ["Stable"]},
+    },
+    {
+        "name": "Musketeer",
+        "Information": {"Civilization(s)": ["Germans"], "Type": ["Infantry"]},
+        "Training": {"Age": "Colonial Age", "Trained at": ["Barracks"]},
+    },
+]
+
+
+def test_queries_intersect_the_indexes(tmp_path):
+    units_file = tmp_path / "units.json"
+    units_file.write_text(json.dumps(UNITS))
+
+    store = UnitStore.load(str(units_file))
+
+    assert len(store.get("musketeer")) == 2
+    assert store.query(civilization="British", age="II", trained_at="Barracks") == [UNITS[0]]
+    assert store.query_positions(unit_type="infantry", age="Colonial") == [0, 2]
+    assert store.query(civilization="British", unit_type="Infantry", name="Hussar") == []
+    assert store.values("age") == ["colonial_age", "fortress_age"]
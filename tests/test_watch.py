@@ -0,0 +1,71 @@
+import time
+
+from benchmarks.stub_wiki import edit_page, start_stub_server
+from src import watch
+from src.incremental import load_manifest
+from src.unit_data_scraper import scrape_units_data
+from src.utils import fetch_page_content, set_rate_limiter, set_response_cache
+from src.watch import poll_changes, utc_timestamp
+
+OLD_HIT_POINTS = 'pi-font">300</div>'
+NEW_HIT_POINTS = 'pi-font">320</div>'
+
+
+def watched_stub(tmp_path):
+    """Stub wiki and the manifest of a first scrape of it."""
+    server, base_url, stats = start_stub_server()
+    set_response_cache(None)
+    set_rate_limiter(None)
+    manifest_file = str(tmp_path / "manifest.json")
+    scrape_units_data(base_url, str(tmp_path / "units.json"), manifest_file=manifest_file)
+    return server, base_url, load_manifest(manifest_file)
+
+
+def test_failed_fetch_is_polled_again(tmp_path, monkeypatch):
+    server, base_url, manifest = watched_stub(tmp_path)
+    hussar_url = base_url + "wiki/Hussar"
+    try:
+        since = utc_timestamp()
+        edit = edit_page(server, "Hussar", OLD_HIT_POINTS, NEW_HIT_POINTS)
+        # A later edit of another page, the feed has one-second timestamps
+        time.sleep(1.1)
+        edit_page(server, "Musketeer", "</html>", "</html>")
+
+        # The feed is read, the page of the first edit is not
+        monkeypatch.setattr(
+            watch, "fetch_page_content", lambda url: None if url == hussar_url else fetch_page_content(url)
+        )
+        log_entries, refreshed, next_since = poll_changes(base_url, manifest, since)
+        assert log_entries == [] and refreshed == 1
+        assert next_since == edit["timestamp"]
+
+        monkeypatch.setattr(watch, "fetch_page_content", fetch_page_content)
+        log_entries, refreshed, next_since = poll_changes(base_url, manifest, next_since)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert refreshed == 1
+    assert [(entry["unit"], entry["revid"]) for entry in log_entries] == [("Hussar", edit["revid"])]
+    assert log_entries[0]["fields"]["Statistics / Hit points"] == {"old": "300", "new": "320"}
+    assert manifest["pages"][hussar_url]["fingerprint"] == f"rev:{edit['revid']}"
+
+
+def test_page_older_than_the_edit_is_polled_again(tmp_path, monkeypatch):
+    server, base_url, manifest = watched_stub(tmp_path)
+    hussar_url = base_url + "wiki/Hussar"
+    try:
+        old_page = fetch_page_content(hussar_url)
+        since = utc_timestamp()
+        edit = edit_page(server, "Hussar", OLD_HIT_POINTS, NEW_HIT_POINTS)
+
+        # A cached copy of the page from before the edit
+        monkeypatch.setattr(watch, "fetch_page_content", lambda url: old_page)
+        log_entries, refreshed, next_since = poll_changes(base_url, manifest, since)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert log_entries == [] and refreshed == 0
+    assert next_since == edit["timestamp"]
+    assert manifest["pages"][hussar_url]["fingerprint"] != f"rev:{edit['revid']}"